@@ -1,14 +1,40 @@
+import argparse
 import pygame
-import random
 import sys
+import time
+from collections import deque
 from typing import List, Tuple, Optional
 
+from minesweeper_engine import Board, DIFFICULTIES
+
+# Свое поле по умолчанию: (строки, столбцы, мины)
+CUSTOM_DEFAULT = (100, 100, 1500)
+# Размер клетки при масштабировании; свое поле без прокрутки не мельче CUSTOM_FIT_CELL_SIZE
+MIN_CELL_SIZE, MAX_CELL_SIZE = 4, 50
+CUSTOM_FIT_CELL_SIZE = 12
+
+
+def parse_board_size(text: str) -> Tuple[int, int, int]:
+    """Разбор размера своего поля вида 500x500x25000 (строки x столбцы x мины)"""
+    try:
+        rows, cols, mines = (int(part) for part in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROWSxCOLSxMINES, got {text!r}")
+    # Первый клик открывает квадрат 3x3, на маленьком поле - сколько поместится
+    safe_zone = min(rows, 3) * min(cols, 3)
+    if rows < 1 or cols < 1 or not 0 <= mines <= rows * cols - safe_zone:
+        raise argparse.ArgumentTypeError(f"cannot fit {mines} mines on a {rows}x{cols} board")
+    return rows, cols, mines
+
 class Minesweeper:
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, custom: Optional[Tuple[int, int, int]] = None):
         pygame.init()
+        pygame.key.set_repeat(250, 30)  # Прокрутка стрелками при удержании
         
         # Настройки по умолчанию
-        self.difficulty = "medium"
+        self.seed = seed  # None - случайная расстановка мин в каждой игре
+        self.custom_size = custom or CUSTOM_DEFAULT
+        self.difficulty = "custom" if custom else "medium"
         self.set_difficulty(self.difficulty)
         
         # Получаем размеры экрана после установки сложности
@@ -44,6 +70,20 @@ class Minesweeper:
         self.title_font = pygame.font.SysFont('Arial', 48, bold=True)
         self.font = pygame.font.SysFont('Arial', 24)
         self.small_font = pygame.font.SysFont('Arial', 18)
+        self.message_font = pygame.font.SysFont('Arial', 32, bold=True)
+        
+        # Кэш отрисовки: поле на отдельной поверхности, на экран - только изменения
+        self.MAX_DIRTY_RECTS = 64
+        self.board_surface = None
+        self.dirty_cells: List[Tuple[int, int]] = []
+        self._drawn_engine = None
+        self._drawn_state = None
+        self._status_key = None
+        self.labels = {}  # (текст, шрифт, цвет) -> поверхность
+        
+        # Время отрисовки последних кадров, F3 - показать на экране
+        self.frame_times = deque(maxlen=120)
+        self.show_frame_stats = False
         
         # Состояния игры
         self.state = "menu"  # menu, game, game_over, game_won
@@ -52,29 +92,27 @@ class Minesweeper:
     def set_difficulty(self, difficulty):
         """Установка уровня сложности"""
         self.difficulty = difficulty
-        if difficulty == "easy":
-            self.rows, self.cols, self.mines_count = 9, 9, 10
-        elif difficulty == "medium":
-            self.rows, self.cols, self.mines_count = 16, 16, 40
-        elif difficulty == "hard":
-            self.rows, self.cols, self.mines_count = 16, 30, 99
+        if difficulty in DIFFICULTIES:
+            self.rows, self.cols, self.mines_count = DIFFICULTIES[difficulty]
+        elif difficulty == "custom":
+            self.rows, self.cols, self.mines_count = self.custom_size
         
         # Автоподбор размера клетки для полного экрана
         # Получаем размеры экрана
         screen_info = pygame.display.Info()
         screen_width = screen_info.current_w
         screen_height = screen_info.current_h
+        self.screen_width, self.screen_height = screen_width, screen_height
         
         max_cell_width = (screen_width - 100) // self.cols
         max_cell_height = (screen_height - 150) // self.rows
-        self.cell_size = min(max_cell_width, max_cell_height, 50)  # Максимум 50px
-        self.cell_size = max(self.cell_size, 20)  # Минимум 20px
+        self.cell_size = min(max_cell_width, max_cell_height, MAX_CELL_SIZE)  # Максимум 50px
+        # Минимум 20px; большое свое поле не помещается целиком - тогда прокрутка
+        self.cell_size = max(self.cell_size, CUSTOM_FIT_CELL_SIZE if difficulty == "custom" else 20)
         
-        # Центрирование игрового поля
-        self.field_width = self.cols * self.cell_size
-        self.field_height = self.rows * self.cell_size
-        self.field_x = (screen_width - self.field_width) // 2
-        self.field_y = (screen_height - self.field_height) // 2 + 20
+        # Видимая часть поля начинается с левого верхнего угла
+        self.view_row = self.view_col = 0
+        self.layout_field()
         
         # Обновляем размеры окна
         if hasattr(self, 'screen'):
@@ -82,102 +120,54 @@ class Minesweeper:
             self.height = screen_height
             self.screen = pygame.display.set_mode((self.width, self.height), pygame.FULLSCREEN)
     
-    # Остальные методы остаются без изменений...
-    def reset_game(self):
-        """Сброс игры к начальному состоянию"""
-        self.board = [[0 for _ in range(self.cols)] for _ in range(self.rows)]
-        self.revealed = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        self.flagged = [[False for _ in range(self.cols)] for _ in range(self.rows)]
-        self.mines = set()
-        self.game_over = False
-        self.game_won = False
-        self.first_click = True
-        self.mines_remaining = self.mines_count
-        self.start_time = None
-        self.elapsed_time = 0
-        self.exploded_mine = None  # Координаты взорвавшейся мины
-        
-    def place_mines(self, exclude_row: int, exclude_col: int):
-        """Размещение мин на поле, исключая клетку первого клика"""
-        mines_placed = 0
-        while mines_placed < self.mines_count:
-            row = random.randint(0, self.rows - 1)
-            col = random.randint(0, self.cols - 1)
-            
-            # Не ставим мину в клетку первого клика и вокруг нее
-            if (row == exclude_row and col == exclude_col) or \
-               (abs(row - exclude_row) <= 1 and abs(col - exclude_col) <= 1):
-                continue
-                
-            if (row, col) not in self.mines:
-                self.mines.add((row, col))
-                self.board[row][col] = -1  # -1 означает мину
-                mines_placed += 1
-                
-        # Подсчет чисел для всех клеток
-        for row in range(self.rows):
-            for col in range(self.cols):
-                if self.board[row][col] != -1:
-                    self.board[row][col] = self.count_adjacent_mines(row, col)
+    def layout_field(self):
+        """Размер видимой части поля (viewport) для текущего cell_size и ее центрирование"""
+        size = self.cell_size
+        self.tiles = None  # Изображения клеток зависят от cell_size
+        self.visible_cols = min(self.cols, max((self.screen_width - 100) // size, 1))
+        self.visible_rows = min(self.rows, max((self.screen_height - 150) // size, 1))
+        
+        # Центрирование игрового поля
+        self.field_width = self.visible_cols * size
+        self.field_height = self.visible_rows * size
+        self.field_x = (self.screen_width - self.field_width) // 2
+        self.field_y = (self.screen_height - self.field_height) // 2 + 20
+        self.scroll_to(self.view_row, self.view_col)
     
-    def count_adjacent_mines(self, row: int, col: int) -> int:
-        """Подсчет мин в соседних клетках"""
-        count = 0
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                    
-                r, c = row + dr, col + dc
-                if 0 <= r < self.rows and 0 <= c < self.cols:
-                    if (r, c) in self.mines:
-                        count += 1
-        return count
+    def scroll_to(self, row: int, col: int):
+        """Сдвиг видимой части так, чтобы клетка (row, col) была в левом верхнем углу"""
+        row = max(0, min(row, self.rows - self.visible_rows))
+        col = max(0, min(col, self.cols - self.visible_cols))
+        if (row, col) != (self.view_row, self.view_col):
+            self.view_row, self.view_col = row, col
+            self._drawn_state = None  # В кэше только видимая часть - перерисовка
     
-    def reveal_cell(self, row: int, col: int):
-        """Открытие клетки и рекурсивное открытие пустых областей"""
-        if not (0 <= row < self.rows and 0 <= col < self.cols):
+    def zoom(self, direction: int, anchor: Optional[Tuple[int, int]] = None):
+        """Масштаб: direction > 0 - крупнее; клетка под anchor остается на месте"""
+        step = max(1, self.cell_size // 8)
+        size = max(MIN_CELL_SIZE, min(self.cell_size + step * direction, MAX_CELL_SIZE))
+        if size == self.cell_size:
             return
-            
-        if self.revealed[row][col] or self.flagged[row][col]:
-            return
-            
-        self.revealed[row][col] = True
         
-        # Если открыли мину - игра окончена
-        if (row, col) in self.mines:
-            self.game_over = True
-            self.exploded_mine = (row, col)
-            self.state = "game_over"
-            return
-            
-        # Рекурсивно открываем соседние клетки если текущая пустая
-        if self.board[row][col] == 0:
-            for dr in [-1, 0, 1]:
-                for dc in [-1, 0, 1]:
-                    self.reveal_cell(row + dr, col + dc)
-    
-    def toggle_flag(self, row: int, col: int):
-        """Установка или снятие флажка"""
-        if not self.revealed[row][col] and not self.game_over and not self.game_won:
-            self.flagged[row][col] = not self.flagged[row][col]
-            if self.flagged[row][col]:
-                self.mines_remaining -= 1
-            else:
-                self.mines_remaining += 1
+        x, y = anchor or (self.field_x + self.field_width // 2, self.field_y + self.field_height // 2)
+        row = self.view_row + (y - self.field_y) / self.cell_size
+        col = self.view_col + (x - self.field_x) / self.cell_size
+        
+        self.cell_size = size
+        self.layout_field()
+        self.scroll_to(round(row - (y - self.field_y) / size), round(col - (x - self.field_x) / size))
+        self._drawn_state = None
     
-    def check_win(self) -> bool:
-        """Проверка условия победы"""
-        for row in range(self.rows):
-            for col in range(self.cols):
-                # Если есть неоткрытая клетка без мины - игра не выиграна
-                if not self.revealed[row][col] and (row, col) not in self.mines:
-                    return False
-        return True
+    def reset_game(self):
+        """Сброс игры к начальному состоянию"""
+        self.engine = Board(self.rows, self.cols, self.mines_count, self.seed)
+        self.start_time = None
+        self.elapsed_time = 0
     
     def handle_game_click(self, pos: Tuple[int, int], right_click: bool = False):
         """Обработка клика мыши в игровом режиме"""
-        if self.game_over or self.game_won:
+        engine = self.engine
+        if engine.game_over or engine.game_won:
             return
             
         x, y = pos
@@ -186,33 +176,31 @@ class Minesweeper:
         if (self.field_x <= x < self.field_x + self.field_width and 
             self.field_y <= y < self.field_y + self.field_height):
             
-            row = (y - self.field_y) // self.cell_size
-            col = (x - self.field_x) // self.cell_size
+            row = self.view_row + (y - self.field_y) // self.cell_size
+            col = self.view_col + (x - self.field_x) // self.cell_size
             
             if 0 <= row < self.rows and 0 <= col < self.cols:
                 if right_click:
-                    self.toggle_flag(row, col)
+                    if engine.toggle_flag(row, col):
+                        self.dirty_cells.append((row, col))
                 else:
-                    if self.first_click:
-                        self.first_click = False
-                        self.place_mines(row, col)
+                    if engine.first_click:
                         self.start_time = pygame.time.get_ticks()
                     
-                    if not self.flagged[row][col]:
-                        self.reveal_cell(row, col)
-                        
-                        # Проверка на выигрыш
-                        if not self.game_over and self.check_win():
-                            self.game_won = True
-                            self.state = "game_won"
-                            self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
+                    self.dirty_cells.extend(engine.click(row, col))
+                    
+                    if engine.game_over:
+                        self.state = "game_over"
+                    elif engine.game_won:
+                        self.state = "game_won"
+                        self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
     
     def draw_menu(self):
         """Отрисовка главного меню"""
         self.screen.fill(self.BG_COLOR)
         
         # Заголовок
-        title = self.title_font.render("САПЕР", True, (0, 0, 0))
+        title = self.label("САПЕР", self.title_font, (0, 0, 0))
         title_rect = title.get_rect(center=(self.width // 2, self.height // 4))
         self.screen.blit(title, title_rect)
         
@@ -224,6 +212,7 @@ class Minesweeper:
             ("ЛЕГКИЙ (9x9, 10 мин)", "easy"),
             ("СРЕДНИЙ (16x16, 40 мин)", "medium"),
             ("СЛОЖНЫЙ (16x30, 99 мин)", "hard"),
+            ("СВОЙ ({}x{}, {} мин)".format(*self.custom_size), "custom"),
             ("ВЫХОД", "exit")
         ]
         
@@ -250,13 +239,174 @@ class Minesweeper:
             pygame.draw.rect(self.screen, color, button_rect, border_radius=10)
             pygame.draw.rect(self.screen, (50, 50, 50), button_rect, 2, border_radius=10)
             
-            button_text = self.font.render(text, True, (0, 0, 0))
+            button_text = self.label(text, self.font, (0, 0, 0))
             text_rect = button_text.get_rect(center=button_rect.center)
             self.screen.blit(button_text, text_rect)
     
     def draw_game(self):
-        """Отрисовка игрового поля"""
+        """Полная отрисовка игрового экрана"""
+        # Новая партия или смена состояния (конец игры открывает мины) - поле заново
+        if self.engine is not self._drawn_engine or self.state != self._drawn_state:
+            self.rebuild_board_surface()
+        
         self.screen.fill(self.BG_COLOR)
+        self.draw_status(force=True)
+        self.screen.blit(self.board_surface, (self.field_x, self.field_y))
+        
+        # Сообщения о результате игры
+        if self.engine.game_over:
+            self.show_message("ИГРА ОКОНЧЕНА! ВЫ ПРОИГРАЛИ!", (255, 0, 0))
+        elif self.engine.game_won:
+            self.show_message(f"ПОЗДРАВЛЯЕМ! ВЫ ВЫИГРАЛИ ЗА {self.elapsed_time} СЕКУНД!", (0, 128, 0))
+        
+        self._drawn_engine = self.engine
+        self._drawn_state = self.state
+        self.dirty_cells.clear()
+    
+    def update_game(self) -> Optional[List[pygame.Rect]]:
+        """Инкрементальная отрисовка: только измененные клетки и панель статуса
+        
+        Возвращает прямоугольники для pygame.display.update или None,
+        если кадр перерисован целиком и нужен flip().
+        """
+        if self.engine is not self._drawn_engine or self.state != self._drawn_state:
+            self.draw_game()
+            return None
+        
+        # Изменений больше, чем клеток на экране: дешевле перерисовать видимую часть
+        if len(self.dirty_cells) > self.visible_rows * self.visible_cols:
+            self.draw_game()
+            return None
+        
+        rects = []
+        size = self.cell_size
+        top, left = self.view_row, self.view_col
+        bottom, right = top + self.visible_rows, left + self.visible_cols
+        for row, col in self.dirty_cells:
+            # Клетки за пределами видимой части нарисуются при прокрутке
+            if not (top <= row < bottom and left <= col < right):
+                continue
+            self.draw_cell(row, col)
+            area = pygame.Rect((col - left) * size, (row - top) * size, size, size)
+            rects.append(self.screen.blit(self.board_surface, area.move(self.field_x, self.field_y), area))
+        self.dirty_cells.clear()
+        
+        # Большая заливка: один общий прямоугольник дешевле сотен мелких
+        if len(rects) > self.MAX_DIRTY_RECTS:
+            rects = [rects[0].unionall(rects[1:])]
+        
+        status_rect = self.draw_status()
+        if status_rect:
+            rects.append(status_rect)
+        return rects
+    
+    def rebuild_board_surface(self):
+        """Отрисовка видимой части поля на кэшированную поверхность размером с viewport"""
+        if self.tiles is None:
+            self.tiles = self.build_tiles()
+        self.board_surface = pygame.Surface((self.field_width, self.field_height))
+        for row in range(self.view_row, self.view_row + self.visible_rows):
+            for col in range(self.view_col, self.view_col + self.visible_cols):
+                self.draw_cell(row, col)
+    
+    def draw_cell(self, row: int, col: int):
+        """Отрисовка одной клетки на кэшированной поверхности поля"""
+        size = self.cell_size
+        position = ((col - self.view_col) * size, (row - self.view_row) * size)
+        self.board_surface.blit(self.tiles[self.cell_tile(row, col)], position)
+    
+    def cell_tile(self, row: int, col: int):
+        """Ключ готового изображения клетки в self.tiles"""
+        engine = self.engine
+        if engine.is_revealed(row, col):
+            value = engine.cell_value(row, col)
+            if value == -1:
+                # Взорвавшаяся мина - красный фон
+                return "exploded" if (row, col) == engine.exploded_mine else "mine"
+            return value
+        
+        flagged = engine.is_flagged(row, col)
+        if engine.game_over:
+            # При проигрыше показываем все мины и неправильные флажки
+            is_mine = engine.is_mine(row, col)
+            if flagged and not is_mine:
+                return "wrong_flag"
+            if not flagged and is_mine:
+                return "hidden_mine"
+        return "flag" if flagged else "hidden"
+    
+    def build_tiles(self) -> dict:
+        """Изображения всех видов клеток для текущего cell_size
+        
+        Цифры 1-8 рендерятся шрифтом один раз, дальше каждая клетка -
+        это один blit готовой поверхности.
+        """
+        size = self.cell_size
+        center = (size // 2, size // 2)
+        
+        def tile(color, mine=False):
+            surface = pygame.Surface((size, size))
+            surface.fill(color)
+            if mine:
+                pygame.draw.circle(surface, self.MINE_COLOR, center, size // 3)
+            return surface
+        
+        def flag():
+            surface = tile(self.HIDDEN_COLOR)
+            flag_points = [
+                (size // 4, size // 4),
+                (size * 3 // 4, size // 2),
+                (size // 4, size * 3 // 4)
+            ]
+            pygame.draw.polygon(surface, self.FLAG_COLOR, flag_points)
+            return surface
+        
+        tiles = {
+            "hidden": tile(self.HIDDEN_COLOR),
+            "hidden_mine": tile(self.HIDDEN_COLOR, mine=True),
+            "mine": tile(self.REVEALED_COLOR, mine=True),
+            "exploded": tile(self.EXPLODED_MINE_COLOR, mine=True),
+            "flag": flag(),
+            "wrong_flag": flag(),
+            0: tile(self.REVEALED_COLOR),
+        }
+        # Мелкие клетки при отдалении - шрифт по размеру клетки
+        number_font = self.font if size >= 20 else pygame.font.SysFont('Arial', max(size, 6))
+        for value in range(1, 9):
+            number = tile(self.REVEALED_COLOR)
+            number_text = number_font.render(str(value), True, self.TEXT_COLORS[value])
+            number.blit(number_text, number_text.get_rect(center=center))
+            tiles[value] = number
+        
+        # Красный крестик поверх неправильного флажка
+        wrong_flag = tiles["wrong_flag"]
+        inset = 5 if size >= 20 else max(size // 5, 1)
+        pygame.draw.line(wrong_flag, self.WRONG_FLAG_COLOR, (inset, inset), (size - inset, size - inset), 2)
+        pygame.draw.line(wrong_flag, self.WRONG_FLAG_COLOR, (size - inset, inset), (inset, size - inset), 2)
+        
+        # Сетка
+        for surface in tiles.values():
+            pygame.draw.rect(surface, self.GRID_COLOR, surface.get_rect(), 1)
+        return tiles
+    
+    def label(self, text: str, font, color: Tuple[int, int, int]):
+        """Отрендеренная надпись из кэша"""
+        key = (text, font, color)
+        surface = self.labels.get(key)
+        if surface is None:
+            surface = self.labels[key] = font.render(text, True, color)
+        return surface
+    
+    def draw_status(self, force: bool = False) -> Optional[pygame.Rect]:
+        """Панель статуса; перерисовывается только при смене счетчика мин или секунд"""
+        engine = self.engine
+        if self.start_time and not engine.game_over and not engine.game_won:
+            self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
+        
+        status_key = (engine.mines_remaining, self.elapsed_time)
+        if not force and status_key == self._status_key:
+            return None
+        self._status_key = status_key
         
         # Панель статуса
         status_height = 60
@@ -266,12 +416,10 @@ class Minesweeper:
                         (self.width, status_height), 2)
         
         # Отображение оставшихся мин
-        mines_text = self.font.render(f'Мины: {self.mines_remaining}', True, (0, 0, 0))
+        mines_text = self.font.render(f'Мины: {engine.mines_remaining}', True, (0, 0, 0))
         self.screen.blit(mines_text, (50, 20))
         
         # Отображение времени
-        if self.start_time and not self.game_over and not self.game_won:
-            self.elapsed_time = (pygame.time.get_ticks() - self.start_time) // 1000
         time_text = self.font.render(f'Время: {self.elapsed_time} сек', True, (0, 0, 0))
         self.screen.blit(time_text, (self.width // 2 - 50, 20))
         
@@ -279,88 +427,14 @@ class Minesweeper:
         menu_button = pygame.Rect(self.width - 150, 15, 120, 30)
         pygame.draw.rect(self.screen, (200, 200, 200), menu_button, border_radius=5)
         pygame.draw.rect(self.screen, (100, 100, 100), menu_button, 2, border_radius=5)
-        menu_text = self.small_font.render('В МЕНЮ', True, (0, 0, 0))
+        menu_text = self.label('В МЕНЮ', self.small_font, (0, 0, 0))
         self.screen.blit(menu_text, (menu_button.x + 20, menu_button.y + 8))
         
-        # Отрисовка игрового поля
-        for row in range(self.rows):
-            for col in range(self.cols):
-                x = self.field_x + col * self.cell_size
-                y = self.field_y + row * self.cell_size
-                rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-                
-                if self.revealed[row][col]:
-                    # Открытая клетка
-                    pygame.draw.rect(self.screen, self.REVEALED_COLOR, rect)
-                    
-                    if (row, col) in self.mines:
-                        # Мина
-                        if self.game_over and (row, col) == self.exploded_mine:
-                            # Взорвавшаяся мина - красный фон
-                            pygame.draw.rect(self.screen, self.EXPLODED_MINE_COLOR, rect)
-                        
-                        mine_center = (x + self.cell_size // 2, y + self.cell_size // 2)
-                        pygame.draw.circle(self.screen, self.MINE_COLOR, mine_center, self.cell_size // 3)
-                    elif self.board[row][col] > 0:
-                        # Число
-                        number_text = self.font.render(str(self.board[row][col]), True, 
-                                                    self.TEXT_COLORS[self.board[row][col]])
-                        text_rect = number_text.get_rect(center=(x + self.cell_size // 2, 
-                                                                y + self.cell_size // 2))
-                        self.screen.blit(number_text, text_rect)
-                else:
-                    # Скрытая клетка
-                    pygame.draw.rect(self.screen, self.HIDDEN_COLOR, rect)
-                    
-                    if self.flagged[row][col]:
-                        # Флажок
-                        flag_points = [
-                            (x + self.cell_size // 4, y + self.cell_size // 4),
-                            (x + self.cell_size * 3 // 4, y + self.cell_size // 2),
-                            (x + self.cell_size // 4, y + self.cell_size * 3 // 4)
-                        ]
-                        pygame.draw.polygon(self.screen, self.FLAG_COLOR, flag_points)
-                
-                # Сетка
-                pygame.draw.rect(self.screen, self.GRID_COLOR, rect, 1)
-        
-        # Показ всех мин при проигрыше
-        if self.game_over:
-            for row, col in self.mines:
-                if not self.revealed[row][col] and not self.flagged[row][col]:
-                    x = self.field_x + col * self.cell_size
-                    y = self.field_y + row * self.cell_size
-                    rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-                    
-                    mine_center = (x + self.cell_size // 2, y + self.cell_size // 2)
-                    pygame.draw.circle(self.screen, self.MINE_COLOR, mine_center, self.cell_size // 3)
-            
-            # Показ неправильных флажков
-            for row in range(self.rows):
-                for col in range(self.cols):
-                    if self.flagged[row][col] and (row, col) not in self.mines:
-                        x = self.field_x + col * self.cell_size
-                        y = self.field_y + row * self.cell_size
-                        rect = pygame.Rect(x, y, self.cell_size, self.cell_size)
-                        
-                        # Красный крестик поверх флажка
-                        pygame.draw.line(self.screen, self.WRONG_FLAG_COLOR,
-                                        (x + 5, y + 5),
-                                        (x + self.cell_size - 5, y + self.cell_size - 5), 2)
-                        pygame.draw.line(self.screen, self.WRONG_FLAG_COLOR,
-                                        (x + self.cell_size - 5, y + 5),
-                                        (x + 5, y + self.cell_size - 5), 2)
-        
-        # Сообщения о результате игры
-        if self.game_over:
-            self.show_message("ИГРА ОКОНЧЕНА! ВЫ ПРОИГРАЛИ!", (255, 0, 0))
-        elif self.game_won:
-            self.show_message(f"ПОЗДРАВЛЯЕМ! ВЫ ВЫИГРАЛИ ЗА {self.elapsed_time} СЕКУНД!", (0, 128, 0))
+        return pygame.Rect(0, 0, self.width, status_height + 2)
     
     def show_message(self, text: str, color: Tuple[int, int, int]):
         """Показать сообщение поверх игрового поля"""
-        message_font = pygame.font.SysFont('Arial', 32, bold=True)
-        message_text = message_font.render(text, True, color)
+        message_text = self.label(text, self.message_font, color)
         text_rect = message_text.get_rect(center=(self.width // 2, 80))
         
         # Полупрозрачный фон
@@ -375,7 +449,7 @@ class Minesweeper:
         pygame.draw.rect(self.screen, (150, 150, 150), button_rect, border_radius=5)
         pygame.draw.rect(self.screen, (50, 50, 50), button_rect, 2, border_radius=5)
         
-        button_text = self.font.render("НОВАЯ ИГРА", True, (0, 0, 0))
+        button_text = self.label("НОВАЯ ИГРА", self.font, (0, 0, 0))
         button_text_rect = button_text.get_rect(center=button_rect.center)
         self.screen.blit(button_text, button_text_rect)
     
@@ -386,7 +460,7 @@ class Minesweeper:
         button_width, button_height = 200, 50
         button_margin = 20
         
-        difficulties = ["easy", "medium", "hard", "exit"]
+        difficulties = ["easy", "medium", "hard", "custom", "exit"]
         
         for i, difficulty in enumerate(difficulties):
             button_rect = pygame.Rect(
@@ -415,64 +489,158 @@ class Minesweeper:
             self.reset_game()
             self.state = "game"
     
-    def run(self):
-        """Основной игровой цикл"""
+    def render_frame(self):
+        """Отрисовка кадра в зависимости от состояния и вывод на экран"""
+        frame_start = time.perf_counter()
+        
+        if self.state == "menu":
+            self.draw_menu()
+            self._drawn_state = self.state
+            dirty_rects = None
+        else:
+            dirty_rects = self.update_game()
+        
+        if self.show_frame_stats:
+            stats_rect = self.draw_frame_stats()
+            if dirty_rects is not None:
+                dirty_rects.append(stats_rect)
+        
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
+        
+        self.frame_times.append(time.perf_counter() - frame_start)
+    
+    def draw_frame_stats(self) -> pygame.Rect:
+        """Среднее и максимальное время кадра (отрисовка + вывод) за последние кадры"""
+        times = self.frame_times
+        average = sum(times) / len(times) * 1000 if times else 0.0
+        worst = max(times) * 1000 if times else 0.0
+        
+        rect = pygame.Rect(10, self.height - 30, 340, 24)
+        pygame.draw.rect(self.screen, self.BG_COLOR, rect)
+        stats_text = self.small_font.render(f'Кадр: {average:.2f} мс, макс {worst:.2f} мс', True, (0, 0, 0))
+        self.screen.blit(stats_text, rect.topleft)
+        return rect
+    
+    def handle_event(self, event):
+        """Обработка одного события pygame"""
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                # Оверлей времени кадра; полная перерисовка стирает старый
+                self.show_frame_stats = not self.show_frame_stats
+                self._drawn_state = None
+            elif event.key == pygame.K_ESCAPE:
+                if self.state == "game":
+                    self.state = "menu"
+                else:
+                    pygame.quit()
+                    sys.exit()
+            elif self.state != "menu":
+                self.handle_view_key(event)
+        
+        elif event.type == pygame.MOUSEWHEEL and self.state != "menu":
+            # Колесо - прокрутка (с Shift - по горизонтали), с Ctrl - масштаб
+            mods = pygame.key.get_mods()
+            if mods & pygame.KMOD_CTRL:
+                self.zoom(event.y, pygame.mouse.get_pos())
+            elif mods & pygame.KMOD_SHIFT:
+                self.scroll_to(self.view_row, self.view_col - 3 * event.y)
+            else:
+                self.scroll_to(self.view_row - 3 * event.y, self.view_col + 3 * event.x)
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Левая кнопка мыши
+                if self.state == "menu":
+                    self.handle_menu_click(event.pos)
+                elif self.state == "game":
+                    # Проверка клика по кнопке меню
+                    menu_button = pygame.Rect(self.width - 150, 15, 120, 30)
+                    if menu_button.collidepoint(event.pos):
+                        self.state = "menu"
+                    else:
+                        self.handle_game_click(event.pos)
+                elif self.state in ["game_over", "game_won"]:
+                    self.handle_game_over_click(event.pos)
+                    
+            elif event.button == 3:  # Правая кнопка мыши
+                if self.state == "game":
+                    self.handle_game_click(event.pos, right_click=True)
+    
+    def handle_view_key(self, event):
+        """Стрелки - прокрутка на клетку (с Shift - на экран), +/- - масштаб"""
+        page = event.mod & pygame.KMOD_SHIFT
+        rows_step = self.visible_rows if page else 1
+        cols_step = self.visible_cols if page else 1
+        if event.key == pygame.K_UP:
+            self.scroll_to(self.view_row - rows_step, self.view_col)
+        elif event.key == pygame.K_DOWN:
+            self.scroll_to(self.view_row + rows_step, self.view_col)
+        elif event.key == pygame.K_LEFT:
+            self.scroll_to(self.view_row, self.view_col - cols_step)
+        elif event.key == pygame.K_RIGHT:
+            self.scroll_to(self.view_row, self.view_col + cols_step)
+        elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+            self.zoom(1)
+        elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.zoom(-1)
+    
+    def next_timer_tick(self) -> int:
+        """Миллисекунды до смены секунды на таймере; 0 - таймер стоит"""
+        if self.state != "game" or not self.start_time:
+            return 0
+        return 1000 - (pygame.time.get_ticks() - self.start_time) % 1000
+    
+    def run(self, event_driven: bool = True):
+        """Основной игровой цикл
+        
+        event_driven=True: цикл спит в pygame.event.wait и рисует кадр только
+        после ввода или когда таймер переходит на следующую секунду.
+        event_driven=False: прежний опрос событий с перерисовкой 60 раз в секунду.
+        """
         clock = pygame.time.Clock()
         
         try:
             while True:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit()
-                    
-                    elif event.type == pygame.KEYDOWN:
-                        if event.key == pygame.K_ESCAPE:
-                            if self.state == "game":
-                                self.state = "menu"
-                            else:
-                                pygame.quit()
-                                sys.exit()
-                    
-                    elif event.type == pygame.MOUSEBUTTONDOWN:
-                        if event.button == 1:  # Левая кнопка мыши
-                            if self.state == "menu":
-                                self.handle_menu_click(event.pos)
-                            elif self.state == "game":
-                                # Проверка клика по кнопке меню
-                                menu_button = pygame.Rect(self.width - 150, 15, 120, 30)
-                                if menu_button.collidepoint(event.pos):
-                                    self.state = "menu"
-                                else:
-                                    self.handle_game_click(event.pos)
-                            elif self.state in ["game_over", "game_won"]:
-                                self.handle_game_over_click(event.pos)
-                                
-                        elif event.button == 3:  # Правая кнопка мыши
-                            if self.state == "game":
-                                self.handle_game_click(event.pos, right_click=True)
+                if event_driven:
+                    timeout = self.next_timer_tick()
+                    event = pygame.event.wait(timeout) if timeout else pygame.event.wait()
+                    events = [event] + pygame.event.get()
+                else:
+                    events = pygame.event.get()
                 
-                # Отрисовка в зависимости от состояния
-                if self.state == "menu":
-                    self.draw_menu()
-                elif self.state in ["game", "game_over", "game_won"]:
-                    self.draw_game()
+                for event in events:
+                    self.handle_event(event)
                 
-                pygame.display.flip()
-                clock.tick(60)
+                self.render_frame()
+                if not event_driven:
+                    clock.tick(60)
                 
         except Exception as e:
             print(f"Произошла ошибка: {e}")
             print("Игра будет перезапущена...")
             pygame.quit()
             # Перезапуск игры
-            new_game = Minesweeper()
-            new_game.run()
+            new_game = Minesweeper(seed=self.seed,
+                                   custom=self.custom_size if self.difficulty == "custom" else None)
+            new_game.run(event_driven)
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Сапер")
+    parser.add_argument("--fixed-fps", action="store_true",
+                        help="прежний цикл с перерисовкой 60 раз в секунду")
+    parser.add_argument("--custom", type=parse_board_size, metavar="ROWSxCOLSxMINES",
+                        help="свое поле, например 500x500x25000")
+    parser.add_argument("--seed", type=int, help="повторяемая расстановка мин")
+    args = parser.parse_args()
     try:
-        game = Minesweeper()
-        game.run()
+        game = Minesweeper(seed=args.seed, custom=args.custom)
+        game.run(event_driven=not args.fixed_fps)
     except Exception as e:
         print(f"Критическая ошибка: {e}")
         input("Нажмите Enter для выхода...")
\ No newline at end of file
@@ -0,0 +1,345 @@
+"""Бенчмарки VehicleManager.
+
+Запуск: python bench_laba1.py [index] [query] [json] [journal] [xml] [memory] [columnar] [from_dict] [snapshot] [batch] [--sizes 1000,10000,...]
+"""
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from laba1 import (
+    Vehicle, VehicleManager, Car, Truck, ElectricEngine, CombustionEngine,
+    AutoTransmission, ManualTransmission
+)
+
+
+def make_vehicles(count: int, seed: int = 0):
+    """Генерация парка машин в формате laba1.json"""
+    rng = random.Random(seed)
+    brands = ["Tesla", "Toyota", "honda", "BMW", "Volvo", "Ford", "Kia"]
+    vehicles = []
+    for i in range(count):
+        if rng.random() < 0.4:
+            engine = ElectricEngine(power=rng.randint(100, 500),
+                                    battery_capacity=round(rng.uniform(40, 120), 1))
+        else:
+            engine = CombustionEngine(power=rng.randint(70, 450),
+                                      fuel_type=rng.choice(["Petrol", "Diesel"]))
+        if rng.random() < 0.5:
+            transmission = AutoTransmission(gears=rng.randint(1, 10),
+                                            mode=rng.choice(["Normal", "Eco", "Sport"]))
+        else:
+            transmission = ManualTransmission(gears=rng.randint(4, 6),
+                                              clutch_type=rng.choice(["Hydraulic", "Cable"]))
+        common = dict(id=str(i), brand=rng.choice(brands), model=f"M{rng.randint(1, 50)}",
+                      year=rng.randint(1995, 2025), engine=engine, transmission=transmission)
+        if rng.random() < 0.8:
+            vehicles.append(Car(body_type=rng.choice(["Sedan", "SUV", "Hatchback"]), **common))
+        else:
+            vehicles.append(Truck(load_capacity=round(rng.uniform(1, 40), 1), **common))
+    return vehicles
+
+
+def bench_index(sizes, ops: int = 10000):
+    """Задержка read/update/delete+create на одну операцию при росте парка"""
+    print(f"{'size':>10} {'read us':>10} {'update us':>10} {'delete+create us':>18}")
+    for size in sizes:
+        vehicles = make_vehicles(size)
+        manager = VehicleManager()
+        manager.laba1 = vehicles
+        rng = random.Random(1)
+        ids = [str(rng.randrange(size)) for _ in range(ops)]
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for id in ids:
+                manager.read(id)
+            read_us = (time.perf_counter() - start) / ops * 1e6
+
+            start = time.perf_counter()
+            for id in ids:
+                manager.update(id, year=2024)
+            update_us = (time.perf_counter() - start) / ops * 1e6
+
+            start = time.perf_counter()
+            for id in ids:
+                vehicle = manager.read(id)
+                manager.delete(id)
+                manager.create(vehicle)
+            churn_us = (time.perf_counter() - start) / ops * 1e6
+
+        print(f"{size:>10} {read_us:>10.2f} {update_us:>10.2f} {churn_us:>18.2f}")
+
+
+def bench_query(sizes, repeats: int = 5):
+    """Запрос "Electric, 2022+, power > 150": фильтр по get_info против query()"""
+    print(f"{'size':>10} {'get_info scan ms':>18} {'query scan ms':>15} {'query indexed ms':>18}")
+    for size in sizes:
+        vehicles = make_vehicles(size)
+        plain = VehicleManager()
+        plain.laba1 = vehicles
+        indexed = VehicleManager(indexes=["engine_type", "year", "power"])
+        indexed.laba1 = vehicles
+        conditions = dict(engine_type="Electric", year__gte=2022, power__gt=150)
+
+        def old_style():
+            return [v for v in plain.read_all()
+                    if (info := v.get_info())["engine"]["type"] == "Electric"
+                    and info["year"] >= 2022 and info["engine"]["power"] > 150]
+
+        timings = []
+        for run in (old_style,
+                    lambda: list(plain.query(**conditions)),
+                    lambda: list(indexed.query(**conditions))):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                run()
+            timings.append((time.perf_counter() - start) / repeats * 1e3)
+        print(f"{size:>10} {timings[0]:>18.2f} {timings[1]:>15.2f} {timings[2]:>18.2f}")
+
+
+def bench_json(sizes):
+    """Загрузка JSON: json.load целиком против потокового iter_json (время и пик памяти)"""
+    print(f"{'size':>10} {'MB':>8} {'json.load s':>12} {'peak MB':>9} {'iter_json s':>12} {'peak MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            filename = os.path.join(tmp, "laba1.json")
+            manager = VehicleManager()
+            manager.laba1 = make_vehicles(size)
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager.save_to_json(filename)
+            del manager
+
+            def whole_file():
+                with open(filename, encoding="utf-8") as f:
+                    data = json.load(f)
+                for item in data:
+                    Vehicle.from_dict(item)
+
+            def streaming():
+                for _ in VehicleManager.iter_json(filename):
+                    pass
+
+            row = [f"{size:>10}", f"{os.path.getsize(filename) / 2**20:>8.1f}"]
+            for run in (whole_file, streaming):
+                tracemalloc.start()
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                row += [f"{elapsed:>12.2f}", f"{peak / 2**20:>9.1f}"]
+            print(" ".join(row))
+
+
+def bench_journal(sizes, ops: int = 200):
+    """Стоимость одного изменения: save_to_json целиком против дозаписи в журнал"""
+    print(f"{'size':>10} {'save_to_json ms/op':>20} {'journal us/op':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            vehicles = make_vehicles(size + ops)
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager = VehicleManager()
+                manager.laba1 = vehicles[:size]
+                save_ops = max(1, min(ops, 2_000_000 // size))
+                start = time.perf_counter()
+                for vehicle in vehicles[size:size + save_ops]:
+                    manager.create(vehicle)
+                    manager.save_to_json(os.path.join(tmp, "laba1.json"))
+                save_ms = (time.perf_counter() - start) / save_ops * 1e3
+
+                journaled = VehicleManager()
+                journaled.open_journal(os.path.join(tmp, f"laba1_{size}.jsonl"))
+                journaled.laba1 = vehicles[:size]
+                start = time.perf_counter()
+                for vehicle in vehicles[size:]:
+                    journaled.create(vehicle)
+                journal_us = (time.perf_counter() - start) / ops * 1e6
+                journaled.close_journal()
+            print(f"{size:>10} {save_ms:>20.2f} {journal_us:>15.2f}")
+
+
+def bench_xml(sizes):
+    """Пропускная способность XML (iterparse) против JSON: записей в секунду"""
+    print(f"{'size':>10} {'json save/s':>12} {'json load/s':>12} {'xml save/s':>12} {'xml load/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            manager = VehicleManager()
+            manager.laba1 = make_vehicles(size)
+            row = [f"{size:>10}"]
+            for save, load, name in ((manager.save_to_json, VehicleManager.iter_json, "laba1.json"),
+                                     (manager.save_to_xml, VehicleManager.iter_xml, "laba1.xml")):
+                filename = os.path.join(tmp, name)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    start = time.perf_counter()
+                    save(filename)
+                    save_rate = size / (time.perf_counter() - start)
+                start = time.perf_counter()
+                for _ in load(filename):
+                    pass
+                load_rate = size / (time.perf_counter() - start)
+                row += [f"{save_rate:>12.0f}", f"{load_rate:>12.0f}"]
+            print(" ".join(row))
+
+
+def bench_memory(sizes):
+    """Память на одну машину (tracemalloc) после загрузки в VehicleManager"""
+    print(f"{'size':>10} {'total MB':>10} {'bytes/vehicle':>14}")
+    for size in sizes:
+        tracemalloc.start()
+        manager = VehicleManager()
+        manager.laba1 = make_vehicles(size)
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(f"{size:>10} {current / 2**20:>10.1f} {current / size:>14.0f}")
+        del manager
+
+
+def bench_columnar(sizes):
+    """Аналитика: средняя мощность по марке и количество по году через get_info против столбцов"""
+    print(f"{'size':>10} {'get_info ms':>12} {'columnar ms':>12}")
+    for size in sizes:
+        manager = VehicleManager()
+        manager.laba1 = make_vehicles(size)
+        store = manager.to_columnar()
+
+        start = time.perf_counter()
+        power, by_year = {}, {}
+        for vehicle in manager.read_all():
+            info = vehicle.get_info()
+            power.setdefault(info["brand"], []).append(info["engine"]["power"])
+            by_year[info["year"]] = by_year.get(info["year"], 0) + 1
+        mean_power = {brand: sum(values) / len(values) for brand, values in power.items()}
+        objects_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        columnar_power = store.mean("power", by="brand")
+        columnar_years = store.count(by="year")
+        columnar_ms = (time.perf_counter() - start) * 1e3
+
+        assert columnar_years == by_year
+        assert all(abs(columnar_power[brand] - mean) < 1e-6 for brand, mean in mean_power.items())
+        print(f"{size:>10} {objects_ms:>12.1f} {columnar_ms:>12.1f}")
+
+
+def bench_from_dict(sizes):
+    """Десериализация laba1.json-подобных словарей: по одной записи и пакетно"""
+    print(f"{'size':>10} {'from_dict rec/s':>16} {'from_dicts rec/s':>17}")
+    for size in sizes:
+        data = [vehicle.to_dict() for vehicle in make_vehicles(size)]
+        start = time.perf_counter()
+        single = [Vehicle.from_dict(item) for item in data]
+        single_rate = size / (time.perf_counter() - start)
+        del single
+        start = time.perf_counter()
+        Vehicle.from_dicts(data)
+        bulk_rate = size / (time.perf_counter() - start)
+        print(f"{size:>10} {single_rate:>16.0f} {bulk_rate:>17.0f}")
+
+
+def bench_snapshot(sizes):
+    """Холодный старт: load_from_json против load_snapshot (+ первое чтение по ID)"""
+    print(f"{'size':>10} {'json load s':>12} {'snapshot MB':>12} {'open ms':>9} {'read us':>9} {'hydrate s':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            json_file = os.path.join(tmp, "laba1.json")
+            snapshot_file = os.path.join(tmp, "laba1.snap")
+            manager = VehicleManager()
+            manager.laba1 = make_vehicles(size)
+            with contextlib.redirect_stdout(io.StringIO()):
+                manager.save_to_json(json_file)
+                manager.save_snapshot(snapshot_file)
+                del manager
+
+                start = time.perf_counter()
+                VehicleManager().load_from_json(json_file)
+                json_s = time.perf_counter() - start
+
+                gc.collect()
+                start = time.perf_counter()
+                loaded = VehicleManager()
+                loaded.load_snapshot(snapshot_file)
+                open_ms = (time.perf_counter() - start) * 1e3
+
+                ids = [str(i) for i in random.Random(3).sample(range(size), min(size, 1000))]
+                start = time.perf_counter()
+                for id in ids:
+                    loaded.read(id)
+                read_us = (time.perf_counter() - start) / len(ids) * 1e6
+
+                start = time.perf_counter()
+                loaded.read_all()
+                hydrate_s = time.perf_counter() - start
+            print(f"{size:>10} {json_s:>12.2f} {os.path.getsize(snapshot_file) / 2**20:>12.1f} "
+                  f"{open_ms:>9.2f} {read_us:>9.1f} {hydrate_s:>10.2f}")
+
+
+def bench_batch(sizes):
+    """Массовый импорт с индексами: create в цикле против create_many"""
+    print(f"{'size':>10} {'create loop s':>14} {'create_many s':>14} {'delete_many s':>14}")
+    for size in sizes:
+        vehicles = make_vehicles(size)
+        manager = VehicleManager(indexes=["brand", "year", "power"])
+        start = time.perf_counter()
+        for vehicle in vehicles:
+            manager.create(vehicle)
+        loop_s = time.perf_counter() - start
+
+        manager = VehicleManager(indexes=["brand", "year", "power"])
+        start = time.perf_counter()
+        manager.create_many(vehicles)
+        batch_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        manager.delete_many([vehicle.id for vehicle in vehicles[::2]])
+        delete_s = time.perf_counter() - start
+        print(f"{size:>10} {loop_s:>14.2f} {batch_s:>14.2f} {delete_s:>14.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmarks", nargs="*", default=["index"])
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    if "index" in args.benchmarks:
+        print("=== Primary id index ===")
+        bench_index(sizes)
+    if "query" in args.benchmarks:
+        print("=== Secondary indexes / query ===")
+        bench_query(sizes)
+    if "json" in args.benchmarks:
+        print("=== Streaming JSON load ===")
+        bench_json(sizes)
+    if "journal" in args.benchmarks:
+        print("=== JSON Lines journal ===")
+        bench_journal(sizes)
+    if "xml" in args.benchmarks:
+        print("=== XML vs JSON throughput ===")
+        bench_xml(sizes)
+    if "memory" in args.benchmarks:
+        print("=== Memory per vehicle ===")
+        bench_memory(sizes)
+    if "columnar" in args.benchmarks:
+        print("=== Columnar analytics ===")
+        bench_columnar(sizes)
+    if "from_dict" in args.benchmarks:
+        print("=== Vehicle.from_dict ===")
+        bench_from_dict(sizes)
+    if "snapshot" in args.benchmarks:
+        print("=== Binary snapshot cold start ===")
+        bench_snapshot(sizes)
+    if "batch" in args.benchmarks:
+        print("=== Batch CRUD ===")
+        bench_batch(sizes)
+
+
+if __name__ == "__main__":
+    main()
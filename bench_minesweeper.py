@@ -0,0 +1,323 @@
+"""Бенчмарки движка «Сапер».
+
+Запуск: python bench_minesweeper.py [reveal] [click] [setup] [storage] [render] [--sizes 100,300,1000] [--density 0.01]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+from minesweeper_engine import Board, DIFFICULTIES, FLAGGED, NUMBER_MASK, REVEALED
+
+
+def legacy_reveal_cell(board: Board, row: int, col: int, calls: list):
+    """Прежнее рекурсивное открытие: 9 вызовов на каждую пустую клетку"""
+    calls[0] += 1
+    if not (0 <= row < board.rows and 0 <= col < board.cols):
+        return
+
+    index = board.index(row, col)
+    if board.cells[index] & (REVEALED | FLAGGED):
+        return
+
+    board.cells[index] |= REVEALED
+
+    if board.is_mine(row, col):
+        board.game_over = True
+        board.exploded_mine = (row, col)
+        return
+
+    if not board.cells[index] & NUMBER_MASK:
+        for dr in [-1, 0, 1]:
+            for dc in [-1, 0, 1]:
+                legacy_reveal_cell(board, row + dr, col + dc, calls)
+
+
+def legacy_check_win(board: Board) -> bool:
+    """Прежняя проверка победы полным обходом поля"""
+    for row in range(board.rows):
+        for col in range(board.cols):
+            if not board.is_revealed(row, col) and not board.is_mine(row, col):
+                return False
+    return True
+
+
+def legacy_place_mines(rows: int, cols: int, mines_count: int, exclude_row: int, exclude_col: int, rng):
+    """Прежняя расстановка: повторные попытки randint и 8 проверок множества на клетку"""
+    board = [[0 for _ in range(cols)] for _ in range(rows)]
+    mines = set()
+    while len(mines) < mines_count:
+        row = rng.randint(0, rows - 1)
+        col = rng.randint(0, cols - 1)
+        if abs(row - exclude_row) <= 1 and abs(col - exclude_col) <= 1:
+            continue
+        if (row, col) not in mines:
+            mines.add((row, col))
+            board[row][col] = -1
+
+    for row in range(rows):
+        for col in range(cols):
+            if board[row][col] != -1:
+                count = 0
+                for dr in [-1, 0, 1]:
+                    for dc in [-1, 0, 1]:
+                        if (row + dr, col + dc) in mines:
+                            count += 1
+                board[row][col] = count
+    return board
+
+
+def legacy_state(board: Board):
+    """То же поле в прежнем представлении: три вложенных списка и множество мин"""
+    rows, cols = board.rows, board.cols
+    numbers = [[board.cell_value(row, col) for col in range(cols)] for row in range(rows)]
+    revealed = [[False for _ in range(cols)] for _ in range(rows)]
+    flagged = [[False for _ in range(cols)] for _ in range(rows)]
+    mines = set(board.mine_positions())
+    return numbers, revealed, flagged, mines
+
+
+def legacy_count_adjacent(mines, rows: int, cols: int, row: int, col: int) -> int:
+    """Прежний подсчет соседних мин: 8 проверок множества кортежей"""
+    count = 0
+    for dr in [-1, 0, 1]:
+        for dc in [-1, 0, 1]:
+            if dr == 0 and dc == 0:
+                continue
+            r, c = row + dr, col + dc
+            if 0 <= r < rows and 0 <= c < cols:
+                if (r, c) in mines:
+                    count += 1
+    return count
+
+
+def legacy_flood_fill(state, rows: int, cols: int, row: int, col: int) -> int:
+    """Итеративная заливка по вложенным спискам (до упаковки состояния)"""
+    numbers, revealed, flagged, mines = state
+    revealed[row][col] = True
+    opened = 1
+    stack = [(row, col)]
+    while stack:
+        r, c = stack.pop()
+        c_from, c_to = max(c - 1, 0), min(c + 2, cols)
+        for nr in range(max(r - 1, 0), min(r + 2, rows)):
+            revealed_row, flagged_row, numbers_row = revealed[nr], flagged[nr], numbers[nr]
+            for nc in range(c_from, c_to):
+                if revealed_row[nc] or flagged_row[nc]:
+                    continue
+                revealed_row[nc] = True
+                opened += 1
+                if numbers_row[nc] == 0:
+                    stack.append((nr, nc))
+    return opened
+
+
+def prepared_board(size: int, density: float, seed: int = 0) -> Board:
+    """Квадратное поле с расставленными минами, но без открытых клеток"""
+    board = Board(size, size, max(1, int(size * size * density)), seed=seed)
+    board.first_click = False
+    board.place_mines(size // 2, size // 2)
+    return board
+
+
+def bench_reveal(sizes, density: float):
+    """Заливка пустой области с первого клика: рекурсия против стека"""
+    print(f"recursion limit: {sys.getrecursionlimit()}")
+    print(f"{'size':>10} {'opened':>10} {'recursive ms':>14} {'calls':>10} {'iterative ms':>14}")
+    for size in sizes:
+        center = size // 2
+
+        board = prepared_board(size, density)
+        calls = [0]
+        start = time.perf_counter()
+        try:
+            legacy_reveal_cell(board, center, center, calls)
+            legacy = f"{(time.perf_counter() - start) * 1000:14.1f}"
+        except RecursionError:
+            legacy = f"{'RecursionError':>14}"
+
+        board = prepared_board(size, density)
+        start = time.perf_counter()
+        opened = board.reveal_cell(center, center)
+        iterative = (time.perf_counter() - start) * 1000
+
+        print(f"{size:>7}^2 {len(opened):>10} {legacy} {calls[0]:>10} {iterative:14.1f}")
+
+
+def bench_click(sizes, clicks: int = 200):
+    """Задержка последних кликов партии (открытие + проверка победы) при росте поля
+
+    Прежняя проверка выходит на первой закрытой безопасной клетке, поэтому
+    дороже всего она в конце партии: меряем клики по последним клеткам.
+    """
+    print(f"{'size':>10} {'scan win us':>12} {'counter win us':>15}")
+    for size in sizes:
+        timings = []
+        for check in (legacy_check_win, None):
+            board = prepared_board(size, 0.2)
+            numbered = [(row, col) for row in range(size) for col in range(size)
+                        if board.cell_value(row, col) > 0]
+            targets = set(random.Random(1).sample(numbered, min(clicks, len(numbered))))
+            for row in range(size):
+                for col in range(size):
+                    if not board.is_mine(row, col) and (row, col) not in targets:
+                        board.cells[board.index(row, col)] |= REVEALED
+            board.safe_revealed = board.safe_total - len(targets)
+
+            start = time.perf_counter()
+            if check is None:
+                for row, col in targets:
+                    board.click(row, col)
+            else:
+                for row, col in targets:
+                    board.reveal_cell(row, col)
+                    check(board)
+            timings.append((time.perf_counter() - start) / len(targets) * 1e6)
+            assert board.check_win()
+
+        print(f"{size:>7}^2 {timings[0]:12.1f} {timings[1]:15.1f}")
+
+
+def bench_setup(sizes, densities=(0.01, 0.2, 0.8), legacy_limit: int = 1000):
+    """Время place_mines: выборка без повторов и свертка против прежнего кода"""
+    print(f"{'size':>10} {'density':>8} {'legacy ms':>10} {'current ms':>11}")
+    for size in sizes:
+        for density in densities:
+            mines_count = int(size * size * density)
+            center = size // 2
+            if size <= legacy_limit:
+                start = time.perf_counter()
+                legacy_place_mines(size, size, mines_count, center, center, random.Random(0))
+                legacy = f"{(time.perf_counter() - start) * 1000:10.1f}"
+            else:
+                legacy = f"{'-':>10}"
+
+            board = Board(size, size, mines_count, seed=0)
+            start = time.perf_counter()
+            board.place_mines(center, center)
+            current = (time.perf_counter() - start) * 1000
+            print(f"{size:>7}^2 {density:8.2f} {legacy} {current:11.1f}")
+
+
+def bench_storage(ops: int = 100000):
+    """Память на клетку и время операций: вложенные списки против упакованного bytearray"""
+    shapes = [(name, DIFFICULTIES[name]) for name in DIFFICULTIES]
+    shapes.append(("1000x1000", (1000, 1000, 150000)))
+    shapes.append(("1000x1000 1%", (1000, 1000, 10000)))
+    print(f"{'board':>13} {'B/cell':>7} {'packed':>7} {'adjacent us':>12} {'packed':>7} "
+          f"{'value ns':>9} {'packed':>7} {'fill ms':>8} {'packed':>7} {'opened':>7}")
+    for name, (rows, cols, mines_count) in shapes:
+        board = Board(rows, cols, mines_count, seed=0)
+        board.place_mines(rows // 2, cols // 2)
+        cells = rows * cols
+
+        tracemalloc.start()
+        state = legacy_state(board)
+        legacy_memory = tracemalloc.get_traced_memory()[0] / cells
+        tracemalloc.stop()
+        packed_memory = sys.getsizeof(board.cells) / cells
+
+        rng = random.Random(1)
+        coords = [(rng.randrange(rows), rng.randrange(cols)) for _ in range(ops)]
+        numbers, _, _, mines = state
+
+        start = time.perf_counter()
+        for row, col in coords:
+            legacy_count_adjacent(mines, rows, cols, row, col)
+        legacy_adjacent = (time.perf_counter() - start) / ops * 1e6
+        start = time.perf_counter()
+        for row, col in coords:
+            board.count_adjacent_mines(row, col)
+        packed_adjacent = (time.perf_counter() - start) / ops * 1e6
+
+        start = time.perf_counter()
+        for row, col in coords:
+            numbers[row][col]
+        legacy_value = (time.perf_counter() - start) / ops * 1e9
+        start = time.perf_counter()
+        for row, col in coords:
+            board.cell_value(row, col)
+        packed_value = (time.perf_counter() - start) / ops * 1e9
+
+        start = time.perf_counter()
+        legacy_opened = legacy_flood_fill(state, rows, cols, rows // 2, cols // 2)
+        legacy_fill = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        opened = board.reveal_cell(rows // 2, cols // 2)
+        packed_fill = (time.perf_counter() - start) * 1000
+        assert len(opened) == legacy_opened
+
+        print(f"{name:>13} {legacy_memory:7.1f} {packed_memory:7.2f} {legacy_adjacent:12.2f} {packed_adjacent:7.2f} "
+              f"{legacy_value:9.0f} {packed_value:7.0f} {legacy_fill:8.1f} {packed_fill:7.1f} {len(opened):>7}")
+
+
+def bench_render(frames: int = 200):
+    """Время кадра Minesweeper: без кэшей, полная перерисовка из кэша, холостой кадр
+
+    Нужен pygame; окно создается в dummy-драйвере SDL.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    try:
+        from Minesweeper import Minesweeper
+    except ImportError as e:
+        print(f"skipped: {e}")
+        return
+
+    game = Minesweeper(seed=0)
+
+    def uncached():
+        game.tiles = None
+        game.labels.clear()
+        game._drawn_state = None
+        game.render_frame()
+
+    def full():
+        game._drawn_state = None
+        game.render_frame()
+
+    print(f"{'difficulty':>10} {'no cache ms':>12} {'full ms':>9} {'idle ms':>9}")
+    for difficulty in DIFFICULTIES:
+        game.set_difficulty(difficulty)
+        game.reset_game()
+        game.state = "game"
+        game.engine.click(game.rows // 2, game.cols // 2)
+
+        timings = []
+        for frame in (uncached, full, game.render_frame):
+            frame()
+            start = time.perf_counter()
+            for _ in range(frames):
+                frame()
+            timings.append((time.perf_counter() - start) / frames * 1000)
+        print(f"{difficulty:>10} {timings[0]:12.2f} {timings[1]:9.2f} {timings[2]:9.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmarks", nargs="*", default=["reveal"])
+    parser.add_argument("--sizes", default="30,100,300,1000")
+    parser.add_argument("--density", type=float, default=0.01)
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    if "reveal" in args.benchmarks:
+        print("=== Flood fill (reveal_cell) ===")
+        bench_reveal(sizes, args.density)
+    if "click" in args.benchmarks:
+        print("=== Click latency (check_win) ===")
+        bench_click(sizes)
+    if "setup" in args.benchmarks:
+        print("=== Board setup (place_mines) ===")
+        bench_setup(sizes)
+    if "storage" in args.benchmarks:
+        print("=== Board storage (nested lists vs packed cells) ===")
+        bench_storage()
+    if "render" in args.benchmarks:
+        print("=== Frame time (Minesweeper renderer) ===")
+        bench_render()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Бенчмарки проверки паролей.
+
+Запуск: python bench_password_checker.py [check] [scan] [blocklist] [strength] [--sizes 100000,1000000] [--scan-mb 64] [--workers N]
+"""
+import argparse
+import os
+import random
+import re
+import string
+import tempfile
+import time
+import tracemalloc
+
+from password_blocklist import Blocklist, build_blocklist, password_key
+from password_strength import password_strength
+from password_checker import (
+    is_strong_password, is_strong_password_batch, is_strong_password_regex, save_strong_passwords
+)
+
+
+def legacy_is_strong_password(password):
+    """Прежняя проверка: re.match со строкой шаблона на каждый вызов"""
+    pattern = r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*()]).{8,}$'
+    return re.match(pattern, password) is not None
+
+
+def make_passwords(count: int, seed: int = 0):
+    """Смесь словарных паролей (буквы и цифры) и случайных с разными классами символов"""
+    rng = random.Random(seed)
+    words = ["password", "qwerty", "dragon", "monkey", "letmein", "shadow", "master", "admin"]
+    alphabet = string.ascii_letters + string.digits + "!@#$%^&*()_-."
+    passwords = []
+    for _ in range(count):
+        if rng.random() < 0.6:
+            word = rng.choice(words)
+            if rng.random() < 0.5:
+                word = word.capitalize()
+            passwords.append(word + str(rng.randrange(10000)) + rng.choice(["", "", "!", "@"]))
+        else:
+            passwords.append("".join(rng.choice(alphabet) for _ in range(rng.randint(6, 16))))
+    return passwords
+
+
+def bench_check(sizes):
+    """Пропускная способность проверки: прежний шаблон, скомпилированный, таблицы классов, пакет"""
+    print(f"{'size':>10} {'strong':>7} {'legacy M/s':>11} {'regex M/s':>10} {'table M/s':>10} {'batch M/s':>10}")
+    for size in sizes:
+        passwords = make_passwords(size)
+        expected = [legacy_is_strong_password(p) for p in passwords]
+        rates = []
+        for check in (legacy_is_strong_password, is_strong_password_regex, is_strong_password, None):
+            start = time.perf_counter()
+            if check is None:
+                result = is_strong_password_batch(passwords)
+            else:
+                result = [check(p) for p in passwords]
+            rates.append(size / (time.perf_counter() - start) / 1e6)
+            assert result == expected
+        print(f"{size:>10} {sum(expected) / size:7.2f} {rates[0]:11.2f} {rates[1]:10.2f} "
+              f"{rates[2]:10.2f} {rates[3]:10.2f}")
+
+
+def legacy_find_strong_passwords(filename):
+    """Прежний разбор файла: readlines целиком и список всех надежных паролей"""
+    with open(filename, 'r') as file:
+        passwords = file.readlines()
+    strong_passwords = []
+    for password in passwords:
+        password = password.strip()
+        if legacy_is_strong_password(password):
+            strong_passwords.append(password)
+    return strong_passwords
+
+
+def bench_scan(megabytes: int, workers: int):
+    """Проверка файла: readlines против потоковой проверки в одном процессе и в пуле"""
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "passwords.txt")
+        with open(filename, "w") as file:
+            block = "\n".join(make_passwords(100000)) + "\n"
+            for _ in range(max(1, megabytes * 1024 * 1024 // len(block))):
+                file.write(block)
+        size = os.path.getsize(filename) / 1e6
+
+        print(f"{'file MB':>8} {'mode':>14} {'seconds':>8} {'MB/s':>7} {'strong':>9}")
+        start = time.perf_counter()
+        strong = len(legacy_find_strong_passwords(filename))
+        elapsed = time.perf_counter() - start
+        print(f"{size:8.0f} {'readlines':>14} {elapsed:8.2f} {size / elapsed:7.1f} {strong:>9}")
+        for count in sorted({1, workers}):
+            summary = save_strong_passwords(filename, os.devnull, workers=count)
+            assert summary.strong == strong
+            mode = f"stream x{count}"
+            print(f"{size:8.0f} {mode:>14} {summary.seconds:8.2f} {size / summary.seconds:7.1f} {summary.strong:>9}")
+
+
+def bench_blocklist(sizes, lookups: int = 100000):
+    """Индекс утекших паролей: сборка, размер, открытие и поиск против множества Python"""
+    print(f"{'size':>10} {'build s':>8} {'B/entry':>8} {'set B':>7} {'open ms':>8} "
+          f"{'hit us':>7} {'miss us':>8} {'set us':>7} {'bloom fp %':>11}")
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "breached.txt")
+            index = os.path.join(directory, "breached.blk")
+            passwords = [f"{p}{i}" for i, p in enumerate(make_passwords(size))]
+            with open(source, "w") as file:
+                file.write("\n".join(passwords) + "\n")
+
+            start = time.perf_counter()
+            build_blocklist(source, index)
+            build = time.perf_counter() - start
+
+            tracemalloc.start()
+            known = set(passwords)
+            set_memory = tracemalloc.get_traced_memory()[0] / size
+            tracemalloc.stop()
+
+            rng = random.Random(1)
+            hits = [rng.choice(passwords) for _ in range(lookups)]
+            misses = [f"missing-{i}" for i in range(lookups)]
+
+            start = time.perf_counter()
+            blocklist = Blocklist(index)
+            opened = (time.perf_counter() - start) * 1000
+            with blocklist:
+                timings = []
+                for sample, container in ((hits, blocklist), (misses, blocklist), (misses, known)):
+                    start = time.perf_counter()
+                    found = sum(1 for p in sample if p in container)
+                    timings.append((time.perf_counter() - start) / lookups * 1e6)
+                    assert found == (lookups if sample is hits else 0)
+                false_positives = sum(blocklist.might_contain_key(password_key(p)) for p in misses)
+
+            print(f"{size:>10} {build:8.2f} {os.path.getsize(index) / size:8.2f} {set_memory:7.0f} {opened:8.3f} "
+                  f"{timings[0]:7.2f} {timings[1]:8.2f} {timings[2]:7.2f} {false_positives / lookups * 100:11.2f}")
+
+
+def bench_strength(sizes):
+    """Оценка стойкости на пароль: без кэша, из кэша и для сравнения is_strong_password"""
+    print(f"{'size':>10} {'strength us':>12} {'cached us':>10} {'check us':>9} {'mean bits':>10}")
+    for size in sizes:
+        passwords = make_passwords(size)
+        password_strength.cache_clear()
+        start = time.perf_counter()
+        bits = sum(password_strength.__wrapped__(p).entropy for p in passwords)
+        uncached = (time.perf_counter() - start) / size * 1e6
+
+        for p in passwords[:1 << 16]:
+            password_strength(p)
+        sample = passwords[:1 << 16]
+        start = time.perf_counter()
+        for p in sample:
+            password_strength(p)
+        cached = (time.perf_counter() - start) / len(sample) * 1e6
+
+        start = time.perf_counter()
+        for p in passwords:
+            is_strong_password(p)
+        check = (time.perf_counter() - start) / size * 1e6
+        print(f"{size:>10} {uncached:12.2f} {cached:10.2f} {check:9.2f} {bits / size:10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("benchmarks", nargs="*", default=["check"])
+    parser.add_argument("--sizes", default="100000,1000000")
+    parser.add_argument("--scan-mb", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",")]
+
+    if "check" in args.benchmarks:
+        print("=== Password check throughput ===")
+        bench_check(sizes)
+    if "scan" in args.benchmarks:
+        print("=== File scan (find_strong_passwords_in_file) ===")
+        bench_scan(args.scan_mb, args.workers)
+    if "blocklist" in args.benchmarks:
+        print("=== Breached password blocklist ===")
+        bench_blocklist(sizes)
+    if "strength" in args.benchmarks:
+        print("=== Strength scoring (password_strength) ===")
+        bench_strength(sizes)
+
+
+if __name__ == "__main__":
+    main()
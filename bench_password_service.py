@@ -0,0 +1,136 @@
+"""Нагрузочный тест password_service: задержка и пропускная способность.
+
+Запуск: python bench_password_service.py [--connect 127.0.0.1:8765] [--connections 16]
+        [--pipeline 32] [--requests 200000] [--workers N] [--max-batch 512] [--max-delay-ms 1]
+
+Без --connect сервис запускается отдельным процессом на свободном порту с
+параметрами --workers, --max-batch и --max-delay-ms. Каждое соединение держит
+до --pipeline запросов без ответа; задержка - от записи запроса до чтения ответа.
+"""
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import List
+
+from bench_password_checker import make_passwords
+from password_service import percentile
+
+
+@dataclass
+class LoadResult:
+    requests: int
+    strong: int
+    seconds: float
+    latencies: List[float]
+
+    def __str__(self):
+        ms = [percentile(self.latencies, q) * 1000 for q in (50, 90, 99)]
+        return (f"{self.requests} запросов за {self.seconds:.2f} с ({self.requests / self.seconds:.0f}/с), "
+                f"надежных: {self.strong}; задержка p50 {ms[0]:.2f} мс, p90 {ms[1]:.2f} мс, "
+                f"p99 {ms[2]:.2f} мс, max {max(self.latencies, default=0) * 1000:.2f} мс")
+
+
+async def _client(host, port, requests: List[bytes], pipeline: int, latencies: List[float]) -> int:
+    """Одно соединение: отправка с окном pipeline, ответы по порядку"""
+    reader, writer = await asyncio.open_connection(host, port)
+    window = asyncio.Semaphore(pipeline)
+    sent = deque()
+
+    async def receive():
+        strong = 0
+        for _ in requests:
+            line = await reader.readline()
+            latencies.append(time.perf_counter() - sent.popleft())
+            window.release()
+            if line == b"1\n":
+                strong += 1
+            elif line != b"0\n":
+                raise RuntimeError(f"unexpected response {line!r}")
+        return strong
+
+    receiver = asyncio.create_task(receive())
+    for request in requests:
+        await window.acquire()
+        sent.append(time.perf_counter())
+        writer.write(request)
+        await writer.drain()
+    strong = await receiver
+    writer.close()
+    await writer.wait_closed()
+    return strong
+
+
+async def generate_load(host: str, port: int, passwords: List[str], connections: int = 16,
+                        pipeline: int = 32) -> LoadResult:
+    """Проверка passwords через connections соединений (пароли делятся поровну)"""
+    requests = [b"CHECK " + p.encode("utf-8", "surrogateescape") + b"\n" for p in passwords]
+    latencies: List[float] = []
+    start = time.perf_counter()
+    strong = await asyncio.gather(*(
+        _client(host, port, requests[i::connections], pipeline, latencies) for i in range(connections)))
+    return LoadResult(len(requests), sum(strong), time.perf_counter() - start, latencies)
+
+
+async def server_stats(host: str, port: int) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b"STATS\n")
+    stats = json.loads(await reader.readline())
+    writer.close()
+    await writer.wait_closed()
+    return stats
+
+
+def start_server(args):
+    """Сервис в отдельном процессе; возвращает процесс и порт"""
+    script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "password_service.py")
+    command = [sys.executable, script, "--port", "0", "--max-batch", str(args.max_batch),
+               "--max-delay-ms", str(args.max_delay_ms)]
+    if args.workers:
+        command += ["--workers", str(args.workers)]
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line:
+        raise RuntimeError("password_service did not start")
+    return process, int(line.rsplit(":", 1)[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connect", default=None, help="HOST:PORT запущенного сервиса")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--pipeline", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--max-batch", type=int, default=512)
+    parser.add_argument("--max-delay-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    process = None
+    if args.connect:
+        host, port = args.connect.rsplit(":", 1)
+        port = int(port)
+    else:
+        process, port = start_server(args)
+        host = "127.0.0.1"
+    try:
+        passwords = make_passwords(args.requests)
+        print(f"=== {args.connections} connections x pipeline {args.pipeline} -> {host}:{port} ===")
+        print(asyncio.run(generate_load(host, port, passwords, args.connections, args.pipeline)))
+        stats = asyncio.run(server_stats(host, port))
+        print(f"Сервер: пакетов {stats['batches']}, средний пакет {stats['mean_batch']:.1f}, "
+              f"максимальный {stats['max_batch']}, p50 {stats['p50_ms']:.2f} мс, p99 {stats['p99_ms']:.2f} мс")
+    finally:
+        if process is not None:
+            process.send_signal(signal.SIGINT)
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,87 @@
+import gc
+import hashlib
 import json
+import logging
+import math
+import mmap
+import operator
+import os
+import re
+import struct
+import sys
 import xml.etree.ElementTree as ET
-from typing import List, Optional, Dict, Any
+from array import array
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, compress, repeat
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Callable, Iterable, Iterator, Tuple
 
-# Базовые классы для компонентов
+logger = logging.getLogger(__name__)
+
+
+def _intern(value):
+    """Общая копия повторяющихся строк (марки, тип топлива, режимы и т.п.)"""
+    return sys.intern(value) if type(value) is str else value
+
+@contextmanager
+def _gc_paused():
+    """Пауза циклического сборщика мусора на время массовой загрузки.
+    
+    Машины не образуют циклов ссылок, а проходы gc по миллионам только что
+    созданных объектов занимают больше половины времени загрузки.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+# _from_fields собирают объекты через object.__new__ и присваивание слотов:
+# при массовой загрузке это в несколько раз быстрее цепочки __init__/super()
+_new = object.__new__
+
+# Реестры типов для десериализации: значение поля "type" / "vehicle_type" -> класс.
+# Новый тип подключается декоратором register_* и методом _from_fields
+ENGINE_TYPES: Dict[str, type] = {}
+TRANSMISSION_TYPES: Dict[str, type] = {}
+VEHICLE_TYPES: Dict[Optional[str], type] = {}
+
+
+def register_engine(name: str):
+    """Регистрация класса двигателя для Engine.from_dict"""
+    def decorator(cls):
+        ENGINE_TYPES[name] = cls
+        return cls
+    return decorator
+
+
+def register_transmission(name: str):
+    """Регистрация класса трансмиссии для Transmission.from_dict"""
+    def decorator(cls):
+        TRANSMISSION_TYPES[name] = cls
+        return cls
+    return decorator
+
+
+def register_vehicle(cls):
+    """Регистрация класса машины по его vehicle_type для Vehicle.from_dict"""
+    cls._known_fields = frozenset(_VEHICLE_FIELDS.union(cls._fields))
+    VEHICLE_TYPES[cls.vehicle_type] = cls
+    return cls
+
+# Базовые классы для компонентов.
+# Все классы используют __slots__: без __dict__ запись занимает в разы меньше памяти
 class Engine:
+    __slots__ = ("type", "power")
+    
     def __init__(self, type: str, power: float):
-        self.type = type
+        self.type = _intern(type)
         self.power = power
     
     def start(self) -> str:
@@ -13,10 +89,20 @@ class Engine:
     
     def get_info(self) -> Dict[str, Any]:
         return {"type": self.type, "power": self.power}
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Engine':
+        """Десериализация двигателя по полю type через ENGINE_TYPES"""
+        engine_class = ENGINE_TYPES.get(data["type"])
+        if engine_class is None:
+            raise ValueError(f"Unknown engine type {data['type']}")
+        return engine_class._from_fields(data)
 
 class Transmission:
+    __slots__ = ("type", "gears")
+    
     def __init__(self, type: str, gears: int):
-        self.type = type
+        self.type = _intern(type)
         self.gears = gears
     
     def shift(self, gear: int) -> str:
@@ -24,8 +110,19 @@ class Transmission:
     
     def get_info(self) -> Dict[str, Any]:  # ДОБАВЛЕН ОТСУТСТВУЮЩИЙ МЕТОД
         return {"type": self.type, "gears": self.gears}
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Transmission':
+        """Десериализация трансмиссии по полю type через TRANSMISSION_TYPES"""
+        transmission_class = TRANSMISSION_TYPES.get(data["type"])
+        if transmission_class is None:
+            raise ValueError(f"Unknown transmission type {data['type']}")
+        return transmission_class._from_fields(data)
 
+@register_engine("Electric")
 class ElectricEngine(Engine):
+    __slots__ = ("battery_capacity",)
+    
     def __init__(self, power: float, battery_capacity: float):
         super().__init__("Electric", power)
         self.battery_capacity = battery_capacity
@@ -37,11 +134,22 @@ class ElectricEngine(Engine):
         info = super().get_info()
         info["battery_capacity"] = self.battery_capacity
         return info
+    
+    @classmethod
+    def _from_fields(cls, data: dict) -> 'ElectricEngine':
+        engine = _new(cls)
+        engine.type = "Electric"
+        engine.power = data["power"]
+        engine.battery_capacity = data["battery_capacity"]
+        return engine
 
+@register_engine("Combustion")
 class CombustionEngine(Engine):
+    __slots__ = ("fuel_type",)
+    
     def __init__(self, power: float, fuel_type: str):
         super().__init__("Combustion", power)
-        self.fuel_type = fuel_type
+        self.fuel_type = _intern(fuel_type)
     
     def start(self) -> str:
         return f"Combustion engine started with {self.fuel_type}"
@@ -50,11 +158,22 @@ class CombustionEngine(Engine):
         info = super().get_info()
         info["fuel_type"] = self.fuel_type
         return info
+    
+    @classmethod
+    def _from_fields(cls, data: dict) -> 'CombustionEngine':
+        engine = _new(cls)
+        engine.type = "Combustion"
+        engine.power = data["power"]
+        engine.fuel_type = _intern(data["fuel_type"])
+        return engine
 
+@register_transmission("Automatic")
 class AutoTransmission(Transmission):
+    __slots__ = ("mode",)
+    
     def __init__(self, gears: int, mode: str = "Normal"):
         super().__init__("Automatic", gears)
-        self.mode = mode
+        self.mode = _intern(mode)
     
     def shift(self, gear: int) -> str:
         if 1 <= gear <= self.gears:
@@ -65,11 +184,22 @@ class AutoTransmission(Transmission):
         info = super().get_info()
         info["mode"] = self.mode
         return info
+    
+    @classmethod
+    def _from_fields(cls, data: dict) -> 'AutoTransmission':
+        transmission = _new(cls)
+        transmission.type = "Automatic"
+        transmission.gears = data["gears"]
+        transmission.mode = _intern(data.get("mode", "Normal"))
+        return transmission
 
+@register_transmission("Manual")
 class ManualTransmission(Transmission):
+    __slots__ = ("clutch_type",)
+    
     def __init__(self, gears: int, clutch_type: str):
         super().__init__("Manual", gears)
-        self.clutch_type = clutch_type
+        self.clutch_type = _intern(clutch_type)
     
     def shift(self, gear: int) -> str:
         if 1 <= gear <= self.gears:
@@ -80,9 +210,21 @@ class ManualTransmission(Transmission):
         info = super().get_info()
         info["clutch_type"] = self.clutch_type
         return info
+    
+    @classmethod
+    def _from_fields(cls, data: dict) -> 'ManualTransmission':
+        transmission = _new(cls)
+        transmission.type = "Manual"
+        transmission.gears = data["gears"]
+        transmission.clutch_type = _intern(data["clutch_type"])
+        return transmission
 
 # Основной класс Vehicle
 class Vehicle:
+    __slots__ = ("id", "brand", "model", "year", "engine", "transmission", "extra")
+    vehicle_type: Optional[str] = None  # Переопределяется в подклассах
+    _fields: Tuple[str, ...] = ()  # Дополнительные поля подкласса для from_dict
+    
     def __init__(
         self,
         id: str,
@@ -93,17 +235,20 @@ class Vehicle:
         transmission: Transmission
     ):
         self.id = id
-        self.brand = brand
-        self.model = model
+        self.brand = _intern(brand)
+        self.model = _intern(model)
         self.year = year
         self.engine = engine
         self.transmission = transmission
+        # Поля без атрибута в классе (например, range из XML).
+        # Пустой словарь общий и неизменяемый; для новых полей присваивайте новый dict
+        self.extra: Dict[str, Any] = _NO_EXTRA
     
     def start(self) -> str:
         return f"{self.brand} {self.model}: {self.engine.start()}"
     
     def get_info(self) -> Dict[str, Any]:
-        return {
+        info = {
             "id": self.id,
             "brand": self.brand,
             "model": self.model,
@@ -111,6 +256,9 @@ class Vehicle:
             "engine": self.engine.get_info(),
             "transmission": self.transmission.get_info()  # Теперь этот метод существует
         }
+        if self.extra:
+            info.update(self.extra)
+        return info
     
     def to_dict(self) -> dict:
         """Сериализация в словарь для JSON"""
@@ -118,45 +266,82 @@ class Vehicle:
 
     @classmethod
     def from_dict(cls, data: dict) -> 'Vehicle':
-        """Десериализация из словаря"""
-        engine_data = data["engine"]
-        transmission_data = data["transmission"]
+        """Десериализация из словаря.
         
-        # Создание двигателя
-        if engine_data["type"] == "Electric":
-            engine = ElectricEngine(
-                power=engine_data["power"],
-                battery_capacity=engine_data["battery_capacity"]
-            )
+        Класс выбирается по vehicle_type через VEHICLE_TYPES; если поля нет
+        (как в laba1.xml), то по наличию полей подкласса (body_type -> Car,
+        load_capacity -> Truck). Неизвестные поля сохраняются в extra.
+        """
+        vehicle_type = data.get("vehicle_type")
+        if vehicle_type is not None:
+            vehicle_class = VEHICLE_TYPES.get(vehicle_type)
+            if vehicle_class is None:
+                raise ValueError(f"Unknown vehicle type {vehicle_type}")
         else:
-            engine = CombustionEngine(
-                power=engine_data["power"],
-                fuel_type=engine_data["fuel_type"]
-            )
+            vehicle_class = _infer_vehicle_class(data, cls)
         
-        # Создание трансмиссии
-        if transmission_data["type"] == "Automatic":
-            transmission = AutoTransmission(
-                gears=transmission_data["gears"],
-                mode=transmission_data.get("mode", "Normal")
-            )
-        else:
-            transmission = ManualTransmission(
-                gears=transmission_data["gears"],
-                clutch_type=transmission_data["clutch_type"]
-            )
+        engine_data, transmission_data = data["engine"], data["transmission"]
+        engine_class = ENGINE_TYPES.get(engine_data["type"])
+        transmission_class = TRANSMISSION_TYPES.get(transmission_data["type"])
+        if engine_class is None:
+            raise ValueError(f"Unknown engine type {engine_data['type']}")
+        if transmission_class is None:
+            raise ValueError(f"Unknown transmission type {transmission_data['type']}")
         
-        return cls(
-            id=data["id"],
-            brand=data["brand"],
-            model=data["model"],
-            year=data["year"],
-            engine=engine,
-            transmission=transmission
+        vehicle = vehicle_class._from_fields(
+            data,
+            engine_class._from_fields(engine_data),
+            transmission_class._from_fields(transmission_data)
         )
+        if not data.keys() <= vehicle_class._known_fields:
+            known = vehicle_class._known_fields
+            vehicle.extra = {key: value for key, value in data.items() if key not in known}
+        return vehicle
+    
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict]) -> List['Vehicle']:
+        """Пакетная десериализация (с паузой gc)"""
+        from_dict = cls.from_dict
+        with _gc_paused():
+            return [from_dict(item) for item in items]
+    
+    @classmethod
+    def _from_fields(cls, data: dict, engine: Engine, transmission: Transmission) -> 'Vehicle':
+        """Сборка из словаря. Поля подкласса (_fields) просто присваиваются;
+        подкласс с более сложным __init__ должен переопределить этот метод"""
+        vehicle = _new(cls)
+        vehicle.id = data["id"]
+        vehicle.brand = _intern(data["brand"])
+        vehicle.model = _intern(data["model"])
+        vehicle.year = data["year"]
+        vehicle.engine = engine
+        vehicle.transmission = transmission
+        vehicle.extra = _NO_EXTRA
+        for field in cls._fields:
+            setattr(vehicle, field, _intern(data[field]))
+        return vehicle
+
+
+_VEHICLE_FIELDS = {"id", "brand", "model", "year", "engine", "transmission", "vehicle_type"}
+
+
+def _infer_vehicle_class(data: dict, default: type) -> type:
+    """Выбор подкласса по его полям, когда vehicle_type не указан"""
+    for vehicle_class in VEHICLE_TYPES.values():
+        if vehicle_class._fields and all(field in data for field in vehicle_class._fields):
+            return vehicle_class
+    return default
+
+_NO_EXTRA: Dict[str, Any] = MappingProxyType({})
+register_vehicle(Vehicle)
 
 # Производные классы транспортных средств
+@register_vehicle
 class Car(Vehicle):
+    __slots__ = ("body_type",)
+    vehicle_type = "Car"
+    _fields = ("body_type",)
+    
     def __init__(
         self,
         id: str,
@@ -168,15 +353,20 @@ class Car(Vehicle):
         body_type: str
     ):
         super().__init__(id, brand, model, year, engine, transmission)
-        self.body_type = body_type
+        self.body_type = _intern(body_type)
     
     def get_info(self) -> Dict[str, Any]:
         info = super().get_info()
         info["body_type"] = self.body_type
-        info["vehicle_type"] = "Car"
+        info["vehicle_type"] = self.vehicle_type
         return info
 
+@register_vehicle
 class Truck(Vehicle):
+    __slots__ = ("load_capacity",)
+    vehicle_type = "Truck"
+    _fields = ("load_capacity",)
+    
     def __init__(
         self,
         id: str,
@@ -193,76 +383,1420 @@ class Truck(Vehicle):
     def get_info(self) -> Dict[str, Any]:
         info = super().get_info()
         info["load_capacity"] = self.load_capacity
-        info["vehicle_type"] = "Truck"
+        info["vehicle_type"] = self.vehicle_type
         return info
 
+# Вторичные индексы для VehicleManager.query
+QUERY_FIELDS: Dict[str, Callable[[Vehicle], Any]] = {
+    "brand": attrgetter("brand"),
+    "model": attrgetter("model"),
+    "year": attrgetter("year"),
+    "vehicle_type": attrgetter("vehicle_type"),
+    "engine_type": attrgetter("engine.type"),
+    "power": attrgetter("engine.power"),
+    "transmission_type": attrgetter("transmission.type"),
+    "gears": attrgetter("transmission.gears"),
+}
+SORTED_INDEX_FIELDS = {"year", "power"}  # Остальные поля индексируются хешем
+
+_QUERY_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "eq": operator.eq,
+    "in": lambda value, arg: value in arg,
+    "gt": operator.gt,
+    "gte": operator.ge,
+    "lt": operator.lt,
+    "lte": operator.le,
+}
+
+
+class HashIndex:
+    """Хеш-индекс: значение поля -> {id: None} (упорядоченное множество ID)"""
+    operators = {"eq", "in"}
+    
+    def __init__(self, field: str):
+        self.field = field
+        self.get_key = QUERY_FIELDS[field]
+        self.buckets: Dict[Any, Dict[str, None]] = {}
+        self.keys: Dict[str, Any] = {}  # id -> значение на момент вставки
+    
+    def add(self, vehicle: Vehicle) -> None:
+        key = self.get_key(vehicle)
+        self.buckets.setdefault(key, {})[vehicle.id] = None
+        self.keys[vehicle.id] = key  # После вставки: при ошибке в индексе не остается следов
+    
+    def remove(self, id: str) -> None:
+        key = self.keys.pop(id)
+        bucket = self.buckets[key]
+        del bucket[id]
+        if not bucket:
+            del self.buckets[key]
+    
+    def add_many(self, vehicles: Iterable[Vehicle]) -> None:
+        for vehicle in vehicles:
+            self.add(vehicle)
+    
+    def remove_many(self, ids: Iterable[str]) -> None:
+        for id in ids:
+            self.remove(id)
+    
+    def _values(self, predicates: List[Tuple[str, Any]]) -> List[Any]:
+        op, arg = predicates[0]
+        return [arg] if op == "eq" else list(dict.fromkeys(arg))  # Повторы в __in не дублируют результат
+    
+    def estimate(self, predicates: List[Tuple[str, Any]]) -> int:
+        return sum(len(self.buckets.get(value, ())) for value in self._values(predicates))
+    
+    def lookup(self, predicates: List[Tuple[str, Any]]) -> Iterator[str]:
+        return chain.from_iterable(
+            self.buckets.get(value, ()) for value in self._values(predicates)
+        )
+
+
+class SortedIndex:
+    """Упорядоченный индекс для диапазонных запросов: отсортированный список (значение, id)"""
+    operators = {"eq", "gt", "gte", "lt", "lte"}
+    
+    def __init__(self, field: str):
+        self.field = field
+        self.get_key = QUERY_FIELDS[field]
+        self.entries: List[Tuple[Any, str]] = []
+        self.keys: Dict[str, Any] = {}
+    
+    def add(self, vehicle: Vehicle) -> None:
+        key = self.get_key(vehicle)
+        insort(self.entries, (key, vehicle.id))  # TypeError для несравнимых значений
+        self.keys[vehicle.id] = key
+    
+    def remove(self, id: str) -> None:
+        entry = (self.keys.pop(id), id)
+        del self.entries[bisect_left(self.entries, entry)]
+    
+    def add_many(self, vehicles: Iterable[Vehicle]) -> None:
+        """Пакетная вставка: дописать и один раз досортировать (timsort сливает два прогона)"""
+        get_key, keys = self.get_key, self.keys
+        new_entries = []
+        for vehicle in vehicles:
+            key = keys[vehicle.id] = get_key(vehicle)
+            new_entries.append((key, vehicle.id))
+        self.entries.extend(new_entries)
+        self.entries.sort()
+    
+    def remove_many(self, ids: Iterable[str]) -> None:
+        """Пакетное удаление одним проходом по списку вместо сдвига на каждое удаление"""
+        removed = {(self.keys.pop(id), id) for id in ids}
+        self.entries = [entry for entry in self.entries if entry not in removed]
+    
+    def _bounds(self, predicates: List[Tuple[str, Any]]) -> Tuple[int, int]:
+        """Пересечение всех условий поля в один срез entries[lo:hi]"""
+        lo, hi = 0, len(self.entries)
+        key = itemgetter(0)
+        for op, arg in predicates:
+            if op in ("eq", "gte"):
+                lo = max(lo, bisect_left(self.entries, arg, key=key))
+            if op == "gt":
+                lo = max(lo, bisect_right(self.entries, arg, key=key))
+            if op in ("eq", "lte"):
+                hi = min(hi, bisect_right(self.entries, arg, key=key))
+            if op == "lt":
+                hi = min(hi, bisect_left(self.entries, arg, key=key))
+        return lo, max(lo, hi)
+    
+    def estimate(self, predicates: List[Tuple[str, Any]]) -> int:
+        lo, hi = self._bounds(predicates)
+        return hi - lo
+    
+    def lookup(self, predicates: List[Tuple[str, Any]]) -> Iterator[str]:
+        lo, hi = self._bounds(predicates)
+        entries = self.entries
+        return (entries[i][1] for i in range(lo, hi))
+
+
+# Потоковый разбор JSON-массива верхнего уровня
+_JSON_DECODER = json.JSONDecoder()
+_NON_WHITESPACE = re.compile(r"\S")
+_JSON_DELIMITERS = frozenset(" \t\n\r,]")
+
+
+def iter_json_array(file, chunk_size: int = 1 << 16) -> Iterator[Any]:
+    """Разбор массива [...] из текстового файла по одному элементу.
+    
+    В памяти держится только текущий кусок файла и текущий элемент,
+    поэтому размер файла на пиковое потребление памяти не влияет.
+    """
+    decode = _JSON_DECODER.raw_decode
+    buffer, pos, eof = "", 0, False
+    
+    def read_more() -> bool:
+        nonlocal buffer, pos, eof
+        chunk = file.read(chunk_size)
+        eof = not chunk
+        buffer, pos = buffer[pos:] + chunk, 0
+        return not eof
+    
+    def next_char() -> str:
+        nonlocal pos
+        while True:
+            match = _NON_WHITESPACE.search(buffer, pos)
+            if match:
+                pos = match.start()
+                return buffer[pos]
+            pos = len(buffer)
+            if not read_more():
+                return ""
+    
+    if next_char() != "[":
+        raise ValueError("Expected top-level JSON array")
+    pos += 1
+    if next_char() == "]":
+        return
+    while True:
+        if next_char() == "":
+            raise ValueError("Unexpected end of JSON array")
+        try:
+            value, end = decode(buffer, pos)
+        except json.JSONDecodeError:
+            if read_more():
+                continue
+            raise
+        # Число на границе куска может продолжаться в следующем ("-7" + ".5e3")
+        if (end == len(buffer) or buffer[end] not in _JSON_DELIMITERS) and read_more():
+            continue
+        pos = end
+        yield value
+        separator = next_char()
+        if separator == "]":
+            return
+        if separator != ",":
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {separator!r}")
+        pos += 1
+
+
+# Преобразование XML <-> словари формата to_dict/from_dict
+_XML_NUMERIC_FIELDS = {"year", "power", "battery_capacity", "gears", "load_capacity", "range"}
+
+
+def _parse_xml_number(text: str):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+
+def _xml_to_dict(element: ET.Element) -> Dict[str, Any]:
+    """<vehicle> -> словарь; вложенные элементы становятся вложенными словарями"""
+    data: Dict[str, Any] = {}
+    for child in element:
+        if len(child):
+            data[child.tag] = _xml_to_dict(child)
+        else:
+            text = (child.text or "").strip()
+            data[child.tag] = _parse_xml_number(text) if child.tag in _XML_NUMERIC_FIELDS else text
+    return data
+
+
+def _dict_to_xml(tag: str, data: Dict[str, Any]) -> ET.Element:
+    element = ET.Element(tag)
+    for key, value in data.items():
+        if isinstance(value, dict):
+            element.append(_dict_to_xml(key, value))
+        elif value is not None:
+            ET.SubElement(element, key).text = str(value)
+    return element
+
+
+# Журнал изменений в формате JSON Lines
+class JsonLinesJournal:
+    """Журнал операций: одна JSON-запись на строку, файл только дописывается.
+    
+    Записи: {"op": "put", "vehicle": {...}} и {"op": "delete", "id": "..."}.
+    Каждая запись сбрасывается на диск сразу, поэтому файл можно читать
+    через tail -f; недописанная последняя строка после сбоя отбрасывается.
+    """
+    
+    def __init__(self, filename: str, fsync: bool = False):
+        self.filename = filename
+        self.fsync = fsync
+        self._file = None
+    
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Чтение всех целых записей журнала по порядку"""
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.endswith("\n"):
+                    break  # Запись оборвана при сбое - игнорируем хвост
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"Corrupted journal record at line {line_number}: {e}")
+    
+    def _open(self):
+        if self._file is None:
+            self._truncate_partial_tail()
+            self._file = open(self.filename, 'a', encoding='utf-8')
+        return self._file
+    
+    def _truncate_partial_tail(self) -> None:
+        """Обрезка недописанной строки, чтобы новые записи не склеились с ней"""
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, 'rb+') as f:
+            size = f.seek(0, os.SEEK_END)
+            end = size
+            while end > 0:
+                f.seek(max(0, end - 4096))
+                block = f.read(end - max(0, end - 4096))
+                newline = block.rfind(b"\n")
+                if newline != -1:
+                    end = end - len(block) + newline + 1
+                    break
+                end -= len(block)
+            if end != size:
+                f.truncate(end)
+    
+    def append(self, *records: Dict[str, Any]) -> None:
+        """Дозапись одной или нескольких записей одним write"""
+        f = self._open()
+        f.write("".join(
+            json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for record in records
+        ))
+        f.flush()
+        if self.fsync:
+            os.fsync(f.fileno())
+    
+    def compact(self, vehicles: Iterable[Vehicle]) -> None:
+        """Перезапись журнала текущим состоянием (через временный файл и os.replace)"""
+        self.close()
+        tmp_filename = self.filename + ".tmp"
+        with open(tmp_filename, 'w', encoding='utf-8') as f:
+            for vehicle in vehicles:
+                f.write(json.dumps({"op": "put", "vehicle": vehicle.to_dict()},
+                                   ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, self.filename)
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Бинарный снимок для быстрого старта
+#
+# Формат (все числа little-endian, секции выровнены на 8 байт):
+#   заголовок    _SNAPSHOT_HEADER: магия, версия, число записей, смещения секций
+#   записи       count * _SNAPSHOT_RECORD фиксированной ширины; строки - номера
+#                в таблице строк (_NO_STRING, если значения нет)
+#   индекс ID    count * (u64 хеш id, u32 номер записи), отсортирован по хешу
+#   строки       u64 n, (n + 1) * u64 смещений, затем UTF-8 данные
+_SNAPSHOT_MAGIC = b"VHCLSNAP"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_HEADER = struct.Struct("<8sHHIQQQQ")
+_SNAPSHOT_RECORD = struct.Struct("<IIIiIIddIIiIIIdIB3x")
+_SNAPSHOT_INDEX_ENTRY = struct.Struct("<QI4x")
+_NO_STRING = 0xFFFFFFFF
+# Биты поля flags записи
+_SNAP_POWER_INT, _SNAP_BATTERY_INT, _SNAP_LOAD_INT = 1, 2, 4
+_SNAP_HAS_BATTERY, _SNAP_HAS_LOAD = 8, 16
+# Поля, которые лежат в фиксированной части записи; остальное - JSON в extra
+_SNAPSHOT_VEHICLE_FIELDS = {"id", "brand", "model", "year", "vehicle_type", "engine",
+                            "transmission", "body_type", "load_capacity"}
+_SNAPSHOT_ENGINE_FIELDS = {"type", "power", "battery_capacity", "fuel_type"}
+_SNAPSHOT_TRANSMISSION_FIELDS = {"type", "gears", "mode", "clutch_type"}
+
+
+def _id_hash(id: str) -> int:
+    """Стабильный между запусками 64-битный хеш ID (hash() рандомизирован)"""
+    return int.from_bytes(hashlib.blake2b(id.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def _align8(f) -> int:
+    position = f.tell()
+    if position % 8:
+        f.write(b"\0" * (8 - position % 8))
+    return f.tell()
+
+
+def write_snapshot(filename: str, vehicles: Iterable[Vehicle]) -> int:
+    """Запись машин в бинарный снимок; возвращает число записей.
+    
+    Снимок пишется во временный файл и подменяет старый через os.replace:
+    при ошибке старый снимок остается целым, а открытые через mmap
+    VehicleSnapshot продолжают читать прежний файл.
+    """
+    tmp_filename = filename + ".tmp"
+    try:
+        with open(tmp_filename, 'wb') as f:
+            count = _write_snapshot_file(f, vehicles)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+    return count
+
+
+def _write_snapshot_file(f, vehicles: Iterable[Vehicle]) -> int:
+    """Запись секций снимка в открытый файл; возвращает число записей"""
+    strings: Dict[str, int] = {}
+    
+    def string(value) -> int:
+        if value is None:
+            return _NO_STRING
+        code = strings.get(value)
+        if code is None:
+            code = strings[value] = len(strings)
+        return code
+    
+    pack = _SNAPSHOT_RECORD.pack
+    index: List[Tuple[int, int]] = []
+    f.write(b"\0" * _SNAPSHOT_HEADER.size)
+    records_offset = _align8(f)
+    for row, vehicle in enumerate(vehicles):
+        info = vehicle.to_dict()
+        engine, transmission = info["engine"], info["transmission"]
+        battery = engine.get("battery_capacity")
+        load = info.get("load_capacity")
+        flags = ((_SNAP_POWER_INT if type(engine["power"]) is int else 0)
+                 | (_SNAP_BATTERY_INT if type(battery) is int else 0)
+                 | (_SNAP_LOAD_INT if type(load) is int else 0)
+                 | (_SNAP_HAS_BATTERY if battery is not None else 0)
+                 | (_SNAP_HAS_LOAD if load is not None else 0))
+        # Все, что не помещается в фиксированные поля, - одной JSON-строкой
+        extra = {key: value for key, value in info.items() if key not in _SNAPSHOT_VEHICLE_FIELDS}
+        engine_extra = {k: v for k, v in engine.items() if k not in _SNAPSHOT_ENGINE_FIELDS}
+        transmission_extra = {k: v for k, v in transmission.items()
+                              if k not in _SNAPSHOT_TRANSMISSION_FIELDS}
+        if engine_extra:
+            extra["engine"] = engine_extra
+        if transmission_extra:
+            extra["transmission"] = transmission_extra
+        f.write(pack(
+            string(info["id"]), string(info["brand"]), string(info["model"]), info["year"],
+            string(info.get("vehicle_type")), string(engine["type"]), engine["power"],
+            battery or 0.0, string(engine.get("fuel_type")),
+            string(transmission["type"]), transmission["gears"],
+            string(transmission.get("mode")), string(transmission.get("clutch_type")),
+            string(info.get("body_type")), load or 0.0,
+            string(json.dumps(extra, ensure_ascii=False, separators=(",", ":")) if extra else None),
+            flags
+        ))
+        index.append((_id_hash(info["id"]), row))
+    
+    index_offset = _align8(f)
+    index.sort()
+    f.write(b"".join(_SNAPSHOT_INDEX_ENTRY.pack(key, row) for key, row in index))
+    
+    strings_offset = _align8(f)
+    encoded = [value.encode("utf-8") for value in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    f.write(struct.pack("<Q", len(encoded)))
+    f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+    f.write(b"".join(encoded))
+    
+    f.seek(0)
+    f.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, 0, 0, len(index),
+                                  records_offset, index_offset, strings_offset))
+    return len(index)
+
+
+class VehicleSnapshot:
+    """Снимок только для чтения поверх mmap.
+    
+    Открытие читает лишь заголовок; строки декодируются и машины собираются
+    при обращении. Поиск по ID - двоичный поиск по индексу хешей в файле.
+    """
+    
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, _, self._count, self._records_offset,
+         self._index_offset, strings_offset) = _SNAPSHOT_HEADER.unpack_from(self._mmap)
+        if magic != _SNAPSHOT_MAGIC:
+            raise ValueError(f"{filename} is not a vehicle snapshot")
+        if version != _SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+        string_count, = struct.unpack_from("<Q", self._mmap, strings_offset)
+        self._string_offsets = memoryview(self._mmap)[
+            strings_offset + 8:strings_offset + 8 + (string_count + 1) * 8].cast("Q")
+        self._strings_data = strings_offset + 8 + (string_count + 1) * 8
+        self._strings: Dict[int, str] = {}
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def _string(self, code: int) -> Optional[str]:
+        if code == _NO_STRING:
+            return None
+        value = self._strings.get(code)
+        if value is None:
+            start = self._strings_data + self._string_offsets[code]
+            end = self._strings_data + self._string_offsets[code + 1]
+            value = self._strings[code] = sys.intern(self._mmap[start:end].decode("utf-8"))
+        return value
+    
+    def row_of(self, id: str) -> Optional[int]:
+        """Номер записи по ID (двоичный поиск по хешам в файле)"""
+        key = _id_hash(id)
+        unpack, size, base = _SNAPSHOT_INDEX_ENTRY.unpack_from, _SNAPSHOT_INDEX_ENTRY.size, self._index_offset
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if unpack(self._mmap, base + mid * size)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        while lo < self._count:
+            entry_key, row = unpack(self._mmap, base + lo * size)
+            if entry_key != key:
+                break
+            if self.id_at(row) == id:  # Проверка на коллизию хешей
+                return row
+            lo += 1
+        return None
+    
+    def id_at(self, row: int) -> str:
+        code, = struct.unpack_from("<I", self._mmap, self._records_offset + row * _SNAPSHOT_RECORD.size)
+        return self._string(code)
+    
+    def to_dict(self, row: int) -> Dict[str, Any]:
+        """Запись в формате Vehicle.to_dict"""
+        if not 0 <= row < self._count:
+            raise IndexError(row)
+        (id, brand, model, year, vehicle_type, engine_type, power, battery, fuel_type,
+         transmission_type, gears, mode, clutch_type, body_type, load, extra, flags
+         ) = _SNAPSHOT_RECORD.unpack_from(self._mmap, self._records_offset + row * _SNAPSHOT_RECORD.size)
+        string = self._string
+        
+        engine: Dict[str, Any] = {"type": string(engine_type),
+                                  "power": int(power) if flags & _SNAP_POWER_INT else power}
+        if flags & _SNAP_HAS_BATTERY:
+            engine["battery_capacity"] = int(battery) if flags & _SNAP_BATTERY_INT else battery
+        if fuel_type != _NO_STRING:
+            engine["fuel_type"] = string(fuel_type)
+        transmission: Dict[str, Any] = {"type": string(transmission_type), "gears": gears}
+        if mode != _NO_STRING:
+            transmission["mode"] = string(mode)
+        if clutch_type != _NO_STRING:
+            transmission["clutch_type"] = string(clutch_type)
+        
+        data: Dict[str, Any] = {"id": string(id), "brand": string(brand), "model": string(model),
+                                "year": year, "engine": engine, "transmission": transmission}
+        if vehicle_type != _NO_STRING:
+            data["vehicle_type"] = string(vehicle_type)
+        if body_type != _NO_STRING:
+            data["body_type"] = string(body_type)
+        if flags & _SNAP_HAS_LOAD:
+            data["load_capacity"] = int(load) if flags & _SNAP_LOAD_INT else load
+        if extra != _NO_STRING:
+            rest = json.loads(string(extra))
+            engine.update(rest.pop("engine", {}))
+            transmission.update(rest.pop("transmission", {}))
+            data.update(rest)
+        return data
+    
+    def __getitem__(self, row: int) -> Vehicle:
+        return Vehicle.from_dict(self.to_dict(row))
+    
+    def __iter__(self) -> Iterator[Vehicle]:
+        for row in range(self._count):
+            yield self[row]
+    
+    def read(self, id: str) -> Optional[Vehicle]:
+        row = self.row_of(id)
+        return None if row is None else self[row]
+    
+    def close(self) -> None:
+        self._string_offsets.release()
+        self._mmap.close()
+
+
+@dataclass
+class BatchResult:
+    """Итог пакетной операции VehicleManager.*_many"""
+    ok: bool  # Пакет применен целиком
+    applied: int  # Сколько записей изменено (0, если пакет отклонен)
+    errors: List[str]  # Причины отклонения
+
+
+@lru_cache(maxsize=None)
+def _writable_attributes(cls: type) -> frozenset:
+    """Атрибуты экземпляра, доступные для setattr (слоты по всей иерархии)"""
+    return frozenset(name for klass in cls.__mro__ for name in getattr(klass, "__slots__", ()))
+
+
 # Менеджер для CRUD операций
 class VehicleManager:
-    def __init__(self):
-        self.laba1: List[Vehicle] = []
+    def __init__(self, indexes: Iterable[str] = ()):
+        # Первичный индекс: id -> Vehicle. dict сохраняет порядок вставки,
+        # поэтому read_all возвращает машины в том же порядке, что и раньше
+        self._store: Dict[str, Vehicle] = {}
+        # Снимок, подключенный через load_snapshot и еще не развернутый в _store,
+        # и уже собранные из него машины
+        self._snapshot: Optional[VehicleSnapshot] = None
+        self._snapshot_cache: Dict[str, Vehicle] = {}
+        # Вторичные индексы: имя поля -> HashIndex / SortedIndex
+        self._indexes: Dict[str, Any] = {}
+        # Журнал JSON Lines, если подключен через open_journal
+        self._journal: Optional[JsonLinesJournal] = None
+        for field in indexes:
+            self.create_index(field)
+    
+    @property
+    def _vehicles(self) -> Dict[str, Vehicle]:
+        """Первичный индекс; при подключенном снимке сначала разворачивает его"""
+        if self._snapshot is not None:
+            self._hydrate()
+        return self._store
+    
+    @_vehicles.setter
+    def _vehicles(self, vehicles: Dict[str, Vehicle]) -> None:
+        self._drop_snapshot()
+        self._store = vehicles
+    
+    @property
+    def laba1(self) -> Tuple[Vehicle, ...]:
+        """Все транспортные средства (для обратной совместимости)
+        
+        Только для чтения: кортеж не меняет менеджер, поэтому append и
+        удаление из него недоступны. Добавление - через create, замена
+        всего списка - присваиванием laba1.
+        """
+        return tuple(self._vehicles.values())
+    
+    @laba1.setter
+    def laba1(self, vehicles: List[Vehicle]) -> None:
+        self._replace_all(vehicles)
+    
+    def _replace_all(self, vehicles: Iterable[Vehicle]) -> None:
+        """Замена всего содержимого с перестройкой индексов и журнала"""
+        with _gc_paused():
+            self._vehicles = self._build_index(vehicles)
+            self._rebuild_indexes()
+        if self._journal:
+            self._journal.compact(self._vehicles.values())
+    
+    @staticmethod
+    def _build_index(vehicles) -> Dict[str, Vehicle]:
+        """Построение первичного индекса с проверкой уникальности ID"""
+        index: Dict[str, Vehicle] = {}
+        for vehicle in vehicles:
+            if vehicle.id in index:
+                raise ValueError(f"Duplicate vehicle id {vehicle.id}")
+            index[vehicle.id] = vehicle
+        return index
+    
+    def create_index(self, field: str) -> None:
+        """Создание вторичного индекса по полю из QUERY_FIELDS"""
+        if field not in QUERY_FIELDS:
+            raise ValueError(f"Unknown query field {field}")
+        index_class = SortedIndex if field in SORTED_INDEX_FIELDS else HashIndex
+        index = index_class(field)
+        for vehicle in self._vehicles.values():
+            index.add(vehicle)
+        self._indexes[field] = index
+    
+    def drop_index(self, field: str) -> None:
+        """Удаление вторичного индекса"""
+        self._indexes.pop(field, None)
+    
+    def _rebuild_indexes(self) -> None:
+        for field in list(self._indexes):
+            self.create_index(field)
+    
+    def _index_add(self, vehicle: Vehicle) -> None:
+        for index in self._indexes.values():
+            index.add(vehicle)
+    
+    def _index_remove(self, id: str) -> None:
+        for index in self._indexes.values():
+            index.remove(id)
+    
+    def _index_add_many(self, vehicles: List[Vehicle]) -> None:
+        for index in self._indexes.values():
+            index.add_many(vehicles)
+    
+    def _index_remove_many(self, ids: List[str]) -> None:
+        for index in self._indexes.values():
+            index.remove_many(ids)
+    
+    def query(self, **conditions) -> Iterator[Vehicle]:
+        """Поиск по условиям вида поле=значение или поле__оператор=значение.
+        
+        Операторы: eq, in, gt, gte, lt, lte. Например:
+        query(engine_type="Electric", year__gte=2022, power__gt=150).
+        Возвращает ленивый итератор; менять менеджер во время обхода нельзя.
+        Индексы видят только изменения через create/update/delete.
+        """
+        predicates: Dict[str, List[Tuple[str, Any]]] = {}
+        for name, arg in conditions.items():
+            field, _, op = name.partition("__")
+            op = op or "eq"
+            if field not in QUERY_FIELDS:
+                raise ValueError(f"Unknown query field {field}")
+            if op not in _QUERY_OPERATORS:
+                raise ValueError(f"Unknown query operator {op}")
+            predicates.setdefault(field, []).append((op, arg))
+        
+        # Выбираем индекс с наименьшим числом кандидатов
+        best_field, best_size = None, len(self._vehicles)
+        for field, field_predicates in predicates.items():
+            index = self._indexes.get(field)
+            if index is None:
+                continue
+            usable = [p for p in field_predicates if p[0] in index.operators]
+            if isinstance(index, HashIndex):
+                usable = usable[:1]
+            if len(usable) != len(field_predicates):
+                continue
+            size = index.estimate(usable)
+            if size <= best_size:
+                best_field, best_size = field, size
+        
+        if best_field is None:
+            candidates: Iterable[Vehicle] = self._vehicles.values()
+        else:
+            vehicles = self._vehicles
+            ids = self._indexes[best_field].lookup(predicates.pop(best_field))
+            candidates = (vehicles[id] for id in ids)
+        
+        checks = [
+            (QUERY_FIELDS[field], _QUERY_OPERATORS[op], arg)
+            for field, field_predicates in predicates.items()
+            for op, arg in field_predicates
+        ]
+        if not checks:
+            return iter(candidates)
+        return (
+            vehicle for vehicle in candidates
+            if all(check(get_key(vehicle), arg) for get_key, check, arg in checks)
+        )
+    
+    def __len__(self) -> int:
+        if self._snapshot is not None:
+            return len(self._snapshot)
+        return len(self._store)
+    
+    def __contains__(self, id: str) -> bool:
+        if self._snapshot is not None:
+            return id in self._snapshot_cache or self._snapshot.row_of(id) is not None
+        return id in self._store
     
-    def create(self, vehicle: Vehicle) -> None:
+    def create(self, vehicle: Vehicle) -> bool:
         """Создание нового транспортного средства"""
-        self.laba1.append(vehicle)
-        print(f"Vehicle {vehicle.id} created successfully")
+        if vehicle.id in self._vehicles:
+            logger.warning("Vehicle with id %s already exists", vehicle.id)
+            return False
+        if self._journal:
+            self._journal.append({"op": "put", "vehicle": vehicle.to_dict()})
+        self._vehicles[vehicle.id] = vehicle
+        self._index_add(vehicle)
+        logger.info("Vehicle %s created successfully", vehicle.id)
+        return True
     
     def read(self, id: str) -> Optional[Vehicle]:
         """Чтение транспортного средства по ID"""
-        for vehicle in self.laba1:
-            if vehicle.id == id:
-                return vehicle
-        print(f"Vehicle with id {id} not found")
-        return None
+        if self._snapshot is not None:
+            vehicle = self._snapshot_cache.get(id)
+            if vehicle is None:
+                vehicle = self._snapshot.read(id)
+                if vehicle is not None:
+                    self._snapshot_cache[id] = vehicle
+        else:
+            vehicle = self._store.get(id)
+        if vehicle is None:
+            logger.info("Vehicle with id %s not found", id)
+        return vehicle
     
     def read_all(self) -> List[Vehicle]:
         """Получение всех транспортных средств"""
-        return self.laba1.copy()
+        return list(self._vehicles.values())
     
     def update(self, id: str, **kwargs) -> bool:
-        """Обновление транспортного средства"""
+        """Обновление транспортного средства.
+        
+        Если новое значение нельзя проиндексировать (например, year="2021"
+        рядом с числами), старые значения и индексы восстанавливаются,
+        а исключение пробрасывается.
+        """
         vehicle = self.read(id)
         if vehicle:
-            for key, value in kwargs.items():
-                if hasattr(vehicle, key):
+            if self._indexes:
+                self._index_remove(id)
+            old_values: Dict[str, Any] = {}
+            try:
+                for key, value in kwargs.items():
+                    if hasattr(vehicle, key):
+                        old_value = getattr(vehicle, key)
+                        try:
+                            setattr(vehicle, key, value)
+                        except AttributeError:  # Атрибут класса (vehicle_type) не меняется
+                            logger.warning("%s is read-only", key)
+                        else:
+                            old_values.setdefault(key, old_value)
+                    else:
+                        logger.warning("%s is not a valid attribute", key)
+                if self._indexes:
+                    self._index_add(vehicle)
+            except Exception:
+                for key, value in old_values.items():
                     setattr(vehicle, key, value)
-                else:
-                    print(f"Warning: {key} is not a valid attribute")
-            print(f"Vehicle {id} updated successfully")
+                for index in self._indexes.values():
+                    if id in index.keys:  # Индексы, успевшие принять новое значение
+                        index.remove(id)
+                self._index_add(vehicle)
+                raise
+            if self._journal:
+                self._journal.append({"op": "put", "vehicle": vehicle.to_dict()})
+            logger.info("Vehicle %s updated successfully", id)
             return True
         return False
     
     def delete(self, id: str) -> bool:
         """Удаление транспортного средства"""
-        vehicle = self.read(id)
+        if self._journal and id in self._vehicles:
+            self._journal.append({"op": "delete", "id": id})
+        vehicle = self._vehicles.pop(id, None)
         if vehicle:
-            self.laba1.remove(vehicle)
-            print(f"Vehicle {id} deleted successfully")
+            self._index_remove(id)
+            logger.info("Vehicle %s deleted successfully", id)
             return True
+        logger.info("Vehicle with id %s not found", id)
         return False
     
+    def create_many(self, vehicles: Iterable[Vehicle]) -> 'BatchResult':
+        """Пакетное создание: весь пакет проверяется и применяется целиком или не применяется"""
+        vehicles = list(vehicles)
+        errors = []
+        seen = set()
+        store = self._vehicles
+        for vehicle in vehicles:
+            if not isinstance(vehicle, Vehicle):
+                errors.append(f"{vehicle!r} is not a Vehicle")
+            elif vehicle.id in store or vehicle.id in seen:
+                errors.append(f"Vehicle with id {vehicle.id} already exists")
+            else:
+                seen.add(vehicle.id)
+        if errors:
+            logger.warning("create_many rejected: %d errors", len(errors))
+            return BatchResult(False, 0, errors)
+        
+        if self._journal:
+            self._journal.append(*({"op": "put", "vehicle": v.to_dict()} for v in vehicles))
+        for vehicle in vehicles:
+            store[vehicle.id] = vehicle
+        self._index_add_many(vehicles)
+        logger.info("%d vehicles created", len(vehicles))
+        return BatchResult(True, len(vehicles), [])
+    
+    def update_many(self, updates) -> 'BatchResult':
+        """Пакетное обновление: {id: {атрибут: значение}} или пары (id, словарь).
+        
+        В отличие от update, неизвестный или read-only атрибут отклоняет весь пакет.
+        """
+        items = list(updates.items() if isinstance(updates, dict) else updates)
+        errors = []
+        seen = set()
+        store = self._vehicles
+        for id, changes in items:
+            vehicle = store.get(id)
+            if vehicle is None:
+                errors.append(f"Vehicle with id {id} not found")
+                continue
+            if id in seen:
+                errors.append(f"Vehicle {id} is updated twice")
+            seen.add(id)
+            writable = _writable_attributes(type(vehicle))
+            errors.extend(f"{key} is not a writable attribute of vehicle {id}"
+                          for key in changes if key not in writable or key == "id")
+        if errors:
+            logger.warning("update_many rejected: %d errors", len(errors))
+            return BatchResult(False, 0, errors)
+        
+        ids = [id for id, _ in items]
+        vehicles = [store[id] for id in ids]
+        if self._indexes:
+            self._index_remove_many(ids)
+        for vehicle, (_, changes) in zip(vehicles, items):
+            for key, value in changes.items():
+                setattr(vehicle, key, value)
+        if self._indexes:
+            self._index_add_many(vehicles)
+        if self._journal:
+            self._journal.append(*({"op": "put", "vehicle": v.to_dict()} for v in vehicles))
+        logger.info("%d vehicles updated", len(vehicles))
+        return BatchResult(True, len(vehicles), [])
+    
+    def delete_many(self, ids: Iterable[str]) -> 'BatchResult':
+        """Пакетное удаление: все ID должны существовать, иначе ничего не удаляется"""
+        ids = list(ids)
+        store = self._vehicles
+        errors = [f"Vehicle with id {id} not found" for id in ids if id not in store]
+        if len(set(ids)) != len(ids):
+            errors.append("Duplicate ids in batch")
+        if errors:
+            logger.warning("delete_many rejected: %d errors", len(errors))
+            return BatchResult(False, 0, errors)
+        
+        if self._journal:
+            self._journal.append(*({"op": "delete", "id": id} for id in ids))
+        for id in ids:
+            del store[id]
+        self._index_remove_many(ids)
+        logger.info("%d vehicles deleted", len(ids))
+        return BatchResult(True, len(ids), [])
+    
     def save_to_json(self, filename: str) -> None:
-        """Сохранение в JSON файл"""
+        """Сохранение в JSON файл (записи пишутся по одной, формат как у json.dump с indent=2)"""
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump([v.to_dict() for v in self.laba1], f, indent=2, ensure_ascii=False)
-            print(f"Data saved to {filename} successfully")
+                f.write("[")
+                separator = "\n  "
+                for vehicle in self._vehicles.values():
+                    f.write(separator)
+                    f.write(json.dumps(vehicle.to_dict(), indent=2, ensure_ascii=False)
+                            .replace("\n", "\n  "))
+                    separator = ",\n  "
+                f.write("]" if separator == "\n  " else "\n]")
+            logger.info("Data saved to %s successfully", filename)
         except Exception as e:
-            print(f"Error saving to JSON: {e}")
+            logger.error("Error saving to JSON: %s", e)
+    
+    @staticmethod
+    def iter_json(
+        filename: str,
+        progress: Optional[Callable[[int, int, int], None]] = None,
+        progress_every: int = 10000,
+        chunk_size: int = 1 << 16
+    ) -> Iterator[Vehicle]:
+        """Потоковое чтение машин из JSON файла по мере разбора.
+        
+        progress(загружено_записей, прочитано_байт, размер_файла) вызывается
+        каждые progress_every записей и один раз в конце.
+        """
+        total = os.path.getsize(filename)
+        with open(filename, 'r', encoding='utf-8') as f:
+            count = 0
+            for item in iter_json_array(f, chunk_size):
+                yield Vehicle.from_dict(item)
+                count += 1
+                if progress and count % progress_every == 0:
+                    progress(count, f.buffer.tell(), total)
+            if progress:
+                progress(count, total, total)
     
-    def load_from_json(self, filename: str) -> None:
-        """Загрузка из JSON файла"""
+    def load_from_json(
+        self,
+        filename: str,
+        progress: Optional[Callable[[int, int, int], None]] = None
+    ) -> None:
+        """Загрузка из JSON файла (потоковая: машины вставляются по мере разбора)"""
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            self.laba1 = [Vehicle.from_dict(item) for item in data]
-            print(f"Data loaded from {filename} successfully")
+            self._replace_all(self.iter_json(filename, progress))
+            logger.info("Data loaded from %s successfully", filename)
         except Exception as e:
-            print(f"Error loading from JSON: {e}")
+            logger.error("Error loading from JSON: %s", e)
+    
+    def save_to_xml(self, filename: str) -> None:
+        """Сохранение в XML файл (записи пишутся по одной)"""
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write("<vehicles>\n")
+                for vehicle in self._vehicles.values():
+                    element = _dict_to_xml("vehicle", vehicle.to_dict())
+                    ET.indent(element, space="  ", level=1)
+                    f.write("  ")
+                    f.write(ET.tostring(element, encoding="unicode"))
+                    f.write("\n")
+                f.write("</vehicles>\n")
+            logger.info("Data saved to %s successfully", filename)
+        except Exception as e:
+            logger.error("Error saving to XML: %s", e)
+    
+    @staticmethod
+    def iter_xml(
+        filename: str,
+        progress: Optional[Callable[[int, int, int], None]] = None,
+        progress_every: int = 10000
+    ) -> Iterator[Vehicle]:
+        """Потоковое чтение <vehicles> через iterparse с очисткой разобранных элементов"""
+        total = os.path.getsize(filename)
+        with open(filename, 'rb') as f:
+            context = ET.iterparse(f, events=("start", "end"))
+            _, root = next(context)
+            count = 0
+            for event, element in context:
+                if event == "end" and element.tag == "vehicle":
+                    yield Vehicle.from_dict(_xml_to_dict(element))
+                    root.clear()  # Освобождаем уже обработанные <vehicle>
+                    count += 1
+                    if progress and count % progress_every == 0:
+                        progress(count, f.tell(), total)
+            if progress:
+                progress(count, total, total)
+    
+    def load_from_xml(
+        self,
+        filename: str,
+        progress: Optional[Callable[[int, int, int], None]] = None
+    ) -> None:
+        """Загрузка из XML файла (потоковая)"""
+        try:
+            self._replace_all(self.iter_xml(filename, progress))
+            logger.info("Data loaded from %s successfully", filename)
+        except Exception as e:
+            logger.error("Error loading from XML: %s", e)
+
+    def open_journal(self, filename: str, fsync: bool = False) -> None:
+        """Подключение журнала JSON Lines: состояние восстанавливается из него,
+        дальше create/update/delete дописывают в него по одной строке"""
+        self.close_journal()
+        journal = JsonLinesJournal(filename, fsync)
+        vehicles: Dict[str, Vehicle] = {}
+        with _gc_paused():
+            for record in journal.replay():
+                if record["op"] == "put":
+                    vehicle = Vehicle.from_dict(record["vehicle"])
+                    vehicles[vehicle.id] = vehicle
+                elif record["op"] == "delete":
+                    vehicles.pop(record["id"], None)
+                else:
+                    raise ValueError(f"Unknown journal operation {record['op']}")
+            self._vehicles = vehicles
+            self._rebuild_indexes()
+        self._journal = journal
+        logger.info("Journal %s opened: %d vehicles", filename, len(vehicles))
+    
+    def compact_journal(self) -> None:
+        """Сжатие журнала: одна запись put на каждую текущую машину"""
+        if self._journal is None:
+            raise RuntimeError("Journal is not open")
+        self._journal.compact(self._vehicles.values())
+        logger.info("Journal %s compacted", self._journal.filename)
+    
+    def close_journal(self) -> None:
+        """Отключение журнала"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+    
+    def save_snapshot(self, filename: str) -> None:
+        """Сохранение в бинарный снимок (см. write_snapshot)"""
+        try:
+            count = write_snapshot(filename, self._vehicles.values())
+            logger.info("Snapshot of %d vehicles saved to %s", count, filename)
+        except Exception as e:
+            logger.error("Error saving snapshot: %s", e)
+            raise  # Неудачное сохранение не должно выглядеть успешным
+    
+    def load_snapshot(self, filename: str) -> None:
+        """Подключение бинарного снимка через mmap без чтения записей.
+        
+        read(id), len и in работают прямо по снимку и собирают только
+        запрошенные машины; остальные операции сначала разворачивают снимок.
+        """
+        try:
+            snapshot = VehicleSnapshot(filename)
+        except Exception as e:
+            logger.error("Error loading snapshot: %s", e)
+            return
+        self._drop_snapshot()
+        self._store = {}
+        self._snapshot = snapshot
+        if self._indexes or self._journal:
+            self._hydrate()
+            if self._journal:
+                self._journal.compact(self._store.values())
+        logger.info("Snapshot %s loaded: %d vehicles", filename, len(snapshot))
+    
+    def _hydrate(self) -> None:
+        """Сборка всех машин снимка в _store (уже прочитанные объекты сохраняются)"""
+        snapshot, cache = self._snapshot, self._snapshot_cache
+        self._snapshot, self._snapshot_cache = None, {}
+        store: Dict[str, Vehicle] = {}
+        with _gc_paused():
+            for row in range(len(snapshot)):
+                id = snapshot.id_at(row)
+                vehicle = cache.get(id)
+                store[id] = vehicle if vehicle is not None else snapshot[row]
+            self._store = store
+            self._rebuild_indexes()
+        snapshot.close()
+    
+    def _drop_snapshot(self) -> None:
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot, self._snapshot_cache = None, {}
+    
+    def to_columnar(self) -> 'ColumnarVehicleStore':
+        """Колоночная копия парка для аналитики"""
+        return ColumnarVehicleStore(self._vehicles.values())
+
+# Колоночное хранилище для аналитических запросов
+class DictionaryColumn:
+    """Строковый столбец со словарным кодированием: коды в array('I') + таблица значений"""
+    __slots__ = ("codes", "values", "code_of")
+    
+    def __init__(self):
+        self.codes = array("I")
+        self.values: List[Any] = []
+        self.code_of: Dict[Any, int] = {}
+    
+    def encode(self, value) -> int:
+        code = self.code_of.get(value)
+        if code is None:
+            code = self.code_of[value] = len(self.values)
+            self.values.append(value)
+        return code
+    
+    def __getitem__(self, row: int):
+        return self.values[self.codes[row]]
+
+
+_NAN = float("nan")
+# Числовые столбцы: имя -> typecode array. Отсутствующее значение в 'd' - NaN
+NUMERIC_COLUMNS = {"year": "i", "power": "d", "gears": "i", "battery_capacity": "d", "load_capacity": "d"}
+CATEGORICAL_COLUMNS = (
+    "brand", "model", "vehicle_type", "engine_type", "fuel_type",
+    "transmission_type", "mode", "clutch_type", "body_type"
+)
+# Флаги строки: числа, которые были int (чтобы read вернул 150, а не 150.0)
+_INT_FLAGS = {"power": 1, "battery_capacity": 2, "load_capacity": 4}
+# Поля, у которых есть столбцы. Поля зарегистрированных классов сверх них
+# (например, tank у нового типа двигателя) хранятся в ColumnarVehicleStore.custom
+_ENGINE_COLUMNS = frozenset({"type", "power", "battery_capacity", "fuel_type"})
+_TRANSMISSION_COLUMNS = frozenset({"type", "gears", "mode", "clutch_type"})
+_VEHICLE_COLUMNS = frozenset({"body_type", "load_capacity"})
+_COLUMN_CLASSES = frozenset({ElectricEngine, CombustionEngine, AutoTransmission, ManualTransmission})
+
+
+class ColumnarVehicleStore:
+    """Парк машин в виде столбцов (struct-of-arrays).
+    
+    Числа хранятся в типизированных array, строки - словарными кодами.
+    Агрегаты и фильтры проходят по столбцам, не создавая объектов Vehicle;
+    read(id) собирает настоящий Car/Truck (или другой зарегистрированный тип)
+    из строки по требованию через ENGINE_TYPES/TRANSMISSION_TYPES/VEHICLE_TYPES.
+    Условия задаются как в VehicleManager.query: поле=значение, поле__gte=...
+    """
+    
+    def __init__(self, vehicles: Iterable[Vehicle] = ()):
+        self.ids: List[str] = []
+        self.row_of: Dict[str, int] = {}
+        self.alive = bytearray()
+        self.flags = bytearray()
+        self.numeric = {name: array(code) for name, code in NUMERIC_COLUMNS.items()}
+        self.categorical = {name: DictionaryColumn() for name in CATEGORICAL_COLUMNS}
+        self.extra: Dict[int, Dict[str, Any]] = {}  # Редкие поля: строка -> Vehicle.extra
+        self.custom: Dict[int, Dict[str, Dict[str, Any]]] = {}  # Строка -> поля частей вне столбцов
+        self._dead = 0
+        for vehicle in vehicles:
+            self.add(vehicle)
+    
+    def __len__(self) -> int:
+        return len(self.row_of)
+    
+    def __contains__(self, id: str) -> bool:
+        return id in self.row_of
+    
+    @staticmethod
+    def _custom_fields(vehicle: Vehicle) -> Dict[str, Dict[str, Any]]:
+        """Поля двигателя, трансмиссии и машины, для которых нет столбцов"""
+        custom = {}
+        for part, part_columns in (("engine", _ENGINE_COLUMNS), ("transmission", _TRANSMISSION_COLUMNS)):
+            component = getattr(vehicle, part)
+            if type(component) not in _COLUMN_CLASSES:
+                fields = {k: v for k, v in component.get_info().items() if k not in part_columns}
+                if fields:
+                    custom[part] = fields
+        fields = {f: getattr(vehicle, f) for f in type(vehicle)._fields if f not in _VEHICLE_COLUMNS}
+        if fields:
+            custom["vehicle"] = fields
+        return custom
+    
+    @staticmethod
+    def _split(vehicle: Vehicle) -> Tuple[Dict[str, Any], Dict[str, Any], int]:
+        """Разложение машины на числовые и строковые значения столбцов"""
+        engine, transmission = vehicle.engine, vehicle.transmission
+        numbers = {
+            "year": vehicle.year,
+            "power": engine.power,
+            "gears": transmission.gears,
+            "battery_capacity": getattr(engine, "battery_capacity", None),
+            "load_capacity": getattr(vehicle, "load_capacity", None),
+        }
+        strings = {
+            "brand": vehicle.brand,
+            "model": vehicle.model,
+            "vehicle_type": vehicle.vehicle_type,
+            "engine_type": engine.type,
+            "fuel_type": getattr(engine, "fuel_type", None),
+            "transmission_type": transmission.type,
+            "mode": getattr(transmission, "mode", None),
+            "clutch_type": getattr(transmission, "clutch_type", None),
+            "body_type": getattr(vehicle, "body_type", None),
+        }
+        flags = 0
+        for name, bit in _INT_FLAGS.items():
+            if type(numbers[name]) is int:
+                flags |= bit
+            if numbers[name] is None:
+                numbers[name] = _NAN
+        return numbers, strings, flags
+    
+    def add(self, vehicle: Vehicle) -> bool:
+        """Добавление машины в конец столбцов"""
+        if vehicle.id in self.row_of:
+            return False
+        numbers, strings, flags = self._split(vehicle)
+        row = len(self.ids)
+        for name, value in numbers.items():
+            self.numeric[name].append(value)
+        for name, value in strings.items():
+            column = self.categorical[name]
+            column.codes.append(column.encode(value))
+        self.ids.append(vehicle.id)
+        self.row_of[vehicle.id] = row
+        self.alive.append(1)
+        self.flags.append(flags)
+        if vehicle.extra:
+            self.extra[row] = dict(vehicle.extra)
+        custom = self._custom_fields(vehicle)
+        if custom:
+            self.custom[row] = custom
+        return True
+    
+    def _materialize(self, row: int) -> Vehicle:
+        """Сборка настоящего объекта Vehicle/Car/Truck из строки столбцов"""
+        numbers = {name: column[row] for name, column in self.numeric.items()}
+        strings = {name: column[row] for name, column in self.categorical.items()}
+        flags = self.flags[row]
+        for name, bit in _INT_FLAGS.items():
+            if flags & bit:
+                numbers[name] = int(numbers[name])
+        
+        # Классы выбираются по реестрам, как в Vehicle.from_dict; _from_fields
+        # читают только свои поля, поэтому им передаются все столбцы строки
+        engine_class = ENGINE_TYPES.get(strings["engine_type"])
+        transmission_class = TRANSMISSION_TYPES.get(strings["transmission_type"])
+        vehicle_class = VEHICLE_TYPES.get(strings["vehicle_type"])
+        if engine_class is None:
+            raise ValueError(f"Unknown engine type {strings['engine_type']}")
+        if transmission_class is None:
+            raise ValueError(f"Unknown transmission type {strings['transmission_type']}")
+        if vehicle_class is None:
+            raise ValueError(f"Unknown vehicle type {strings['vehicle_type']}")
+        
+        custom = self.custom.get(row, {})
+        engine = engine_class._from_fields({
+            "type": strings["engine_type"], "power": numbers["power"],
+            "battery_capacity": numbers["battery_capacity"], "fuel_type": strings["fuel_type"],
+            **custom.get("engine", {})
+        })
+        transmission = transmission_class._from_fields({
+            "type": strings["transmission_type"], "gears": numbers["gears"],
+            "mode": strings["mode"], "clutch_type": strings["clutch_type"],
+            **custom.get("transmission", {})
+        })
+        vehicle = vehicle_class._from_fields({
+            "id": self.ids[row], "brand": strings["brand"], "model": strings["model"], "year": numbers["year"],
+            "body_type": strings["body_type"], "load_capacity": numbers["load_capacity"],
+            **custom.get("vehicle", {})
+        }, engine, transmission)
+        if row in self.extra:
+            vehicle.extra = dict(self.extra[row])
+        return vehicle
+    
+    def read(self, id: str) -> Optional[Vehicle]:
+        """Чтение машины по ID (собирается из столбцов)"""
+        row = self.row_of.get(id)
+        return None if row is None else self._materialize(row)
+    
+    def read_all(self) -> List[Vehicle]:
+        return [self._materialize(row) for row in compress(range(len(self.ids)), self.alive)]
+    
+    def update(self, id: str, **kwargs) -> bool:
+        """Обновление: машина собирается, меняется через setattr и записывается обратно.
+        
+        Как и VehicleManager.update, неизвестные и read-only атрибуты пропускаются с предупреждением.
+        """
+        row = self.row_of.get(id)
+        if row is None:
+            return False
+        vehicle = self._materialize(row)
+        for key, value in kwargs.items():
+            if hasattr(vehicle, key):
+                try:
+                    setattr(vehicle, key, value)
+                except AttributeError:  # Атрибут класса (vehicle_type) не меняется
+                    logger.warning("%s is read-only", key)
+            else:
+                logger.warning("%s is not a valid attribute", key)
+        numbers, strings, flags = self._split(vehicle)
+        for name, value in numbers.items():
+            self.numeric[name][row] = value
+        for name, value in strings.items():
+            column = self.categorical[name]
+            column.codes[row] = column.encode(value)
+        self.flags[row] = flags
+        self.extra.pop(row, None)
+        if vehicle.extra:
+            self.extra[row] = dict(vehicle.extra)
+        self.custom.pop(row, None)
+        custom = self._custom_fields(vehicle)
+        if custom:
+            self.custom[row] = custom
+        return True
+    
+    def delete(self, id: str) -> bool:
+        """Удаление: строка помечается мертвой, столбцы периодически уплотняются"""
+        row = self.row_of.pop(id, None)
+        if row is None:
+            return False
+        self.alive[row] = 0
+        self.extra.pop(row, None)
+        self.custom.pop(row, None)
+        self._dead += 1
+        if self._dead > 1024 and self._dead * 2 > len(self.ids):
+            self.compact()
+        return True
+    
+    def compact(self) -> None:
+        """Удаление мертвых строк из всех столбцов"""
+        alive = self.alive
+        old_rows = list(compress(range(len(self.ids)), alive))
+        self.ids = list(compress(self.ids, alive))
+        for name, column in self.numeric.items():
+            self.numeric[name] = array(column.typecode, compress(column, alive))
+        for column in self.categorical.values():
+            column.codes = array("I", compress(column.codes, alive))
+        self.flags = bytearray(compress(self.flags, alive))
+        self.extra = {new: self.extra[old] for new, old in enumerate(old_rows) if old in self.extra}
+        self.custom = {new: self.custom[old] for new, old in enumerate(old_rows) if old in self.custom}
+        self.row_of = {id: row for row, id in enumerate(self.ids)}
+        self.alive = bytearray(b"\x01" * len(self.ids))
+        self._dead = 0
+    
+    def _column(self, name: str):
+        """Столбец значений (для строковых - столбец кодов) и его словарь"""
+        if name in self.numeric:
+            return self.numeric[name], None
+        if name in self.categorical:
+            column = self.categorical[name]
+            return column.codes, column
+        raise ValueError(f"Unknown column {name}")
+    
+    def mask(self, **conditions) -> bytearray:
+        """Битовая маска строк (по байту на строку), подходящих под все условия"""
+        result = int.from_bytes(self.alive, "little")
+        size = len(self.alive)
+        for name, arg in conditions.items():
+            field, _, op = name.partition("__")
+            op = op or "eq"
+            if op not in _QUERY_OPERATORS:
+                raise ValueError(f"Unknown query operator {op}")
+            values, dictionary = self._column(field)
+            if dictionary is not None:
+                # Строки сравниваются по кодам; диапазонные условия - по декодированным значениям
+                if op == "eq":
+                    code = dictionary.code_of.get(arg, -1)
+                    matches = map(operator.eq, values, repeat(code))
+                elif op == "in":
+                    codes = {dictionary.code_of[v] for v in arg if v in dictionary.code_of}
+                    matches = map(codes.__contains__, values)
+                else:
+                    check = _QUERY_OPERATORS[op]
+                    accepted = {code for code, value in enumerate(dictionary.values)
+                                if value is not None and check(value, arg)}
+                    matches = map(accepted.__contains__, values)
+            elif op == "in":
+                matches = map(set(arg).__contains__, values)
+            else:
+                matches = map(_QUERY_OPERATORS[op], values, repeat(arg))
+            result &= int.from_bytes(bytes(matches), "little")
+        return bytearray(result.to_bytes(size, "little"))
+    
+    def filter(self, **conditions) -> Iterator[str]:
+        """ID машин, подходящих под условия (ленивый итератор)"""
+        return compress(self.ids, self.mask(**conditions))
+    
+    def values(self, column: str, **conditions) -> Iterator[Any]:
+        """Значения столбца для подходящих строк (без NaN-пропусков)"""
+        values, dictionary = self._column(column)
+        selected = compress(values, self.mask(**conditions))
+        if dictionary is not None:
+            return map(dictionary.values.__getitem__, selected)
+        if values.typecode == "d":
+            return (value for value in selected if value == value)
+        return selected
+    
+    def _groups(self, column: str, by: str, conditions) -> Dict[Any, List[Any]]:
+        keys, dictionary = self._column(by)
+        values, _ = self._column(column)
+        mask = self.mask(**conditions)
+        groups: Dict[Any, List[Any]] = {}
+        for key, value in compress(zip(keys, values), mask):
+            if value == value:  # NaN != NaN
+                groups.setdefault(key, []).append(value)
+        if dictionary is not None:
+            groups = {dictionary.values[code]: group for code, group in groups.items()}
+        return groups
+    
+    def count(self, by: Optional[str] = None, **conditions):
+        """Количество машин, всего или по группам"""
+        mask = self.mask(**conditions)
+        if by is None:
+            return mask.count(1)
+        keys, dictionary = self._column(by)
+        counts: Dict[Any, int] = {}
+        for key in compress(keys, mask):
+            counts[key] = counts.get(key, 0) + 1
+        if dictionary is not None:
+            counts = {dictionary.values[code]: count for code, count in counts.items()}
+        return counts
+    
+    def aggregate(self, column: str, func: Callable[[List[Any]], Any] = sum,
+                  by: Optional[str] = None, **conditions):
+        """Агрегат по числовому столбцу, всего или по группам"""
+        if by is None:
+            return func(list(self.values(column, **conditions)))
+        return {key: func(group) for key, group in self._groups(column, by, conditions).items()}
+    
+    def mean(self, column: str, by: Optional[str] = None, **conditions):
+        """Среднее значение столбца (None для пустой выборки)"""
+        return self.aggregate(column, lambda values: math.fsum(values) / len(values) if values else None,
+                              by, **conditions)
+    
+    def histogram(self, column: str, bins: int = 10,
+                  value_range: Optional[Tuple[float, float]] = None,
+                  **conditions) -> Tuple[List[float], List[int]]:
+        """Гистограмма числового столбца: (границы корзин, количества)"""
+        values = list(self.values(column, **conditions))
+        if value_range is None:
+            value_range = (min(values), max(values)) if values else (0.0, 1.0)
+        low, high = value_range
+        width = (high - low) / bins or 1.0
+        counts = [0] * bins
+        for value in values:
+            if low <= value <= high:
+                counts[min(int((value - low) / width), bins - 1)] += 1
+        return [low + width * i for i in range(bins + 1)], counts
+
 
 # Пример использования
 def main():
     """Демонстрация работы системы"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     manager = VehicleManager()
     
     # Создание различных транспортных средств
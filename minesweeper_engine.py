@@ -0,0 +1,298 @@
+import random
+from typing import List, Optional, Tuple
+
+# Стандартные уровни сложности: (строки, столбцы, мины)
+DIFFICULTIES = {
+    "easy": (9, 9, 10),
+    "medium": (16, 16, 40),
+    "hard": (16, 30, 99),
+}
+
+# Байт клетки в Board.cells: младшие 4 бита - число мин вокруг, выше - флаги
+NUMBER_MASK = 0x0F
+MINE = 0x10
+REVEALED = 0x20
+FLAGGED = 0x40
+BORDER = 0x80  # Рамка вокруг поля: заливка и соседи не требуют проверки границ
+
+_INVERT = bytes.maketrans(b"\x00\x01", b"\x01\x00")
+_MINE_BYTES = bytes(1 if value & MINE else 0 for value in range(256))
+_FLAG_BYTES = bytes(1 if value & FLAGGED else 0 for value in range(256))
+
+
+def _indices(marks: bytes) -> List[int]:
+    """Индексы байтов, равных 1 (поиск find идет на уровне C)"""
+    found = []
+    i = marks.find(1)
+    while i != -1:
+        found.append(i)
+        i = marks.find(1, i + 1)
+    return found
+
+
+def choose_cells(rng: random.Random, cells: int, count: int, excluded: List[int]) -> bytearray:
+    """Ровно count случайных клеток (байт 1) из cells, кроме excluded; count <= свободных / 2
+
+    Сначала каждая клетка выбирается с вероятностью, округленной вниз до
+    1/256: randbytes и translate работают на уровне C. Затем недостающие
+    клетки добавляются, а лишние (разброс) снимаются по одной случайно.
+    Процедура симметрична относительно перестановок свободных клеток,
+    поэтому все наборы из count клеток равновероятны. Невыбранных клеток
+    при доборе не меньше половины, так что попыток на клетку в среднем
+    не больше двух при любой плотности.
+    """
+    free = cells - len(excluded)
+    threshold = count * 256 // free if free else 0
+    table = bytes(1 if value < threshold else 0 for value in range(256))
+    chosen = bytearray(rng.randbytes(cells).translate(table))
+    for i in excluded:
+        chosen[i] = 0
+
+    picked = chosen.count(1)
+    while picked < count:
+        i = rng.randrange(cells)
+        if not chosen[i] and i not in excluded:
+            chosen[i] = 1
+            picked += 1
+    while picked > count:
+        i = rng.randrange(cells)
+        if chosen[i]:
+            chosen[i] = 0
+            picked -= 1
+    return chosen
+
+
+def mark_border(cells: bytearray, rows: int, cols: int) -> bytearray:
+    """Запись BORDER в рамку шириной в одну клетку вокруг поля rows x cols"""
+    width = cols + 2
+    size = width * (rows + 2)
+    cells[:width] = bytes([BORDER]) * width
+    cells[size - width:] = bytes([BORDER]) * width
+    cells[::width] = bytes([BORDER]) * (rows + 2)
+    cells[width - 1::width] = bytes([BORDER]) * (rows + 2)
+    return cells
+
+
+def pack_cells(mine_map: bytearray, rows: int, cols: int) -> bytearray:
+    """Упакованные клетки поля с рамкой: мины и числа соседей одной сверткой 3x3
+
+    Поле с рамкой упаковывается в целое число по байту на клетку. Сдвиг
+    на 8 бит дает соседа по строке, на 8 * ширину - соседа по столбцу.
+    Сумма девяти соседей не превышает 9, переносов между байтами нет, и
+    вся свертка выполняется арифметикой длинных чисел.
+    """
+    width = cols + 2
+    size = width * (rows + 2)
+    padded = bytearray(size)
+    for row in range(rows):
+        start = (row + 1) * width + 1
+        padded[start:start + cols] = mine_map[row * cols:(row + 1) * cols]
+
+    mines = int.from_bytes(padded, "little")
+    row_shift = 8 * width
+    horizontal = mines + (mines << 8) + (mines >> 8)
+    window = horizontal + (horizontal << row_shift) + (horizontal >> row_shift)
+    packed = (window - mines) | (mines << 4)  # MINE == 1 << 4
+    # Сдвиги влево выходят за рамку не больше чем на строку и клетку
+    cells = bytearray(packed.to_bytes(size + width + 1, "little")[:size])
+    return mark_border(cells, rows, cols)
+
+
+class Board:
+    """Логика игры «Сапер» без pygame.
+
+    Только стандартная библиотека: подходит для тестов, симуляций и
+    headless-серверов. При одинаковом seed расстановка мин повторяется.
+
+    Все состояние поля - один bytearray cells с рамкой в клетку: байт на
+    клетку (см. NUMBER_MASK, MINE, REVEALED, FLAGGED, BORDER), индекс
+    (row + 1) * width + col + 1. Соседи клетки - индекс плюс смещения из
+    neighbour_offsets.
+    """
+
+    def __init__(self, rows: int, cols: int, mines_count: int, seed: Optional[int] = None):
+        if rows <= 0 or cols <= 0:
+            raise ValueError("Board must have at least one row and one column")
+        if not 0 <= mines_count < rows * cols:
+            raise ValueError(f"Cannot place {mines_count} mines on a {rows}x{cols} board")
+        self.rows = rows
+        self.cols = cols
+        self.mines_count = mines_count
+        self.safe_total = rows * cols - mines_count
+        self.width = width = cols + 2
+        self.neighbour_offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+        self._blank = bytes(mark_border(bytearray(width * (rows + 2)), rows, cols))
+        self.rng = random.Random(seed)
+        self.reset()
+
+    @classmethod
+    def from_difficulty(cls, difficulty: str, seed: Optional[int] = None) -> 'Board':
+        """Поле стандартного уровня сложности"""
+        rows, cols, mines_count = DIFFICULTIES[difficulty]
+        return cls(rows, cols, mines_count, seed)
+
+    def reset(self, seed: Optional[int] = None):
+        """Сброс игры к начальному состоянию (seed - пересоздать генератор)"""
+        if seed is not None:
+            self.rng = random.Random(seed)
+        self.cells = bytearray(self._blank)
+        self.game_over = False
+        self.game_won = False
+        self.first_click = True
+        self.flags_count = 0
+        self.safe_revealed = 0  # Открытые клетки без мин: победа при safe_revealed == safe_total
+        self.exploded_mine: Optional[Tuple[int, int]] = None  # Координаты взорвавшейся мины
+
+    def index(self, row: int, col: int) -> int:
+        """Индекс клетки в cells"""
+        return (row + 1) * self.width + col + 1
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """Строка и столбец клетки по индексу в cells"""
+        row, col = divmod(index, self.width)
+        return row - 1, col - 1
+
+    def place_mines(self, exclude_row: int, exclude_col: int):
+        """Размещение мин на поле, исключая клетку первого клика и соседние"""
+        rows, cols = self.rows, self.cols
+        cells = rows * cols
+        zone = [
+            r * cols + c
+            for r in range(max(exclude_row - 1, 0), min(exclude_row + 2, rows))
+            for c in range(max(exclude_col - 1, 0), min(exclude_col + 2, cols))
+        ]
+        free = cells - len(zone)
+        if self.mines_count > free:
+            raise ValueError(f"Not enough room for {self.mines_count} mines around the first click")
+
+        if self.mines_count <= free // 2:
+            mine_map = choose_cells(self.rng, cells, self.mines_count, zone)
+        else:
+            # Плотное поле: выбираем клетки без мин, остальное - мины
+            mine_map = choose_cells(self.rng, cells, free - self.mines_count, zone).translate(_INVERT)
+            for i in zone:
+                mine_map[i] = 0
+
+        # Флажки, поставленные до первого клика, сохраняются
+        flags = _indices(self.cells.translate(_FLAG_BYTES)) if self.flags_count else ()
+        self.cells = pack_cells(mine_map, rows, cols)
+        for i in flags:
+            self.cells[i] |= FLAGGED
+
+    def count_adjacent_mines(self, row: int, col: int) -> int:
+        """Подсчет мин в соседних клетках"""
+        cells = self.cells
+        index = self.index(row, col)
+        return sum(1 for offset in self.neighbour_offsets if cells[index + offset] & MINE)
+
+    def neighbours(self, row: int, col: int) -> List[Tuple[int, int]]:
+        """Соседние клетки в пределах поля"""
+        cells, index = self.cells, self.index(row, col)
+        return [self.position(index + offset) for offset in self.neighbour_offsets
+                if not cells[index + offset] & BORDER]
+
+    def reveal_cell(self, row: int, col: int) -> List[Tuple[int, int]]:
+        """Открытие клетки и заливка пустой области; возвращает новые открытые клетки
+
+        Заливка итеративная (стек), каждая клетка попадает в стек не более
+        одного раза, поэтому глубина рекурсии не ограничивает размер поля.
+        """
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return []
+
+        cells = self.cells
+        index = self.index(row, col)
+        cell = cells[index]
+        if cell & (REVEALED | FLAGGED):
+            return []
+
+        cells[index] = cell | REVEALED
+
+        # Если открыли мину - игра окончена
+        if cell & MINE:
+            self.game_over = True
+            self.exploded_mine = (row, col)
+            return [(row, col)]
+
+        if cell & NUMBER_MASK:
+            self.safe_revealed += 1
+            return [(row, col)]
+
+        # Открываем соседей пустых клеток; пустые соседи продолжают заливку.
+        # Рамка помечена BORDER, поэтому проверять границы поля не нужно
+        offsets = self.neighbour_offsets
+        stop = REVEALED | FLAGGED | BORDER
+        opened = [index]
+        stack = [index]
+        while stack:
+            i = stack.pop()
+            for offset in offsets:
+                j = i + offset
+                cell = cells[j]
+                if cell & stop:
+                    continue
+                cells[j] = cell | REVEALED
+                opened.append(j)
+                if not cell & NUMBER_MASK:
+                    stack.append(j)
+        # Заливка идет только от пустых клеток, мин среди открытых нет
+        self.safe_revealed += len(opened)
+        width = self.width
+        return [(i // width - 1, i % width - 1) for i in opened]
+
+    def toggle_flag(self, row: int, col: int) -> bool:
+        """Установка или снятие флажка; True если клетка изменилась"""
+        if not (0 <= row < self.rows and 0 <= col < self.cols):
+            return False
+        index = self.index(row, col)
+        if self.cells[index] & REVEALED or self.game_over or self.game_won:
+            return False
+        cell = self.cells[index] = self.cells[index] ^ FLAGGED
+        self.flags_count += 1 if cell & FLAGGED else -1
+        return True
+
+    @property
+    def mines_remaining(self) -> int:
+        """Счетчик мин на панели: мины минус поставленные флажки"""
+        return self.mines_count - self.flags_count
+
+    def check_win(self) -> bool:
+        """Проверка условия победы: открыты все клетки без мин"""
+        return self.safe_revealed == self.safe_total
+
+    def click(self, row: int, col: int) -> List[Tuple[int, int]]:
+        """Левый клик: первый клик расставляет мины, затем открытие и проверка победы
+
+        Возвращает клетки, открытые этим кликом.
+        """
+        if self.game_over or self.game_won or not (0 <= row < self.rows and 0 <= col < self.cols):
+            return []
+        if self.first_click:
+            self.first_click = False
+            self.place_mines(row, col)
+
+        if self.cells[self.index(row, col)] & FLAGGED:
+            return []
+        opened = self.reveal_cell(row, col)
+        if opened and not self.game_over and self.check_win():
+            self.game_won = True
+        return opened
+
+    # Доступ к состоянию клеток для отрисовки и внешних алгоритмов
+    # Индекс считается на месте, без вызова index(): эти методы - самые частые
+    def is_mine(self, row: int, col: int) -> bool:
+        return bool(self.cells[(row + 1) * self.width + col + 1] & MINE)
+
+    def is_revealed(self, row: int, col: int) -> bool:
+        return bool(self.cells[(row + 1) * self.width + col + 1] & REVEALED)
+
+    def is_flagged(self, row: int, col: int) -> bool:
+        return bool(self.cells[(row + 1) * self.width + col + 1] & FLAGGED)
+
+    def cell_value(self, row: int, col: int) -> int:
+        """Число мин вокруг клетки или -1 для мины"""
+        cell = self.cells[(row + 1) * self.width + col + 1]
+        return -1 if cell & MINE else cell & NUMBER_MASK
+
+    def mine_positions(self) -> List[Tuple[int, int]]:
+        return [self.position(i) for i in _indices(self.cells.translate(_MINE_BYTES))]
@@ -0,0 +1,370 @@
+"""Решатель «Сапера» и пакетный прогон партий без pygame.
+
+Запуск: python minesweeper_solver.py [--games 1000] [--difficulties easy,medium,hard] [--workers N] [--seed 0]
+"""
+import argparse
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from minesweeper_engine import Board, DIFFICULTIES, BORDER, FLAGGED, NUMBER_MASK, REVEALED
+
+# Компонента фронта с большим числом закрытых клеток не перебирается полностью
+MAX_ENUMERATION = 24
+# Ограничение: закрытые соседи числа и сколько мин среди них осталось
+Constraint = Tuple[FrozenSet[int], int]
+
+
+class LatencyHistogram:
+    """Гистограмма времени в логарифмических корзинах (~6% ширины)
+
+    Гистограммы из разных процессов складываются без хранения всех замеров.
+    """
+    BUCKETS_PER_DECADE = 40
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.total = 0
+
+    def add(self, seconds: float):
+        microseconds = max(seconds * 1e6, 0.01)
+        self.counts[math.floor(math.log10(microseconds) * self.BUCKETS_PER_DECADE)] += 1
+        self.total += 1
+
+    def merge(self, other: 'LatencyHistogram'):
+        self.counts.update(other.counts)
+        self.total += other.total
+
+    def percentile(self, q: float) -> float:
+        """Верхняя граница корзины с q-й долей замеров, в микросекундах"""
+        if not self.total:
+            return 0.0
+        rank = q / 100 * self.total
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return 10 ** ((bucket + 1) / self.BUCKETS_PER_DECADE)
+        return 10 ** ((max(self.counts) + 1) / self.BUCKETS_PER_DECADE)
+
+
+@dataclass
+class GameResult:
+    won: bool
+    moves: int
+    guesses: int
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+class Solver:
+    """Решатель поверх Board: точные выводы, а при их отсутствии - ход наименьшего риска
+
+    Флажки ставятся только на доказанные мины, поэтому каждый флажок верен
+    и учитывается в ограничениях как мина.
+    """
+
+    def __init__(self, board: Board, rng: Optional[random.Random] = None):
+        self.board = board
+        self.rng = rng or random.Random(0)
+        self.frontier: Set[int] = set()  # Открытые числа, у которых остались закрытые соседи
+        self.safe: Set[int] = set()  # Доказанно безопасные клетки, еще не открытые
+        self.guesses = 0
+
+    def play(self) -> GameResult:
+        """Играет партию до победы или проигрыша"""
+        board = self.board
+        latency = LatencyHistogram()
+        moves = 0
+        while not board.game_over and not board.game_won:
+            start = time.perf_counter()
+            self.step()
+            latency.add(time.perf_counter() - start)
+            moves += 1
+        return GameResult(board.game_won, moves, self.guesses, latency)
+
+    def step(self):
+        """Один ход: открытие выведенной клетки или, если выводов нет, догадка"""
+        board = self.board
+        if board.first_click:
+            # Первый клик всегда безопасен, из центра откроется больше всего
+            self.reveal(board.index(board.rows // 2, board.cols // 2))
+            return
+
+        while True:
+            cells = board.cells
+            while self.safe:
+                index = self.safe.pop()
+                if not cells[index] & REVEALED:
+                    self.reveal(index)
+                    return
+
+            constraints = self.constraints()
+            safe, mines = deduce(constraints)
+            if not safe and not mines:
+                safe, mines, probabilities = self.probabilities(constraints)
+            for index in mines:
+                board.toggle_flag(*board.position(index))
+            if safe:
+                self.safe = safe
+                continue
+            if not mines:
+                break
+
+        self.guesses += 1
+        self.reveal(self.best_guess(probabilities))
+
+    def reveal(self, index: int):
+        """Открытие клетки с пополнением фронта новыми числами"""
+        board = self.board
+        clicked = board.click(*board.position(index))
+        cells = board.cells  # Первый клик создает поле заново
+        for row, col in clicked:
+            opened = board.index(row, col)
+            if cells[opened] & NUMBER_MASK:
+                self.frontier.add(opened)
+
+    def constraints(self) -> List[Constraint]:
+        """Ограничения от всех чисел фронта; исчерпанные числа покидают фронт"""
+        cells = self.board.cells
+        offsets = self.board.neighbour_offsets
+        closed = REVEALED | FLAGGED | BORDER
+        result = []
+        for index in list(self.frontier):
+            unknown = frozenset(index + offset for offset in offsets if not cells[index + offset] & closed)
+            if not unknown:
+                self.frontier.discard(index)
+                continue
+            flags = sum(1 for offset in offsets if cells[index + offset] & FLAGGED)
+            result.append((unknown, (cells[index] & NUMBER_MASK) - flags))
+        return result
+
+    def probabilities(self, constraints: List[Constraint]) -> Tuple[Set[int], Set[int], Dict[int, float]]:
+        """Вероятность мины для закрытых клеток фронта перебором решений по компонентам
+
+        Клетки с вероятностью 0 или 1 возвращаются как выведенные. Компоненты
+        крупнее MAX_ENUMERATION оцениваются по худшему из ограничений клетки.
+        """
+        safe: Set[int] = set()
+        mines: Set[int] = set()
+        probabilities: Dict[int, float] = {}
+        for component in components(constraints):
+            cells = sorted(set().union(*(unknown for unknown, _ in component)))
+            if len(cells) <= MAX_ENUMERATION:
+                component_probabilities = enumerate_probabilities(cells, component)
+            else:
+                component_probabilities = {}
+                for unknown, count in component:
+                    for index in unknown:
+                        component_probabilities[index] = max(
+                            component_probabilities.get(index, 0.0), count / len(unknown))
+            for index, probability in component_probabilities.items():
+                if probability == 0.0:
+                    safe.add(index)
+                elif probability == 1.0:
+                    mines.add(index)
+            probabilities.update(component_probabilities)
+        return safe, mines, probabilities
+
+    def best_guess(self, probabilities: Dict[int, float]) -> int:
+        """Закрытая клетка с наименьшей вероятностью мины (вне фронта - по средней плотности)"""
+        board = self.board
+        cells = board.cells
+        closed = REVEALED | FLAGGED | BORDER
+        interior = [index for index in range(len(cells))
+                    if not cells[index] & closed and index not in probabilities]
+        expected = sum(probabilities.values())
+        candidates = list(probabilities.items())
+        if interior:
+            density = (board.mines_remaining - expected) / len(interior)
+            candidates.append((self.rng.choice(interior), min(max(density, 0.0), 1.0)))
+        lowest = min(probability for _, probability in candidates)
+        return self.rng.choice([index for index, probability in candidates if probability == lowest])
+
+
+def deduce(constraints: List[Constraint]) -> Tuple[Set[int], Set[int]]:
+    """Безопасные клетки и мины из одиночных ограничений и пар вложенных ограничений"""
+    safe: Set[int] = set()
+    mines: Set[int] = set()
+    for unknown, count in constraints:
+        if count == 0:
+            safe |= unknown
+        elif count == len(unknown):
+            mines |= unknown
+    if safe or mines:
+        return safe, mines
+
+    # Если клетки A входят в B, то в B - A ровно count(B) - count(A) мин
+    by_cell: Dict[int, List[int]] = {}
+    for position, (unknown, _) in enumerate(constraints):
+        for index in unknown:
+            by_cell.setdefault(index, []).append(position)
+    for position, (unknown, count) in enumerate(constraints):
+        related = set().union(*(by_cell[index] for index in unknown))
+        for other in related:
+            other_unknown, other_count = constraints[other]
+            if other == position or not unknown < other_unknown:
+                continue
+            rest = other_unknown - unknown
+            rest_mines = other_count - count
+            if rest_mines == 0:
+                safe |= rest
+            elif rest_mines == len(rest):
+                mines |= rest
+    return safe, mines
+
+
+def components(constraints: List[Constraint]) -> List[List[Constraint]]:
+    """Группы ограничений, связанных общими закрытыми клетками"""
+    parent = list(range(len(constraints)))
+
+    def find(x: int) -> int:
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    owner: Dict[int, int] = {}
+    for position, (unknown, _) in enumerate(constraints):
+        for index in unknown:
+            if index in owner:
+                parent[find(position)] = find(owner[index])
+            else:
+                owner[index] = position
+
+    groups: Dict[int, List[Constraint]] = {}
+    for position, constraint in enumerate(constraints):
+        groups.setdefault(find(position), []).append(constraint)
+    return list(groups.values())
+
+
+def enumerate_probabilities(cells: List[int], constraints: List[Constraint]) -> Dict[int, float]:
+    """Доля решений компоненты, в которых клетка - мина (перебор с отсечениями)"""
+    position = {index: i for i, index in enumerate(cells)}
+    members = [[position[index] for index in unknown] for unknown, _ in constraints]
+    counts = [count for _, count in constraints]
+    by_cell: List[List[int]] = [[] for _ in cells]
+    for c, cell_positions in enumerate(members):
+        for i in cell_positions:
+            by_cell[i].append(c)
+    # Последняя клетка каждого ограничения: после нее ограничение проверяется точно
+    last = [max(cell_positions) for cell_positions in members]
+
+    placed = [0] * len(constraints)
+    assignment = [0] * len(cells)
+    mine_counts = [0] * len(cells)
+    solutions = 0
+
+    def search(i: int):
+        nonlocal solutions
+        if i == len(cells):
+            solutions += 1
+            for j, value in enumerate(assignment):
+                mine_counts[j] += value
+            return
+        for value in (0, 1):
+            ok = True
+            for c in by_cell[i]:
+                total = placed[c] + value
+                if total > counts[c] or (last[c] == i and total != counts[c]):
+                    ok = False
+                    break
+            if not ok:
+                continue
+            assignment[i] = value
+            for c in by_cell[i]:
+                placed[c] += value
+            search(i + 1)
+            for c in by_cell[i]:
+                placed[c] -= value
+        assignment[i] = 0
+
+    search(0)
+    if not solutions:
+        return {index: 0.5 for index in cells}
+    return {index: mine_counts[i] / solutions for i, index in enumerate(cells)}
+
+
+@dataclass
+class BatchResult:
+    difficulty: str
+    games: int = 0
+    wins: int = 0
+    moves: int = 0
+    guesses: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: 'BatchResult'):
+        self.games += other.games
+        self.wins += other.wins
+        self.moves += other.moves
+        self.guesses += other.guesses
+        self.latency.merge(other.latency)
+
+
+def play_games(difficulty: str, seeds: Iterable[int]) -> BatchResult:
+    """Партии с заданными seed на одном уровне сложности (задача для процесса пула)"""
+    result = BatchResult(difficulty)
+    for seed in seeds:
+        game = Solver(Board.from_difficulty(difficulty, seed=seed), random.Random(seed)).play()
+        result.games += 1
+        result.wins += game.won
+        result.moves += game.moves
+        result.guesses += game.guesses
+        result.latency.merge(game.latency)
+    return result
+
+
+def run_batch(difficulty: str, games: int, seed: int = 0, workers: Optional[int] = None,
+              chunk_size: int = 250) -> BatchResult:
+    """games партий (seed, seed + 1, ...) в пуле процессов"""
+    total = BatchResult(difficulty)
+    chunks = [range(start, min(start + chunk_size, seed + games))
+              for start in range(seed, seed + games, chunk_size)]
+    if workers == 1:
+        for chunk in chunks:
+            total.merge(play_games(difficulty, chunk))
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for result in pool.map(play_games, [difficulty] * len(chunks), chunks):
+            total.merge(result)
+    return total
+
+
+def positive_int(text: str) -> int:
+    """Тип argparse: целое больше нуля"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {text!r}")
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"expected a positive number, got {value}")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=positive_int, default=1000, help="партий на уровень сложности")
+    parser.add_argument("--difficulties", default=",".join(DIFFICULTIES))
+    parser.add_argument("--workers", type=positive_int, default=os.cpu_count())
+    parser.add_argument("--seed", type=int, default=0, help="seed первой партии")
+    args = parser.parse_args()
+
+    print(f"{'difficulty':>10} {'games':>8} {'win %':>7} {'games/s':>9} {'guesses':>8} "
+          f"{'p50 us':>8} {'p90 us':>8} {'p99 us':>8}")
+    for difficulty in args.difficulties.split(","):
+        start = time.perf_counter()
+        result = run_batch(difficulty, args.games, args.seed, args.workers)
+        elapsed = time.perf_counter() - start
+        latency = result.latency
+        print(f"{difficulty:>10} {result.games:>8} {result.wins / result.games * 100:7.1f} "
+              f"{result.games / elapsed:9.0f} {result.guesses / result.games:8.2f} "
+              f"{latency.percentile(50):8.1f} {latency.percentile(90):8.1f} {latency.percentile(99):8.1f}")
+
+
+if __name__ == "__main__":
+    main()
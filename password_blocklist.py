@@ -0,0 +1,194 @@
+"""Список утекших паролей: фильтр Блума и отсортированные хэши в одном файле.
+
+Сборка:   python password_blocklist.py build breached.txt breached.blk [--bits-per-entry 10]
+Проверка: python password_blocklist.py check breached.blk password [password ...]
+
+Формат файла (little-endian):
+    заголовок, 64 байта: MAGIC, число хэшей, число слов фильтра, число бит на ключ;
+    фильтр Блума: слова u64, все биты ключа - в одном слове;
+    отсортированные без повторов ключи u64 - первые 8 байт blake2b от пароля в UTF-8.
+
+Файл отображается в память через mmap: открытие не читает данные, поиск
+читает одно слово фильтра и, если фильтр не отсек пароль, около log2(n)
+страниц массива. Совпадение 64-битных ключей у разных паролей при
+500 млн записей маловероятно (~1e-11 на проверку).
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from hashlib import blake2b
+
+MAGIC = b"PWBLOCK1"
+HEADER = struct.Struct("<8sQQI")
+HEADER_SIZE = 64
+BLOOM_HASHES = 6  # Позиции по 6 бит из 64-битного перемешанного ключа
+BITS_PER_ENTRY = 10  # ~1.5% ложных срабатываний фильтра
+BUCKETS = 256  # Временные файлы сборки по старшему байту ключа
+_FLUSH = 1 << 16
+_MASK64 = (1 << 64) - 1
+
+if sys.byteorder != "little":
+    raise ImportError("password_blocklist expects a little-endian platform")
+
+
+def password_key(password: str) -> int:
+    """64-битный ключ пароля: blake2b по UTF-8 (байты вне UTF-8 - через surrogateescape)"""
+    digest = blake2b(password.encode("utf-8", "surrogateescape"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def bloom_position(key: int, words: int):
+    """Номер слова фильтра и маска бит ключа в нем
+
+    Слово выбирается по старшим битам ключа, биты - по перемешанному ключу.
+    Маска укладывается в 64 бита: проверка - одно чтение и одно сравнение.
+    Тот же расчет встроен в Blocklist.contains_key.
+    """
+    mixed = key * 0x9E3779B97F4A7C15 & _MASK64
+    mask = (1 << (mixed & 63) | 1 << (mixed >> 6 & 63) | 1 << (mixed >> 12 & 63)
+            | 1 << (mixed >> 18 & 63) | 1 << (mixed >> 24 & 63) | 1 << (mixed >> 30 & 63))
+    return (key >> 32) * words >> 32, mask
+
+
+def read_passwords(filename: str, encoding: str = "utf-8"):
+    """Непустые строки текстового списка без пробелов по краям"""
+    with open(filename, "r", encoding=encoding, errors="surrogateescape") as file:
+        for line in file:
+            password = line.strip()
+            if password:
+                yield password
+
+
+def build_blocklist(source: str, output: str, bits_per_entry: int = BITS_PER_ENTRY,
+                    encoding: str = "utf-8") -> int:
+    """Сборка индекса из текстового списка (пароль на строку); возвращает число ключей
+
+    Ключи раскладываются по BUCKETS временным файлам по старшему байту,
+    затем каждая корзина сортируется отдельно: в памяти одновременно только
+    одна корзина и фильтр Блума, а не весь список.
+    """
+    directory = os.path.dirname(os.path.abspath(output))
+    with tempfile.TemporaryDirectory(dir=directory) as scratch:
+        files = [open(os.path.join(scratch, f"{i:02x}"), "wb") for i in range(BUCKETS)]
+        buffers = [array("Q") for _ in range(BUCKETS)]
+        total = 0
+        try:
+            for password in read_passwords(source, encoding):
+                key = password_key(password)
+                buffer = buffers[key >> 56]
+                buffer.append(key)
+                total += 1
+                if len(buffer) >= _FLUSH:
+                    buffer.tofile(files[key >> 56])
+                    del buffer[:]
+            for file, buffer in zip(files, buffers):
+                buffer.tofile(file)
+        finally:
+            for file in files:
+                file.close()
+
+        # Повторы выясняются только после сортировки: фильтр считается по всем строкам
+        words = max(1, -(-total * bits_per_entry // 64))
+        bloom = array("Q", bytes(words * 8))
+        count = 0
+        with open(output, "wb") as out:
+            out.seek(HEADER_SIZE + words * 8)
+            for i in range(BUCKETS):
+                path = os.path.join(scratch, f"{i:02x}")
+                keys = array("Q")
+                with open(path, "rb") as file:
+                    keys.frombytes(file.read())
+                os.remove(path)
+                keys = array("Q", sorted(set(keys)))
+                for key in keys:
+                    word, mask = bloom_position(key, words)
+                    bloom[word] |= mask
+                keys.tofile(out)
+                count += len(keys)
+            out.seek(0)
+            out.write(HEADER.pack(MAGIC, count, words, bits_per_entry).ljust(HEADER_SIZE, b"\0"))
+            bloom.tofile(out)
+    return count
+
+
+class Blocklist:
+    """Проверка пароля по индексу build_blocklist: `password in blocklist`"""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size < HEADER_SIZE:
+                raise ValueError(f"{path} is not a password blocklist")
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self.words, self.bits_per_entry = HEADER.unpack_from(self._mmap)
+        start = HEADER_SIZE + self.words * 8
+        if magic != MAGIC or size != start + self.count * 8:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a password blocklist")
+        view = memoryview(self._mmap)
+        self._bloom = view[HEADER_SIZE:start].cast("Q")
+        self._keys = view[start:].cast("Q")
+        view.release()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, password: str) -> bool:
+        return self.contains_key(password_key(password))
+
+    def might_contain_key(self, key: int) -> bool:
+        """Ответ только фильтра Блума: False - ключа точно нет"""
+        word, mask = bloom_position(key, self.words)
+        return self._bloom[word] & mask == mask
+
+    def contains_key(self, key: int) -> bool:
+        """Фильтр Блума, затем двоичный поиск в отсортированных ключах"""
+        mixed = key * 0x9E3779B97F4A7C15 & _MASK64
+        mask = (1 << (mixed & 63) | 1 << (mixed >> 6 & 63) | 1 << (mixed >> 12 & 63)
+                | 1 << (mixed >> 18 & 63) | 1 << (mixed >> 24 & 63) | 1 << (mixed >> 30 & 63))
+        if self._bloom[(key >> 32) * self.words >> 32] & mask != mask:
+            return False
+        keys = self._keys
+        i = bisect_left(keys, key)
+        return i < self.count and keys[i] == key
+
+    def close(self):
+        self._bloom.release()
+        self._keys.release()
+        self._mmap.close()
+
+    def __enter__(self) -> 'Blocklist':
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="собрать индекс из текстового списка")
+    build.add_argument("source")
+    build.add_argument("output")
+    build.add_argument("--bits-per-entry", type=int, default=BITS_PER_ENTRY)
+    check = commands.add_parser("check", help="проверить пароли по индексу")
+    check.add_argument("blocklist")
+    check.add_argument("passwords", nargs="+")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        count = build_blocklist(args.source, args.output, args.bits_per_entry)
+        print(f"Паролей в индексе: {count}, размер: {os.path.getsize(args.output)} байт")
+    else:
+        with Blocklist(args.blocklist) as blocklist:
+            for password in args.passwords:
+                print(f"{password}: {'в списке утечек' if password in blocklist else 'не найден'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,73 @@
+import os
 import re
+import string
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import compress
+
+from password_strength import password_strength
+
+STRONG_PASSWORD_PATTERN = re.compile(r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*()]).{8,}$')
+
+# Таблицы классов символов для быстрой проверки ASCII-паролей
+_LOWERCASE = frozenset(string.ascii_lowercase)
+_UPPERCASE = frozenset(string.ascii_uppercase)
+_DIGITS = frozenset(string.digits)
+_SPECIALS = frozenset("!@#$%^&*()")
+
+# Размер куска файла для потоковой проверки
+CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def is_strong_password_regex(password):
+    """Эталонная проверка регулярным выражением (пять проходов по строке)"""
+    return STRONG_PASSWORD_PATTERN.match(password) is not None
+
+
+def is_strong_password(password, blocklist=None):
+    """Пароль не короче 8 символов со строчной и заглавной буквой, цифрой и спецсимволом
+
+    blocklist - необязательный список утечек (например, password_blocklist.Blocklist):
+    найденный в нем пароль ненадежен при любом составе.
+
+    ASCII-пароль проверяется по таблицам классов: isdisjoint идет на уровне C
+    и останавливается на первом символе класса, редкие классы проверяются
+    первыми. Не-ASCII строки (\\d - любая цифра Unicode) и строки с переводом
+    строки (. и $ в шаблоне) проверяются эталонным шаблоном.
+    """
+    if len(password) < 8:
+        return False
+    if not password.isascii() or '\n' in password:
+        strong = STRONG_PASSWORD_PATTERN.match(password) is not None
+    else:
+        strong = not (_SPECIALS.isdisjoint(password) or _DIGITS.isdisjoint(password)
+                      or _UPPERCASE.isdisjoint(password) or _LOWERCASE.isdisjoint(password))
+    return strong and (blocklist is None or password not in blocklist)
+
+
+def is_strong_password_batch(passwords, blocklist=None):
+    """Результаты is_strong_password для каждого пароля из итерируемого объекта
+
+    Проверка встроена в цикл: без вызова функции на каждый пароль. Список
+    утечек проверяется только для паролей, прошедших проверку состава.
+    """
+    match = STRONG_PASSWORD_PATTERN.match
+    specials, digits, uppercase, lowercase = _SPECIALS, _DIGITS, _UPPERCASE, _LOWERCASE
+    if blocklist is not None:
+        passwords = list(passwords)
+        results = is_strong_password_batch(passwords)
+        return [strong and password not in blocklist for password, strong in zip(passwords, results)]
+    return [
+        len(password) >= 8 and (
+            match(password) is not None if not password.isascii() or '\n' in password
+            else not (specials.isdisjoint(password) or digits.isdisjoint(password)
+                      or uppercase.isdisjoint(password) or lowercase.isdisjoint(password))
+        )
+        for password in passwords
+    ]
 
-def is_strong_password(password):
-    pattern = r'^(?=.*[a-z])(?=.*[A-Z])(?=.*\d)(?=.*[!@#$%^&*()]).{8,}$'
-    return re.match(pattern, password) is not None
 
 def check_user_password():
     password = input("Введите пароль для проверки: ")
@@ -11,23 +76,131 @@ def check_user_password():
 
     else:
         print("Пароль ненадежный!")
+    strength = password_strength(password)
+    print(f"Оценка: {strength.score}/4, энтропия {strength.entropy:.1f} бит")
+
+def chunk_bounds(filename, chunk_size=CHUNK_SIZE):
+    """Границы кусков файла (начало, конец) примерно по chunk_size байт, выровненные по концам строк"""
+    size = os.path.getsize(filename)
+    bounds = []
+    with open(filename, 'rb') as file:
+        start = 0
+        while start < size:
+            end = start + chunk_size
+            if end < size:
+                file.seek(end)
+                end += len(file.readline())
+            else:
+                end = size
+            bounds.append((start, end))
+            start = end
+    return bounds
+
+
+def scan_chunk(filename, start, end, encoding='utf-8', blocklist_path=None):
+    """Число строк и надежные пароли куска файла [start, end)
+
+    Строки разбираются как в текстовом режиме open: \\r\\n и \\r - тоже концы
+    строк, пробелы по краям отбрасываются. Байты, не декодируемые в encoding,
+    сохраняются через surrogateescape и записываются обратно без изменений.
+    blocklist_path - файл password_blocklist: найденные в нем пароли отбрасываются.
+    """
+    with open(filename, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode(encoding, 'surrogateescape')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = text.split('\n')
+    if not lines[-1]:
+        lines.pop()
+    passwords = [line.strip() for line in lines]
+    strong_passwords = list(compress(passwords, is_strong_password_batch(passwords)))
+    if blocklist_path is not None:
+        from password_blocklist import Blocklist
+        with Blocklist(blocklist_path) as blocklist:
+            strong_passwords = [p for p in strong_passwords if p not in blocklist]
+    return len(lines), strong_passwords
+
+
+def iter_strong_password_chunks(filename, workers=None, chunk_size=CHUNK_SIZE, encoding='utf-8',
+                                blocklist_path=None):
+    """Результаты по кускам в порядке файла: (байт, строк, надежные пароли)
+
+    Куски проверяются в пуле процессов; каждый процесс сам читает свой кусок,
+    поэтому между процессами передаются только найденные пароли. В работе не
+    больше двух кусков на процесс, так что память не зависит от размера файла.
+    Файл из одного куска и workers=1 проверяются в текущем процессе.
+    """
+    bounds = chunk_bounds(filename, chunk_size)
+    if workers == 1 or len(bounds) <= 1:
+        for start, end in bounds:
+            yield (end - start,) + scan_chunk(filename, start, end, encoding, blocklist_path)
+        return
+
+    workers = workers or os.cpu_count()
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = deque()
+        for start, end in bounds:
+            pending.append((end - start, pool.submit(scan_chunk, filename, start, end, encoding, blocklist_path)))
+            if len(pending) >= 2 * workers:
+                size, future = pending.popleft()
+                yield (size,) + future.result()
+        while pending:
+            size, future = pending.popleft()
+            yield (size,) + future.result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def iter_strong_passwords(filename, workers=None, chunk_size=CHUNK_SIZE, encoding='utf-8', blocklist_path=None):
+    """Надежные пароли файла по одному, в порядке файла"""
+    chunks = iter_strong_password_chunks(filename, workers, chunk_size, encoding, blocklist_path)
+    for _, _, strong_passwords in chunks:
+        yield from strong_passwords
+
+
+@dataclass
+class ScanSummary:
+    bytes: int = 0
+    lines: int = 0
+    strong: int = 0
+    seconds: float = 0.0
+
+    def __str__(self):
+        seconds = self.seconds or 1e-9
+        return (f"Строк: {self.lines}, надежных: {self.strong}, "
+                f"{self.bytes / seconds / 1e6:.1f} МБ/с, {self.lines / seconds / 1e6:.2f} млн строк/с")
+
+
+def save_strong_passwords(filename, output, workers=None, chunk_size=CHUNK_SIZE, encoding='utf-8',
+                          blocklist_path=None):
+    """Запись надежных паролей файла в output (по строке на пароль); возвращает ScanSummary"""
+    summary = ScanSummary()
+    start = time.perf_counter()
+    with open(output, 'w', encoding=encoding, errors='surrogateescape', buffering=1024 * 1024) as out:
+        chunks = iter_strong_password_chunks(filename, workers, chunk_size, encoding, blocklist_path)
+        for size, lines, strong_passwords in chunks:
+            summary.bytes += size
+            summary.lines += lines
+            summary.strong += len(strong_passwords)
+            if strong_passwords:
+                out.write('\n'.join(strong_passwords))
+                out.write('\n')
+    summary.seconds = time.perf_counter() - start
+    return summary
+
 
 def find_strong_passwords_in_file(filename):
     try:
-        with open(filename, 'r') as file:
-            passwords = file.readlines()
-        
-        strong_passwords = []
-        for password in passwords:
-            password = password.strip()
-            if is_strong_password(password):
-                strong_passwords.append(password)
-        
-        if strong_passwords:
-            print("Надежные пароли в файле:")
-            for pwd in strong_passwords:
-                print(pwd)
-        else:
+        found = False
+        for _, _, strong_passwords in iter_strong_password_chunks(filename):
+            if strong_passwords and not found:
+                print("Надежные пароли в файле:")
+                found = True
+            if strong_passwords:
+                print('\n'.join(strong_passwords))
+        if not found:
             print("В файле нет надежных паролей.")
     except FileNotFoundError:
         print("Файл не найден.")
@@ -36,7 +209,8 @@ if __name__ == "__main__":
     while True:
         print("1. Проверить пароль")
         print("2. Найти надежные пароли в файле")
-        print("3. Выйти")
+        print("3. Сохранить надежные пароли из файла в другой файл")
+        print("4. Выйти")
         choice = input("Выберите действие : ")
         if choice == '1':
             check_user_password()
@@ -44,6 +218,13 @@ if __name__ == "__main__":
             filename = input("Введите путь к файлу: ")
             find_strong_passwords_in_file(filename)
         elif choice == '3':
+            filename = input("Введите путь к файлу: ")
+            output = input("Куда сохранить надежные пароли: ")
+            try:
+                print(save_strong_passwords(filename, output))
+            except FileNotFoundError:
+                print("Файл не найден.")
+        elif choice == '4':
             break
         else:
             print("Неверный выбор.")
\ No newline at end of file
@@ -0,0 +1,262 @@
+"""Сетевая проверка паролей: asyncio, построчный протокол TCP, пакетная обработка.
+
+Запуск: python password_service.py [--host 127.0.0.1] [--port 8765] [--workers N]
+        [--max-batch 512] [--max-delay-ms 1] [--blocklist breached.blk] [--stats-interval 0]
+
+Протокол: запросы и ответы - строки UTF-8. Запросы одного соединения можно
+отправлять, не дожидаясь ответов: ответы приходят в том же порядке.
+    CHECK <пароль>  ->  1 (надежный) или 0
+    STATS           ->  JSON со счетчиками сервиса
+    другое          ->  ERR <описание>
+
+Запросы всех соединений собираются в пакеты (до max_batch паролей или
+max_delay секунд ожидания) и проверяются is_strong_password_batch в пуле
+процессов: цикл событий только принимает и отправляет строки.
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional
+
+from password_checker import is_strong_password_batch
+
+MAX_PENDING = 1024  # Ответов в очереди соединения; дальше запросы не читаются (TCP backpressure)
+_worker_blocklist = None  # Blocklist процесса пула (открывается в _init_worker)
+
+
+def _init_worker(blocklist_path: Optional[str]):
+    global _worker_blocklist
+    if blocklist_path is not None:
+        from password_blocklist import Blocklist
+        _worker_blocklist = Blocklist(blocklist_path)
+
+
+def _check_batch(passwords: List[str]) -> List[bool]:
+    return is_strong_password_batch(passwords, _worker_blocklist)
+
+
+def percentile(values, q: float) -> float:
+    """q-й процентиль (ближайший ранг) или 0 для пустой выборки"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+@dataclass
+class ServiceStats:
+    requests: int = 0
+    strong: int = 0
+    errors: int = 0
+    batches: int = 0
+    max_batch: int = 0
+    connections: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=1 << 16))  # Последние запросы, с
+
+    def snapshot(self) -> dict:
+        uptime = time.perf_counter() - self.started
+        latencies = list(self.latencies)
+        return {
+            "requests": self.requests,
+            "strong": self.strong,
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch": self.requests / self.batches if self.batches else 0.0,
+            "max_batch": self.max_batch,
+            "connections": self.connections,
+            "uptime_s": uptime,
+            "requests_per_s": self.requests / uptime if uptime else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+        }
+
+
+class PasswordService:
+    """TCP-сервис проверки паролей с пакетной обработкой запросов
+
+    executor - пул для проверки пакетов; по умолчанию ProcessPoolExecutor на
+    workers процессов, в каждом открывается blocklist_path (если задан).
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_batch: int = 512, max_delay: float = 0.001,
+                 blocklist_path: Optional[str] = None, executor: Optional[Executor] = None):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.executor = executor or ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(blocklist_path,))
+        self.stats = ServiceStats()
+        self._passwords: List[str] = []
+        self._futures: List[asyncio.Future] = []
+        self._times: List[float] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Dict[asyncio.Task, asyncio.StreamWriter] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> int:
+        """Запуск сервера; возвращает фактический порт (port=0 - любой свободный)"""
+        self._server = await asyncio.start_server(self.handle, host, port)
+        return self._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Остановка сервера; открытые соединения закрываются, не дожидаясь клиентов"""
+        if self._server is not None:
+            self._server.close()
+        for writer in self._handlers.values():
+            writer.transport.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        self._flush()
+        await asyncio.to_thread(self.executor.shutdown)  # Ожидание пула не блокирует цикл событий
+
+    def check(self, password: str) -> asyncio.Future:
+        """Постановка пароля в текущий пакет; результат - будущее значение bool"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._passwords.append(password)
+        self._futures.append(future)
+        self._times.append(time.perf_counter())
+        if len(self._passwords) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return future
+
+    def _flush(self):
+        """Отправка накопленного пакета в пул"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._passwords:
+            return
+        passwords, futures, times = self._passwords, self._futures, self._times
+        self._passwords, self._futures, self._times = [], [], []
+        self.stats.batches += 1
+        self.stats.max_batch = max(self.stats.max_batch, len(passwords))
+        task = asyncio.get_running_loop().run_in_executor(self.executor, _check_batch, passwords)
+        task.add_done_callback(lambda done: self._resolve(done, futures, times))
+
+    def _resolve(self, task: asyncio.Future, futures: List[asyncio.Future], times: List[float]):
+        stats = self.stats
+        if task.cancelled() or task.exception() is not None:
+            stats.errors += len(futures)
+            error = task.exception() if not task.cancelled() else asyncio.CancelledError()
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        results = task.result()
+        now = time.perf_counter()
+        stats.requests += len(results)
+        stats.strong += sum(results)
+        stats.latencies.extend(now - started for started in times)
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Соединение: чтение запросов и очередь ответов в порядке запросов
+
+        Очередь ограничена MAX_PENDING: клиент, который шлет запросы и не
+        читает ответы, упирается в нее, и сервер перестает читать сокет.
+        """
+        self.stats.connections += 1
+        self._handlers[asyncio.current_task()] = writer
+        responses: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING)
+        sender = asyncio.create_task(self._send(responses, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await responses.put(b"ERR line too long\n")
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                command, _, argument = line.rstrip(b"\r\n").decode("utf-8", "surrogateescape").partition(" ")
+                if command == "CHECK":
+                    await responses.put(self.check(argument))
+                elif command == "STATS":
+                    await responses.put(json.dumps(self.stats.snapshot()).encode() + b"\n")
+                else:
+                    await responses.put(b"ERR unknown command\n")
+        finally:
+            await responses.put(None)
+            await sender
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.stats.connections -= 1
+            del self._handlers[asyncio.current_task()]
+
+    async def _send(self, responses: asyncio.Queue, writer: asyncio.StreamWriter):
+        """Ответы по мере готовности
+
+        drain - когда очередь опустела или буфер записи превысил верхнюю
+        отметку транспорта. После обрыва соединения очередь дочитывается без
+        записи, чтобы handle не застрял на полной очереди.
+        """
+        transport = writer.transport
+        high_water = transport.get_write_buffer_limits()[1]
+        connected = True
+        while True:
+            item = await responses.get()
+            if item is None:
+                return
+            if isinstance(item, bytes):
+                data = item
+            else:
+                try:
+                    data = b"1\n" if await item else b"0\n"
+                except Exception:
+                    data = b"ERR internal error\n"
+            if not connected:
+                continue
+            writer.write(data)
+            if responses.empty() or transport.get_write_buffer_size() > high_water:
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    connected = False
+
+
+async def serve(args):
+    service = PasswordService(args.workers, args.max_batch, args.max_delay_ms / 1000, args.blocklist)
+    port = await service.start(args.host, args.port)
+    print(f"Сервис проверки паролей: {args.host}:{port}", flush=True)
+    try:
+        while True:
+            await asyncio.sleep(args.stats_interval or 3600)
+            if args.stats_interval:
+                print(json.dumps(service.stats.snapshot()), flush=True)
+    finally:
+        await service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=None, help="процессов в пуле (по умолчанию - по числу ядер)")
+    parser.add_argument("--max-batch", type=int, default=512)
+    parser.add_argument("--max-delay-ms", type=float, default=1.0)
+    parser.add_argument("--blocklist", default=None, help="индекс password_blocklist")
+    parser.add_argument("--stats-interval", type=float, default=0, help="печать счетчиков каждые N секунд")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
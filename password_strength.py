@@ -0,0 +1,367 @@
+"""Оценка стойкости пароля по энтропии найденных шаблонов.
+
+Пароль разбирается на фрагменты: слова словаря (в том числе с заменами
+вида @ -> a и заглавными буквами), прогулки по клавиатуре, повторы и
+последовательности. Остальные символы считаются перебором по алфавиту
+пароля. Энтропия - минимальная сумма по всем разбиениям (динамика по
+позициям), оценка 0..4 - по порогам числа попыток, как в zxcvbn:
+10^3, 10^6, 10^8 и 10^10.
+
+Префиксное дерево словаря и граф соседства клавиш строятся при первой
+оценке и затем переиспользуются; результаты для повторяющихся паролей
+берутся из кэша.
+
+Время: из кэша - доли микросекунды. Без кэша оценка на чистом Python
+стоит около 10 мкс для пароля без шаблонов и 20-40 мкс для пароля с
+шаблонами длиной до 16 символов (в среднем на смеси bench_password_checker
+strength - 20-30 мкс); пароль из 256 символов - около 0,3 мс. Для фильтрации
+миллионов паролей в секунду остается is_strong_password, оценка нужна
+там, где важен балл.
+"""
+import math
+from functools import lru_cache
+from itertools import compress, count, repeat
+import re
+from operator import add, ne, sub
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Частые пароли и слова по убыванию популярности: ранг слова - его номер
+COMMON_WORDS = (
+    "password", "123456", "qwerty", "admin", "welcome", "login", "letmein", "master", "dragon", "monkey",
+    "football", "baseball", "iloveyou", "sunshine", "princess", "shadow", "superman", "michael", "trustno1",
+    "hello", "freedom", "whatever", "secret", "secure", "access", "starwars", "computer", "internet",
+    "pass", "test", "guest", "user", "root", "love", "god", "money", "summer", "winter", "spring", "autumn",
+    "flower", "cookie", "pepper", "ginger", "cheese", "soccer", "hockey", "tigger", "jordan", "hunter",
+    "ranger", "buster", "thomas", "robert", "daniel", "andrew", "jessica", "ashley", "charlie", "maggie",
+    "batman", "killer", "london", "berlin", "moscow", "paris", "china", "apple", "orange", "banana", "purple",
+    "silver", "golden", "diamond", "angel", "devil", "matrix", "ninja", "pokemon", "mustang", "corvette",
+    "ferrari", "harley", "yankees", "lakers", "chelsea", "arsenal", "liverpool", "google", "facebook",
+    "microsoft", "windows", "linux", "changeme", "default", "system", "server", "network", "office",
+    "family", "friend", "happy", "lucky", "magic", "music", "game", "gamer", "player", "super", "power",
+    "strong", "dream", "heaven", "light", "night", "star", "sun", "moon", "blue", "red", "green", "black",
+    "white", "baby", "boss", "king", "queen", "prince", "lover", "sweet", "honey", "kitty", "puppy",
+    "parol", "privet", "qwerty123", "zaq1", "asdf", "zxcv", "abc", "letme", "welcome1", "passw",
+    "пароль", "привет", "любовь", "солнце", "кошка", "москва",
+)
+
+# Подстановки цифр и знаков вместо букв
+_L33T_FROM, _L33T_TO = "4@38105$7|!", "aaebiosstli"
+_L33T = str.maketrans(_L33T_FROM, _L33T_TO)
+
+# Раскладки: ряды клавиш сверху вниз, каждый ряд сдвинут на полклавиши вправо
+KEYBOARD_LAYOUTS = (
+    ("1234567890-=", "qwertyuiop[]\\", "asdfghjkl;'", "zxcvbnm,./"),
+    ("1234567890-=", "йцукенгшщзхъ\\", "фывапролджэ", "ячсмитьбю."),
+)
+# Символы с Shift -> клавиша без Shift (буквы приводятся lower())
+_SHIFTED, _UNSHIFTED = "!@#$%^&*()_+{}|:\"<>?~", "1234567890-=[]\\;',./`"
+_UNSHIFT = str.maketrans(_SHIFTED, _UNSHIFTED)
+# Соседи клавиши (строка, столбец) в сдвинутой раскладке и номер направления
+_DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (-1, 1), (1, -1), (1, 0))
+
+# Повторы: кратчайший блок, повторенный подряд хотя бы дважды
+_REPEAT = re.compile(r"(.+?)\1+")
+# Серии флагов по парам символов (байт на пару): шаблон - хотя бы две пары подряд
+_RUN = re.compile(rb"\x01{2,}")
+_SEQUENCE_RUN = re.compile(rb"\x01{2,}|\x02{2,}")
+_SEQUENCE_STEPS = {1: 1, -1: 2}  # Разность кодов соседних символов -> флаг направления
+# Пары соседних символов последовательностей: латиница, кириллица, цифры
+_SEQUENCE_PAIRS = frozenset(
+    chr(code) + chr(code + step)
+    for first, last in (("a", "z"), ("а", "я"), ("0", "9"))
+    for code in range(ord(first), ord(last) + 1)
+    for step in (1, -1)
+    if ord(first) <= code + step <= ord(last)
+)
+
+# Символ ASCII -> его класс для _cardinality: a - строчные, A - заглавные, 0 - цифры, ! - прочие
+_CHAR_CLASSES = str.maketrans({
+    chr(code): "a" if chr(code).islower() else "A" if chr(code).isupper() else "0" if chr(code).isdigit() else "!"
+    for code in range(128)
+})
+_NO_NEIGHBOURS: Dict[str, int] = {}
+_SCORE_BITS = tuple(math.log2(guesses) for guesses in (1e3, 1e6, 1e8, 1e10))
+
+_trie: Optional[dict] = None
+_prefix_nodes: Dict[str, dict] = {}  # Первые две буквы слов (со всеми заменами _L33T) -> узел дерева после них
+_keyboard: Optional[Tuple[Dict[str, Dict[str, int]], float, float, Dict[str, int]]] = None
+
+
+class Pattern(NamedTuple):
+    kind: str  # dictionary, keyboard, repeat, sequence, bruteforce
+    token: str
+    entropy: float
+
+
+class StrengthResult(NamedTuple):
+    entropy: float  # Оценка log2 числа попыток
+    score: int  # 0 - угадывается мгновенно, 4 - стойкий
+    patterns: Tuple[Pattern, ...]
+
+
+def load_dictionary(words: Iterable[str]):
+    """Замена словаря: слова по убыванию популярности (ранг - позиция в списке)
+
+    Ключи дерева - слова после замен _L33T, поэтому P@ssw0rd и password
+    находятся за один проход. Слова короче двух символов пропускаются.
+    """
+    global _trie, _prefix_nodes
+    trie: dict = {}
+    prefixes = set()
+    for rank, word in enumerate(words, 1):
+        word = word.lower()
+        key = word.translate(_L33T)
+        if len(key) < 2:
+            continue
+        node = trie
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault("", (rank, word))  # Пустой ключ - конец слова: ранг и само слово
+        prefixes.add(key[:2])
+    variants = {char: char for char in set("".join(prefixes))}
+    for source, target in zip(_L33T_FROM, _L33T_TO):
+        if target in variants:
+            variants[target] += source
+    _trie = trie
+    _prefix_nodes = {a + b: trie[prefix[0]][prefix[1]]
+                     for prefix in prefixes for a in variants[prefix[0]] for b in variants[prefix[1]]}
+    password_strength.cache_clear()
+
+
+def dictionary_trie() -> dict:
+    """Префиксное дерево словаря; по умолчанию строится из COMMON_WORDS один раз"""
+    if _trie is None:
+        load_dictionary(COMMON_WORDS)
+    return _trie
+
+
+def keyboard_graph() -> Tuple[Dict[str, Dict[str, int]], float, float, Dict[str, int]]:
+    """Граф соседних клавиш {клавиша: {сосед: направление}}, log2 числа клавиш и средней степени,
+    направления всех пар соседних клавиш строками из двух символов (в том числе с Shift)"""
+    global _keyboard
+    if _keyboard is None:
+        graph: Dict[str, Dict[str, int]] = {}
+        for rows in KEYBOARD_LAYOUTS:
+            for r, row in enumerate(rows):
+                for c, key in enumerate(row):
+                    neighbours = graph.setdefault(key, {})
+                    for direction, (dr, dc) in enumerate(_DIRECTIONS):
+                        if 0 <= r + dr < len(rows) and 0 <= c + dc < len(rows[r + dr]):
+                            neighbours[rows[r + dr][c + dc]] = direction
+        degree = sum(len(neighbours) for neighbours in graph.values()) / len(graph)
+        variants = {key: key for key in graph}
+        for shifted, key in zip(_SHIFTED, _UNSHIFTED):
+            if key in variants:
+                variants[key] += shifted
+        pairs = {a + b: direction for key, neighbours in graph.items() for neighbour, direction in neighbours.items()
+                 for a in variants[key] for b in variants[neighbour]}
+        _keyboard = graph, math.log2(len(graph)), math.log2(degree), pairs
+    return _keyboard
+
+
+def _variations(count: int, total: int) -> float:
+    """log2 числа способов выбрать до count особых символов из total (не меньше 1 бита)"""
+    count = min(count, total - count)
+    return math.log2(sum(math.comb(total, i) for i in range(1, count + 1))) if count > 0 else 1.0
+
+
+def _uppercase_entropy(token: str) -> float:
+    """Дополнительные биты за заглавные буквы в слове"""
+    if token.islower() or not any(char.isupper() for char in token):
+        return 0.0
+    if token.isupper() or (token[0].isupper() and token[1:].islower()):
+        return 1.0
+    upper = sum(1 for char in token if char.isupper())
+    return _variations(upper, sum(1 for char in token if char.isalpha()))
+
+
+def _cardinality(password: str) -> int:
+    """Размер алфавита перебора по классам символов пароля"""
+    classes = set(password.translate(_CHAR_CLASSES))  # Символы вне ASCII остаются как есть
+    size = 0 if password.isascii() else 100
+    if "a" in classes:
+        size += 26
+    if "A" in classes:
+        size += 26
+    if "0" in classes:
+        size += 10
+    if "!" in classes:
+        size += 33
+    return size
+
+
+def _bigrams(text: str) -> List[str]:
+    """Пары соседних символов (склейка map на уровне C)"""
+    return list(map(add, text, text[1:]))
+
+
+# Поиски получают пары символов пароля в нижнем регистре и сначала
+# сверяют их с таблицами пар шаблона на уровне C (isdisjoint, map):
+# цикл на Python идет только по найденным кандидатам, а не по позициям
+
+def _dictionary_matches(password: str, lowered: str, lowered_bigrams: List[str], matches: list):
+    dictionary_trie()
+    prefix_nodes = _prefix_nodes
+    if prefix_nodes.keys().isdisjoint(lowered_bigrams):
+        return
+    text = None
+    n = len(lowered)
+    for i in compress(count(), map(prefix_nodes.__contains__, lowered_bigrams)):
+        if text is None:
+            text = lowered.translate(_L33T)
+        node = prefix_nodes[lowered_bigrams[i]]
+        j = i + 1
+        while True:
+            found = node.get("")
+            if found is not None:
+                rank, word = found
+                token = lowered[i:j + 1]
+                entropy = math.log2(rank + 1) + _uppercase_entropy(password[i:j + 1])
+                if token != word:
+                    substituted = sum(map(ne, token, word))
+                    entropy += _variations(substituted, j + 1 - i)
+                matches.append((i, j + 1, entropy, "dictionary"))
+            j += 1
+            if j == n:
+                break
+            node = node.get(text[j])
+            if node is None:
+                break
+
+
+def _keyboard_matches(password: str, lowered: str, lowered_bigrams: List[str], matches: list):
+    _, start_bits, degree_bits, pairs = keyboard_graph()
+    if pairs.keys().isdisjoint(lowered_bigrams):
+        return
+    adjacent = bytes(map(pairs.__contains__, lowered_bigrams))
+    if b"\x01\x01" not in adjacent:
+        return
+    # Прогулка: подряд идущие пары соседних клавиш, i..j - ее пары
+    for run in _RUN.finditer(adjacent):
+        i, j = run.span()
+        directions = list(map(pairs.__getitem__, lowered_bigrams[i:j]))
+        turns = 1 + sum(map(ne, directions, directions[1:]))
+        length = j + 1 - i
+        token = password[i:j + 1]
+        entropy = start_bits + turns * degree_bits + math.log2(math.comb(length - 1, turns - 1))
+        shifted = sum(map(ne, token, lowered[i:j + 1].translate(_UNSHIFT)))
+        if shifted:
+            entropy += _variations(shifted, length)
+        matches.append((i, j + 1, entropy, "keyboard"))
+
+
+def _sequence_matches(password: str, lowered_bigrams: List[str], matches: list):
+    if _SEQUENCE_PAIRS.isdisjoint(lowered_bigrams):
+        return
+    codes = list(map(ord, password))
+    steps = bytes(map(_SEQUENCE_STEPS.get, map(sub, codes[1:], codes), repeat(0)))
+    for run in _SEQUENCE_RUN.finditer(steps):
+        i, j = run.span()
+        length = j + 1 - i
+        first = password[i]
+        base = 4 if first in "aAzZ019" else 10 if first.isdigit() else 26
+        entropy = math.log2(base) + math.log2(length) + (1 if steps[i] == 2 else 0)
+        matches.append((i, j + 1, entropy, "sequence"))
+
+
+def _repeat_matches(password: str, lowered_bigrams: List[str], matches: list):
+    if len(set(lowered_bigrams)) == len(lowered_bigrams):  # Любой повтор длиной от 3 повторяет пару символов
+        return
+    # Повтор блока с позиции i начинается с пары символов, которая встречается
+    # дальше (или из двух одинаковых символов): _REPEAT запускается только
+    # с таких позиций, а не перебирает блоки со всех позиций пароля
+    bigrams = _bigrams(password)  # _REPEAT различает регистр
+    later = set()
+    starts = []
+    for i in range(len(bigrams) - 1, -1, -1):
+        bigram = bigrams[i]
+        if bigram in later or bigram[0] == bigram[1]:
+            starts.append(i)
+        later.add(bigram)
+    end = 0
+    for i in reversed(starts):
+        if i < end:
+            continue
+        match = _REPEAT.match(password, i)
+        if match is None:
+            continue
+        end = match.end()
+        if end - i < 3:
+            continue
+        base = match.group(1)
+        copies = (match.end() - match.start()) // len(base)
+        entropy = _minimum_entropy(base)[0] + math.log2(copies)
+        matches.append((match.start(), match.end(), entropy, "repeat"))
+
+
+def _minimum_entropy(password: str) -> Tuple[float, List[Pattern]]:
+    """Разбиение пароля на шаблоны и перебор с минимальной суммарной энтропией"""
+    n = len(password)
+    if not n:
+        return 0.0, []
+    lowered = password.lower()
+    if len(lowered) != n:
+        # lower() удлиняет некоторые символы ("İ" -> "i̇"); смещения совпадений
+        # должны указывать в password, поэтому такие символы остаются как есть
+        lowered = "".join(char if len(low) != 1 else low for char, low in zip(password, map(str.lower, password)))
+    bigrams = _bigrams(lowered)
+    matches: list = []
+    _dictionary_matches(password, lowered, bigrams, matches)
+    _keyboard_matches(password, lowered, bigrams, matches)
+    _sequence_matches(password, bigrams, matches)
+    _repeat_matches(password, bigrams, matches)
+
+    char_bits = math.log2(_cardinality(password))
+    if not matches:
+        return n * char_bits, [Pattern("bruteforce", password, n * char_bits)]
+
+    # Перебор линеен по длине, поэтому динамику достаточно считать только
+    # в границах шаблонов: между ними выгоднее всего продолжать перебор
+    ending: Dict[int, list] = {}
+    for match in matches:
+        ending.setdefault(match[1], []).append(match)
+    points = sorted({n}.union(*((match[0], match[1]) for match in matches)))
+    best = {0: 0.0}
+    choice: Dict[int, object] = {}  # Шаблон, закончившийся в точке, или начало перебора
+    previous = 0
+    for point in points:
+        entropy = best[previous] + (point - previous) * char_bits
+        chosen: object = previous
+        for match in ending.get(point, ()):
+            if best[match[0]] + match[2] < entropy:
+                entropy = best[match[0]] + match[2]
+                chosen = match
+        best[point] = entropy
+        choice[point] = chosen
+        previous = point
+
+    patterns: List[Pattern] = []
+    end = n
+    brute_end = None
+    while end > 0:
+        chosen = choice[end]
+        if type(chosen) is int:
+            if brute_end is None:
+                brute_end = end
+            end = chosen
+            continue
+        if brute_end is not None:
+            patterns.append(Pattern("bruteforce", password[end:brute_end], (brute_end - end) * char_bits))
+            brute_end = None
+        patterns.append(Pattern(chosen[3], password[chosen[0]:end], chosen[2]))
+        end = chosen[0]
+    if brute_end is not None:
+        patterns.append(Pattern("bruteforce", password[:brute_end], brute_end * char_bits))
+    patterns.reverse()
+    return best[n], patterns
+
+
+@lru_cache(maxsize=1 << 16)
+def password_strength(password: str) -> StrengthResult:
+    """Энтропия (бит), оценка 0..4 и найденные шаблоны пароля"""
+    entropy, patterns = _minimum_entropy(password)
+    score = 0
+    for bits in _SCORE_BITS:
+        if entropy >= bits:
+            score += 1
+    return StrengthResult(entropy, score, tuple(patterns))
@@ -0,0 +1,544 @@
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from laba1 import (
+    iter_json_array, VehicleManager, ColumnarVehicleStore, Vehicle, Car, Truck, Engine,
+    ElectricEngine, CombustionEngine, AutoTransmission, ManualTransmission,
+    register_engine, ENGINE_TYPES
+)
+
+
+def make_car(id, brand="Tesla", year=2023, power=150):
+    return Car(
+        id=id,
+        brand=brand,
+        model="Model S",
+        year=year,
+        engine=ElectricEngine(power=power, battery_capacity=75.0),
+        transmission=AutoTransmission(gears=1, mode="Eco"),
+        body_type="Sedan"
+    )
+
+
+def make_truck(id, brand="Volvo", year=2020, power=400):
+    return Truck(
+        id=id,
+        brand=brand,
+        model="FH16",
+        year=year,
+        engine=CombustionEngine(power=power, fuel_type="Diesel"),
+        transmission=ManualTransmission(gears=12, clutch_type="Dry"),
+        load_capacity=25.0
+    )
+
+
+class HydrogenEngine(Engine):
+    """Двигатель вне модуля laba1 - проверка расширения реестра ENGINE_TYPES"""
+    __slots__ = ("tank",)
+
+    def __init__(self, power, tank):
+        super().__init__("Hydrogen", power)
+        self.tank = tank
+
+    def get_info(self):
+        info = super().get_info()
+        info["tank"] = self.tank
+        return info
+
+    @classmethod
+    def _from_fields(cls, data):
+        return cls(data["power"], data["tank"])
+
+
+@contextlib.contextmanager
+def hydrogen_registered():
+    """HydrogenEngine в реестре на время блока"""
+    register_engine("Hydrogen")(HydrogenEngine)
+    try:
+        yield
+    finally:
+        del ENGINE_TYPES["Hydrogen"]
+
+
+class TestVehicleManagerIndex(unittest.TestCase):
+    def setUp(self):
+        self.manager = VehicleManager()
+        for i in range(5):
+            self.manager.create(make_car(str(i)))
+
+    def test_read_uses_index(self):
+        self.assertEqual(self.manager.read("3").id, "3")
+        self.assertIsNone(self.manager.read("42"))
+
+    def test_duplicate_id_rejected(self):
+        self.assertFalse(self.manager.create(make_car("2")))
+        self.assertEqual(len(self.manager), 5)
+
+    def test_delete_keeps_order(self):
+        self.assertTrue(self.manager.delete("1"))
+        self.assertFalse(self.manager.delete("1"))
+        self.assertEqual([v.id for v in self.manager.read_all()], ["0", "2", "3", "4"])
+
+    def test_update_keeps_index(self):
+        self.assertTrue(self.manager.update("2", year=2020))
+        self.assertEqual(self.manager.read("2").year, 2020)
+        self.assertFalse(self.manager.update("42", year=2020))
+
+    def test_laba1_setter_rebuilds_index(self):
+        self.manager.laba1 = [make_car("a"), make_truck("b")]
+        self.assertEqual(self.manager.read("b").brand, "Volvo")
+        with self.assertRaises(ValueError):
+            self.manager.laba1 = [make_car("a"), make_car("a")]
+
+    def test_laba1_is_read_only(self):
+        vehicles = self.manager.laba1
+        self.assertEqual([v.id for v in vehicles], ["0", "1", "2", "3", "4"])
+        with self.assertRaises(AttributeError):
+            vehicles.append(make_car("5"))
+
+
+class TestBatchOperations(unittest.TestCase):
+    def setUp(self):
+        self.manager = VehicleManager(indexes=["brand", "year"])
+        self.manager.create_many(make_car(str(i), year=2000 + i) for i in range(5))
+
+    def ids(self, **conditions):
+        return sorted(v.id for v in self.manager.query(**conditions))
+
+    def test_create_many_is_atomic(self):
+        result = self.manager.create_many([make_car("10"), make_car("3"), make_car("10")])
+        self.assertFalse(result.ok)
+        self.assertEqual(result.applied, 0)
+        self.assertEqual(len(result.errors), 2)
+        self.assertNotIn("10", self.manager)
+
+        result = self.manager.create_many([make_truck("10", year=2010), make_car("11")])
+        self.assertEqual((result.ok, result.applied), (True, 2))
+        self.assertEqual(self.ids(year__gte=2004), ["10", "11", "4"])
+
+    def test_update_many_is_atomic(self):
+        result = self.manager.update_many({"1": {"brand": "BMW"}, "2": {"color": "red"}})
+        self.assertFalse(result.ok)
+        self.assertEqual(self.manager.read("1").brand, "Tesla")
+        self.assertFalse(self.manager.update_many([("1", {"vehicle_type": "Truck"})]).ok)
+        self.assertFalse(self.manager.update_many({"42": {"year": 1}}).ok)
+
+        result = self.manager.update_many({"1": {"brand": "BMW"}, "2": {"brand": "BMW", "year": 1990}})
+        self.assertTrue(result.ok)
+        self.assertEqual(self.ids(brand="BMW"), ["1", "2"])
+        self.assertEqual(self.ids(year__lt=2000), ["2"])
+
+    def test_delete_many_is_atomic(self):
+        self.assertFalse(self.manager.delete_many(["1", "42"]).ok)
+        self.assertFalse(self.manager.delete_many(["1", "1"]).ok)
+        self.assertEqual(len(self.manager), 5)
+        self.assertTrue(self.manager.delete_many(["1", "3"]).ok)
+        self.assertEqual([v.id for v in self.manager.read_all()], ["0", "2", "4"])
+        self.assertEqual(self.ids(year__gte=2000), ["0", "2", "4"])
+
+    def test_silent_by_default(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.manager.create(make_car("x"))
+            self.manager.create_many([make_car("y")])
+            self.manager.delete("x")
+        self.assertEqual(output.getvalue(), "")
+
+
+class TestCompactVehicles(unittest.TestCase):
+    def test_no_instance_dict_and_shared_strings(self):
+        first, second = make_truck("1"), make_truck("2", brand="".join(["Vol", "vo"]))
+        for obj in (first, first.engine, first.transmission):
+            self.assertFalse(hasattr(obj, "__dict__"))
+        self.assertIs(first.brand, second.brand)
+        self.assertIs(first.engine.fuel_type, second.engine.fuel_type)
+
+    def test_update_keeps_hasattr_setattr_semantics(self):
+        manager = VehicleManager()
+        manager.create(make_car("1"))
+        self.assertTrue(manager.update("1", body_type="SUV", color="red", vehicle_type="Truck"))
+        vehicle = manager.read("1")
+        self.assertEqual(vehicle.body_type, "SUV")
+        self.assertEqual(vehicle.vehicle_type, "Car")
+        self.assertFalse(hasattr(vehicle, "color"))
+
+
+class TestVehicleManagerQuery(unittest.TestCase):
+    def setUp(self):
+        self.manager = VehicleManager(indexes=["brand", "year", "power", "engine_type"])
+        self.manager.create(make_car("1", brand="Tesla", year=2023, power=150))
+        self.manager.create(make_car("2", brand="Tesla", year=2021, power=300))
+        self.manager.create(make_car("3", brand="BMW", year=2024, power=200))
+        self.manager.create(make_truck("4", brand="Volvo", year=2022, power=400))
+
+    def ids(self, **conditions):
+        return sorted(v.id for v in self.manager.query(**conditions))
+
+    def test_equality_and_range(self):
+        self.assertEqual(self.ids(engine_type="Electric", year__gte=2022, power__gt=150), ["3"])
+        self.assertEqual(self.ids(brand="Tesla"), ["1", "2"])
+        self.assertEqual(self.ids(year__gt=2021, year__lt=2024), ["1", "4"])
+        self.assertEqual(self.ids(brand__in={"BMW", "Volvo"}, vehicle_type="Truck"), ["4"])
+        self.assertEqual(self.ids(brand__in=["Tesla", "Tesla"]), ["1", "2"])
+
+    def test_query_is_lazy(self):
+        result = self.manager.query(brand="Tesla")
+        self.assertFalse(isinstance(result, list))
+        self.assertEqual(next(result).brand, "Tesla")
+
+    def test_indexes_follow_update_and_delete(self):
+        self.manager.update("1", year=2010, brand="BMW")
+        self.manager.update("3", engine=CombustionEngine(power=90, fuel_type="Petrol"))
+        self.manager.delete("4")
+        self.assertEqual(self.ids(year__lte=2010), ["1"])
+        self.assertEqual(self.ids(brand="BMW"), ["1", "3"])
+        self.assertEqual(self.ids(engine_type="Electric"), ["1", "2"])
+        self.assertEqual(self.ids(power__lt=100), ["3"])
+        self.assertEqual(self.ids(brand="Volvo"), [])
+
+    def test_failed_update_rolls_back_indexes(self):
+        with self.assertRaises(TypeError):
+            self.manager.update("1", brand="BMW", year="2021")
+        vehicle = self.manager.read("1")
+        self.assertEqual((vehicle.brand, vehicle.year), ("Tesla", 2023))
+        self.assertEqual(self.ids(brand="Tesla"), ["1", "2"])
+        self.assertEqual(self.ids(year__gte=2023), ["1", "3"])
+        self.assertTrue(self.manager.delete("1"))
+        self.assertEqual(self.ids(year__gte=2021), ["2", "3", "4"])
+
+    def test_unindexed_fields_match_indexed(self):
+        plain = VehicleManager()
+        plain.laba1 = self.manager.read_all()
+        for conditions in [dict(brand="Tesla", power__gte=200), dict(year__in=(2021, 2024))]:
+            self.assertEqual(sorted(v.id for v in plain.query(**conditions)), self.ids(**conditions))
+
+    def test_unknown_field_rejected(self):
+        with self.assertRaises(ValueError):
+            self.manager.query(color="red")
+
+
+class TestColumnarStore(unittest.TestCase):
+    def setUp(self):
+        self.manager = VehicleManager()
+        self.manager.laba1 = [
+            make_car("1", brand="Tesla", year=2023, power=150),
+            make_car("2", brand="Tesla", year=2021, power=300),
+            make_car("3", brand="BMW", year=2024, power=200),
+            make_truck("4", brand="Volvo", year=2022, power=400),
+        ]
+        self.store = self.manager.to_columnar()
+
+    def test_read_returns_real_subclasses(self):
+        for vehicle in self.manager.read_all():
+            restored = self.store.read(vehicle.id)
+            self.assertIs(type(restored), type(vehicle))
+            self.assertEqual(restored.to_dict(), vehicle.to_dict())
+        self.assertIsNone(self.store.read("42"))
+
+    def test_roundtrip_keeps_registered_types(self):
+        with hydrogen_registered():
+            rng = random.Random(3)
+            vehicles = [random_vehicle(rng, str(i)) for i in range(200)]
+            vehicles.append(Car("h", "Toyota", "Mirai", 2024, HydrogenEngine(134, 5.6),
+                                AutoTransmission(1), body_type="Sedan"))
+            store = ColumnarVehicleStore(vehicles)
+            for original in vehicles:
+                restored = store.read(original.id)
+                self.assertIs(type(restored.engine), type(original.engine))
+                self.assertIs(type(restored.transmission), type(original.transmission))
+                self.assertEqual(restored.to_dict(), original.to_dict())
+            self.assertTrue(store.update("h", year=2025))
+            self.assertEqual(store.read("h").engine.tank, 5.6)
+            self.assertEqual(store.count(engine_type="Hydrogen"), 1)
+        with self.assertRaises(ValueError):
+            store.read("h")
+
+    def test_filter_matches_query(self):
+        conditions = dict(engine_type="Electric", year__gte=2022, power__gt=100)
+        self.assertEqual(list(self.store.filter(**conditions)),
+                         [v.id for v in self.manager.query(**conditions)])
+        self.assertEqual(list(self.store.filter(brand__in=["BMW", "Volvo"])), ["3", "4"])
+
+    def test_aggregates(self):
+        self.assertEqual(self.store.mean("power", by="brand"),
+                         {"Tesla": 225.0, "BMW": 200.0, "Volvo": 400.0})
+        self.assertEqual(self.store.count(by="year", year__lt=2023), {2021: 1, 2022: 1})
+        self.assertEqual(self.store.count(vehicle_type="Truck"), 1)
+        self.assertEqual(self.store.aggregate("battery_capacity"), 225.0)  # NaN у грузовика пропущен
+        edges, counts = self.store.histogram("power", bins=2)
+        self.assertEqual((edges, counts), ([150.0, 275.0, 400.0], [2, 2]))
+
+    def test_update_delete_and_compact(self):
+        self.assertTrue(self.store.update("1", brand="BMW", color="red", vehicle_type="Truck"))
+        self.assertEqual(self.store.read("1").to_dict(), self.manager.read("1").to_dict() | {"brand": "BMW"})
+        self.assertTrue(self.store.delete("2"))
+        self.assertFalse(self.store.delete("2"))
+        self.assertEqual(self.store.count(by="brand"), {"BMW": 2, "Volvo": 1})
+        self.store.compact()
+        self.assertEqual([v.id for v in self.store.read_all()], ["1", "3", "4"])
+        self.assertEqual(self.store.read("4").load_capacity, 25.0)
+
+
+def random_vehicle(rng, id):
+    """Случайная машина любого зарегистрированного типа"""
+    if rng.random() < 0.5:
+        engine = ElectricEngine(rng.choice([rng.randint(50, 900), rng.uniform(50, 900)]),
+                                rng.uniform(10, 150))
+    else:
+        engine = CombustionEngine(rng.randint(50, 900), rng.choice(["Petrol", "Diesel", "Газ"]))
+    if rng.random() < 0.5:
+        transmission = AutoTransmission(rng.randint(1, 10), rng.choice(["Normal", "Eco", "Sport"]))
+    else:
+        transmission = ManualTransmission(rng.randint(4, 7), rng.choice(["Hydraulic", "Cable"]))
+    common = (id, rng.choice(["Tesla", "Лада", "BMW & Co"]), f"M{rng.randint(0, 99)}",
+              rng.randint(1950, 2030), engine, transmission)
+    kind = rng.random()
+    if kind < 0.4:
+        vehicle = Car(*common, body_type=rng.choice(["Sedan", "SUV"]))
+    elif kind < 0.8:
+        vehicle = Truck(*common, load_capacity=rng.choice([rng.randint(1, 40), rng.uniform(1, 40)]))
+    else:
+        vehicle = Vehicle(*common)
+    if rng.random() < 0.2:
+        vehicle.extra = {"range": rng.uniform(100, 900)}
+    return vehicle
+
+
+class TestFromDictRegistry(unittest.TestCase):
+    def test_json_roundtrip_property(self):
+        rng = random.Random(2024)
+        manager = VehicleManager()
+        manager.laba1 = [random_vehicle(rng, str(i)) for i in range(300)]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "laba1.json")
+            manager.save_to_json(filename)
+            loaded = VehicleManager()
+            loaded.load_from_json(filename)
+        for original, restored in zip(manager.read_all(), loaded.read_all(), strict=True):
+            self.assertIs(type(restored), type(original))
+            self.assertIs(type(restored.engine), type(original.engine))
+            self.assertIs(type(restored.transmission), type(original.transmission))
+            self.assertEqual(restored.to_dict(), original.to_dict())
+
+    def test_from_dicts_bulk(self):
+        rng = random.Random(7)
+        vehicles = [random_vehicle(rng, str(i)) for i in range(50)]
+        restored = Vehicle.from_dicts(v.to_dict() for v in vehicles)
+        self.assertEqual([v.to_dict() for v in restored], [v.to_dict() for v in vehicles])
+
+    def test_infer_type_without_vehicle_type(self):
+        data = make_truck("1").to_dict()
+        del data["vehicle_type"]
+        self.assertIsInstance(Vehicle.from_dict(data), Truck)
+
+    def test_unknown_types_rejected(self):
+        data = make_car("1").to_dict()
+        data["engine"]["type"] = "Steam"
+        with self.assertRaises(ValueError):
+            Vehicle.from_dict(data)
+        data = make_car("1").to_dict()
+        data["vehicle_type"] = "Boat"
+        with self.assertRaises(ValueError):
+            Vehicle.from_dict(data)
+
+    def test_new_engine_type_can_be_registered(self):
+        with hydrogen_registered():
+            data = make_car("1").to_dict()
+            data["engine"] = {"type": "Hydrogen", "power": 120, "tank": 5.6}
+            self.assertEqual(Vehicle.from_dict(data).to_dict(), data)
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "laba1.snap")
+        rng = random.Random(9)
+        self.manager = VehicleManager()
+        self.manager.laba1 = [random_vehicle(rng, f"id-{i}") for i in range(200)]
+        self.manager.save_snapshot(self.filename)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_roundtrip(self):
+        loaded = VehicleManager()
+        loaded.load_snapshot(self.filename)
+        self.assertEqual([v.to_dict() for v in loaded.read_all()],
+                         [v.to_dict() for v in self.manager.read_all()])
+
+    def test_lazy_read_and_hydrate(self):
+        loaded = VehicleManager()
+        loaded.load_snapshot(self.filename)
+        self.assertEqual(len(loaded), 200)
+        self.assertIn("id-17", loaded)
+        self.assertNotIn("id-999", loaded)
+        vehicle = loaded.read("id-17")
+        self.assertIs(type(vehicle), type(self.manager.read("id-17")))
+        self.assertIsNone(loaded.read("id-999"))
+        self.assertIsNotNone(loaded._snapshot)  # Записи пока не развернуты
+
+        loaded.update("id-17", year=1901)
+        loaded.create(make_car("new"))  # Разворачивает снимок
+        self.assertIsNone(loaded._snapshot)
+        self.assertIs(loaded.read("id-17"), vehicle)
+        self.assertEqual(loaded.read("id-17").year, 1901)
+        self.assertEqual(len(loaded), 201)
+
+    def test_indexes_after_snapshot(self):
+        loaded = VehicleManager(indexes=["year"])
+        loaded.load_snapshot(self.filename)
+        self.assertEqual(sorted(v.id for v in loaded.query(year__gte=2000)),
+                         sorted(v.id for v in self.manager.query(year__gte=2000)))
+
+    def test_failed_save_keeps_old_snapshot(self):
+        broken = VehicleManager()
+        broken.laba1 = [make_car("bad")]
+        broken.read("bad").year = 2022.5  # Не упаковывается в поле года
+        with self.assertRaises(Exception):
+            broken.save_snapshot(self.filename)
+        self.assertFalse(os.path.exists(self.filename + ".tmp"))
+        loaded = VehicleManager()
+        loaded.load_snapshot(self.filename)
+        self.assertEqual(len(loaded), 200)
+
+    def test_resave_keeps_open_reader(self):
+        loaded = VehicleManager()
+        loaded.load_snapshot(self.filename)
+        expected = self.manager.read("id-17").to_dict()
+        self.manager.laba1 = [make_car("other")]
+        self.manager.save_snapshot(self.filename)
+        # Старый снимок остается доступен через mmap уже открывшего его менеджера
+        self.assertEqual(len(loaded), 200)
+        self.assertEqual(loaded.read("id-17").to_dict(), expected)
+
+    def test_rejects_foreign_file(self):
+        with open(self.filename, "wb") as f:
+            f.write(b"not a snapshot" * 10)
+        loaded = VehicleManager()
+        loaded.load_snapshot(self.filename)
+        self.assertEqual(len(loaded), 0)
+
+
+class TestStreamingJson(unittest.TestCase):
+    def test_iter_json_array_small_chunks(self):
+        data = [1, 23456, -7.5e3, "a,]b", {"x": [1, 2, {"y": None}]}, [], True]
+        text = " \n" + json.dumps(data, indent=3) + "\n"
+        for chunk_size in (1, 2, 3, 7, 1 << 16):
+            self.assertEqual(list(iter_json_array(io.StringIO(text), chunk_size)), data)
+        self.assertEqual(list(iter_json_array(io.StringIO(" [ ] "))), [])
+
+    def test_iter_json_array_rejects_garbage(self):
+        for text in ("{}", "[1 2]", "[1,", "[{\"a\": }]"):
+            with self.assertRaises(ValueError):
+                list(iter_json_array(io.StringIO(text), 2))
+
+    def test_save_load_roundtrip_with_progress(self):
+        manager = VehicleManager()
+        manager.laba1 = [make_car(str(i)) for i in range(25)]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "laba1.json")
+            manager.save_to_json(filename)
+            with open(filename, encoding="utf-8") as f:
+                self.assertEqual(json.load(f), [v.to_dict() for v in manager.read_all()])
+
+            reports = []
+            loaded = VehicleManager()
+            loaded.load_from_json(filename, progress=lambda *args: reports.append(args))
+            self.assertEqual([v.id for v in loaded.read_all()], [str(i) for i in range(25)])
+            self.assertEqual(reports[-1][0], 25)
+            self.assertEqual(reports[-1][1], reports[-1][2])
+
+
+class TestJsonLinesJournal(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmp.name, "laba1.jsonl")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def reopen(self):
+        manager = VehicleManager(indexes=["brand"])
+        manager.open_journal(self.filename)
+        return manager
+
+    def test_replay_after_crud(self):
+        manager = self.reopen()
+        manager.create(make_car("1"))
+        manager.create(make_truck("2"))
+        manager.create(make_car("3"))
+        manager.update("1", brand="BMW")
+        manager.delete("2")
+        manager.close_journal()
+
+        restored = self.reopen()
+        self.assertEqual([v.to_dict() for v in restored.read_all()],
+                         [v.to_dict() for v in manager.read_all()])
+        self.assertEqual([v.id for v in restored.query(brand="BMW")], ["1"])
+
+    def test_appends_one_line_per_change(self):
+        manager = self.reopen()
+        manager.create(make_car("1"))
+        manager.update("1", year=2000)
+        manager.delete("1")
+        with open(self.filename, encoding="utf-8") as f:
+            ops = [json.loads(line)["op"] for line in f]
+        self.assertEqual(ops, ["put", "put", "delete"])
+
+    def test_partial_tail_is_ignored(self):
+        manager = self.reopen()
+        manager.create(make_car("1"))
+        manager.close_journal()
+        with open(self.filename, "a", encoding="utf-8") as f:
+            f.write('{"op": "put", "vehicle": {"id": "2"')
+
+        restored = self.reopen()
+        self.assertEqual([v.id for v in restored.read_all()], ["1"])
+        restored.create(make_car("3"))
+        restored.close_journal()
+        self.assertEqual([v.id for v in self.reopen().read_all()], ["1", "3"])
+
+    def test_compact(self):
+        manager = self.reopen()
+        for i in range(10):
+            manager.create(make_car(str(i)))
+            manager.update(str(i), year=2000 + i)
+        for i in range(5):
+            manager.delete(str(i))
+        manager.compact_journal()
+        with open(self.filename, encoding="utf-8") as f:
+            self.assertEqual(len(f.readlines()), 5)
+        manager.create(make_car("x"))
+        manager.close_journal()
+        self.assertEqual([v.id for v in self.reopen().read_all()], ["5", "6", "7", "8", "9", "x"])
+
+
+class TestXml(unittest.TestCase):
+    def test_load_repo_xml_keeps_extra_fields(self):
+        manager = VehicleManager()
+        manager.load_from_xml(os.path.join(os.path.dirname(os.path.abspath(__file__)), "laba1.xml"))
+        tesla = manager.read("1")
+        self.assertEqual(len(manager), 3)
+        self.assertEqual(tesla.engine.battery_capacity, 75.0)
+        self.assertEqual(tesla.transmission.mode, "Eco")
+        self.assertIsInstance(tesla, Car)
+        self.assertEqual(tesla.body_type, "Sedan")
+        self.assertEqual(tesla.extra, {"range": 600.0})
+        self.assertEqual(manager.read("2").transmission.gears, 8)
+
+    def test_xml_roundtrip(self):
+        manager = VehicleManager()
+        manager.laba1 = [make_car("1"), make_truck("2"), make_car("3", brand="Kia & Co <x>")]
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "laba1.xml")
+            manager.save_to_xml(filename)
+            self.assertEqual([v.to_dict() for v in VehicleManager.iter_xml(filename)],
+                             [v.to_dict() for v in manager.read_all()])
+
+
+if __name__ == '__main__':
+    unittest.main()
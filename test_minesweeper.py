@@ -0,0 +1,124 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Без окна: проверка отрисовки на любом сервере
+
+try:
+    import pygame
+    from Minesweeper import Minesweeper
+except ImportError:
+    pygame = None
+
+
+def field_pixels(game):
+    """Пиксели видимой части поля на экране"""
+    rect = pygame.Rect(game.field_x, game.field_y, game.field_width, game.field_height)
+    return pygame.image.tostring(game.screen.subsurface(rect), "RGB")
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestRendering(unittest.TestCase):
+    def start(self, difficulty="easy"):
+        game = Minesweeper(seed=1)
+        game.set_difficulty(difficulty)
+        game.reset_game()
+        game.state = "game"
+        game.render_frame()
+        return game
+
+    def cell_center(self, game, row, col):
+        size = game.cell_size
+        return (game.field_x + (col - game.view_col) * size + size // 2,
+                game.field_y + (row - game.view_row) * size + size // 2)
+
+    def tearDown(self):
+        pygame.quit()
+
+    def test_incremental_frame_matches_full_redraw(self):
+        game = self.start()
+        game.handle_game_click(self.cell_center(game, 4, 4))
+        game.handle_game_click(self.cell_center(game, 0, 0), right_click=True)
+        self.assertGreater(len(game.dirty_cells), 1)
+
+        rects = game.update_game()
+        self.assertIsNotNone(rects)  # Только измененные клетки, без flip()
+        self.assertLessEqual(len(rects), game.MAX_DIRTY_RECTS + 1)
+        self.assertEqual(game.dirty_cells, [])
+        incremental = field_pixels(game)
+        game.draw_game()
+        self.assertEqual(incremental, field_pixels(game))
+
+    def test_nothing_changed_nothing_updated(self):
+        game = self.start()
+        game.handle_game_click(self.cell_center(game, 4, 4))
+        game.render_frame()
+        self.assertEqual(game.update_game(), [])
+
+    def test_tiles_are_built_once_per_cell_size(self):
+        game = self.start()
+        tiles = game.tiles
+        self.assertEqual(set(range(9)) | {"hidden", "flag", "mine", "exploded", "hidden_mine", "wrong_flag"},
+                         set(tiles))
+        for tile in tiles.values():
+            self.assertEqual(tile.get_size(), (game.cell_size, game.cell_size))
+        game.handle_game_click(self.cell_center(game, 4, 4))
+        game.render_frame()
+        self.assertIs(game.tiles, tiles)
+
+    def test_zoom_keeps_anchor_cell_and_rebuilds_tiles(self):
+        game = self.start("custom")
+        self.assertLess(game.visible_cols, game.cols)  # Поле 100x100 не помещается - прокрутка
+        anchor = self.cell_center(game, 20, 30)
+        game.zoom(1, anchor)
+        game.render_frame()
+        self.assertGreater(game.cell_size, 12)
+        self.assertEqual(next(iter(game.tiles.values())).get_size(), (game.cell_size, game.cell_size))
+        x, y = anchor
+        self.assertEqual((game.view_row + (y - game.field_y) // game.cell_size,
+                          game.view_col + (x - game.field_x) // game.cell_size), (20, 30))
+
+        for _ in range(20):
+            game.zoom(-1)
+        self.assertEqual((game.visible_rows, game.visible_cols), (game.rows, game.cols))
+        self.assertEqual((game.view_row, game.view_col), (0, 0))
+
+    def test_scroll_clamps_and_maps_clicks(self):
+        game = self.start("custom")
+        game.scroll_to(1000, -5)
+        self.assertEqual((game.view_row, game.view_col), (game.rows - game.visible_rows, 0))
+        game.handle_game_click(self.cell_center(game, 80, 3), right_click=True)
+        self.assertTrue(game.engine.is_flagged(80, 3))
+        game.render_frame()
+
+        # Флажок вне видимой части не рисуется, но появляется после прокрутки
+        game.engine.toggle_flag(0, 0)
+        game.dirty_cells.append((0, 0))
+        scrolled = game.update_game()
+        self.assertNotIn(pygame.Rect(game.field_x, game.field_y, game.cell_size, game.cell_size), scrolled)
+        game.scroll_to(0, 0)
+        game.render_frame()
+        self.assertEqual(game.cell_tile(0, 0), "flag")
+        self.assertEqual(game.board_surface.get_at((1, 1)), game.tiles["flag"].get_at((1, 1)))
+
+    def test_arrow_keys_and_wheel_scroll(self):
+        game = self.start("custom")
+        game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_DOWN, mod=0))
+        game.handle_event(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_RIGHT, mod=pygame.KMOD_SHIFT))
+        # Страница вправо упирается в край поля
+        self.assertEqual((game.view_row, game.view_col), (1, min(game.visible_cols, game.cols - game.visible_cols)))
+        game.handle_event(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=-1))
+        self.assertEqual(game.view_row, 4)
+        game.render_frame()
+        self.assertEqual(game.board_surface.get_size(), (game.field_width, game.field_height))
+
+    def test_timer_tick_only_in_running_game(self):
+        game = self.start()
+        self.assertEqual(game.next_timer_tick(), 0)
+        game.handle_game_click(self.cell_center(game, 4, 4))
+        self.assertTrue(0 < game.next_timer_tick() <= 1000)
+        game.state = "menu"
+        self.assertEqual(game.next_timer_tick(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
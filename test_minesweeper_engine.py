@@ -0,0 +1,245 @@
+import random
+import subprocess
+import sys
+import unittest
+from minesweeper_engine import Board, DIFFICULTIES, BORDER, MINE, pack_cells
+
+
+def revealed_cells(board):
+    return {(r, c) for r in range(board.rows) for c in range(board.cols) if board.is_revealed(r, c)}
+
+
+def play_safe_cells(board):
+    """Открывает все безопасные клетки по известной расстановке мин"""
+    for r in range(board.rows):
+        for c in range(board.cols):
+            if not board.is_mine(r, c):
+                board.click(r, c)
+
+
+class TestBoardEngine(unittest.TestCase):
+    def test_import_does_not_load_pygame(self):
+        code = "import sys, minesweeper_engine; print('pygame' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+    def test_seed_is_deterministic(self):
+        a = Board(16, 30, 99, seed=42)
+        b = Board(16, 30, 99, seed=42)
+        a.click(5, 5)
+        b.click(5, 5)
+        self.assertEqual(sorted(a.mine_positions()), sorted(b.mine_positions()))
+        self.assertEqual(revealed_cells(a), revealed_cells(b))
+
+        c = Board(16, 30, 99, seed=43)
+        c.click(5, 5)
+        self.assertNotEqual(sorted(a.mine_positions()), sorted(c.mine_positions()))
+
+    def test_first_click_safe_zone(self):
+        for seed in range(50):
+            board = Board.from_difficulty("hard", seed=seed)
+            board.click(0, 29)
+            self.assertEqual(len(board.mine_positions()), 99)
+            self.assertFalse(board.game_over)
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    r, c = 0 + dr, 29 + dc
+                    if 0 <= r < board.rows and 0 <= c < board.cols:
+                        self.assertFalse(board.is_mine(r, c))
+            # Первая клетка пустая - открывается целая область
+            self.assertEqual(board.cell_value(0, 29), 0)
+            self.assertGreater(len(revealed_cells(board)), 1)
+
+    def test_cell_values_match_neighbours(self):
+        board = Board(16, 16, 40, seed=1)
+        board.click(8, 8)
+        for r in range(board.rows):
+            for c in range(board.cols):
+                if board.is_mine(r, c):
+                    self.assertEqual(board.cell_value(r, c), -1)
+                else:
+                    expected = sum(
+                        board.is_mine(r + dr, c + dc)
+                        for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                        if 0 <= r + dr < board.rows and 0 <= c + dc < board.cols
+                    )
+                    self.assertEqual(board.cell_value(r, c), expected)
+
+    def test_flags_block_reveal_and_count_remaining(self):
+        board = Board(9, 9, 10, seed=3)
+        board.toggle_flag(0, 0)
+        self.assertTrue(board.is_flagged(0, 0))
+        self.assertEqual(board.mines_remaining, 9)
+        board.click(0, 0)  # флажок на первом клике: мины расставлены, клетка не открыта
+        self.assertFalse(board.is_revealed(0, 0))
+        self.assertFalse(board.first_click)
+        board.toggle_flag(0, 0)
+        self.assertEqual(board.mines_remaining, 10)
+
+    def test_hitting_mine_ends_game(self):
+        board = Board(9, 9, 10, seed=7)
+        board.click(4, 4)
+        mine = board.mine_positions()[0]
+        board.click(*mine)
+        self.assertTrue(board.game_over)
+        self.assertEqual(board.exploded_mine, mine)
+        # После проигрыша клики и флажки игнорируются
+        before = revealed_cells(board)
+        board.click(0, 0)
+        board.toggle_flag(0, 0)
+        self.assertEqual(revealed_cells(board), before)
+        self.assertFalse(board.is_flagged(0, 0))
+
+    def test_revealing_all_safe_cells_wins(self):
+        for difficulty in DIFFICULTIES:
+            board = Board.from_difficulty(difficulty, seed=11)
+            board.click(0, 0)
+            self.assertFalse(board.game_won)
+            play_safe_cells(board)
+            self.assertTrue(board.game_won)
+            self.assertFalse(board.game_over)
+            self.assertTrue(board.check_win())
+
+    def test_reset_starts_new_game(self):
+        board = Board(9, 9, 10, seed=5)
+        board.click(4, 4)
+        board.reset(seed=5)
+        self.assertTrue(board.first_click)
+        self.assertEqual(revealed_cells(board), set())
+        self.assertEqual(board.mine_positions(), [])
+        board.click(4, 4)
+        again = Board(9, 9, 10, seed=5)
+        again.click(4, 4)
+        self.assertEqual(sorted(board.mine_positions()), sorted(again.mine_positions()))
+
+    def test_reveal_returns_each_new_cell_once(self):
+        for seed in range(20):
+            board = Board(30, 40, 60, seed=seed)
+            opened = board.click(15, 20)
+            self.assertEqual(len(opened), len(set(opened)))
+            self.assertEqual(set(opened), revealed_cells(board))
+            # Повторное открытие ничего не меняет
+            self.assertEqual(board.reveal_cell(15, 20), [])
+            # Числа на границе области открыты, мины - нет
+            for r, c in opened:
+                self.assertFalse(board.is_mine(r, c))
+
+    def test_flood_fill_skips_flags(self):
+        board = Board(10, 10, 0, seed=0)
+        board.toggle_flag(9, 9)
+        opened = board.click(0, 0)
+        self.assertEqual(len(opened), 99)
+        self.assertFalse(board.is_revealed(9, 9))
+        self.assertFalse(board.game_won)
+
+    def test_flood_fill_large_board_without_recursion(self):
+        board = Board(400, 400, 1, seed=0)
+        opened = board.click(200, 200)
+        self.assertEqual(len(opened), 400 * 400 - 1)
+        self.assertTrue(board.game_won)
+
+    def test_counters_match_full_scan(self):
+        rng = random.Random(0)
+        for seed in range(30):
+            board = Board(12, 15, 25, seed=seed)
+            board.click(6, 7)
+            while not board.game_over and not board.game_won:
+                r, c = rng.randrange(board.rows), rng.randrange(board.cols)
+                if rng.random() < 0.3:
+                    board.toggle_flag(r, c)
+                else:
+                    board.click(r, c)
+                safe = sum(
+                    board.is_revealed(r, c) and not board.is_mine(r, c)
+                    for r in range(board.rows) for c in range(board.cols)
+                )
+                flags = sum(board.is_flagged(r, c) for r in range(board.rows) for c in range(board.cols))
+                self.assertEqual(board.safe_revealed, safe)
+                self.assertEqual(board.mines_remaining, board.mines_count - flags)
+                self.assertEqual(board.game_won, safe == board.rows * board.cols - board.mines_count)
+
+    def test_place_mines_exact_count_any_density(self):
+        for mines_count in (0, 1, 10, 36, 40, 71, 72):
+            for seed in range(5):
+                board = Board(9, 9, mines_count, seed=seed)
+                board.place_mines(4, 4)
+                mines = board.mine_positions()
+                self.assertEqual(len(mines), mines_count)
+                self.assertFalse(any(abs(r - 4) <= 1 and abs(c - 4) <= 1 for r, c in mines))
+
+    def test_place_mines_is_uniform(self):
+        hits = [0] * 25
+        games = 4000
+        for seed in range(games):
+            board = Board(5, 5, 4, seed=seed)
+            board.place_mines(0, 0)
+            for r, c in board.mine_positions():
+                hits[r * 5 + c] += 1
+        # 21 свободная клетка, ожидание 4000 * 4 / 21 ~ 762 на клетку
+        expected = games * 4 / 21
+        for i, count in enumerate(hits):
+            if i in (0, 1, 5, 6):
+                self.assertEqual(count, 0)
+            else:
+                self.assertLess(abs(count - expected), expected * 0.15)
+
+    def test_pack_cells_matches_brute_force(self):
+        rng = random.Random(2)
+        for rows, cols in ((1, 1), (1, 7), (6, 1), (7, 11), (20, 3)):
+            mine_map = bytearray(rng.random() < 0.3 for _ in range(rows * cols))
+            cells = pack_cells(mine_map, rows, cols)
+            width = cols + 2
+            self.assertEqual(len(cells), width * (rows + 2))
+            for r in range(-1, rows + 1):
+                for c in range(-1, cols + 1):
+                    cell = cells[(r + 1) * width + c + 1]
+                    if not (0 <= r < rows and 0 <= c < cols):
+                        self.assertEqual(cell, BORDER)
+                        continue
+                    self.assertEqual(bool(cell & MINE), bool(mine_map[r * cols + c]))
+                    if cell & MINE:
+                        continue
+                    expected = sum(
+                        mine_map[nr * cols + nc]
+                        for nr in range(max(r - 1, 0), min(r + 2, rows))
+                        for nc in range(max(c - 1, 0), min(c + 2, cols))
+                    )
+                    self.assertEqual(cell, expected)
+
+    def test_flags_before_first_click_survive_mine_placement(self):
+        board = Board(9, 9, 10, seed=4)
+        board.toggle_flag(8, 8)
+        board.toggle_flag(0, 8)
+        board.click(0, 0)
+        self.assertTrue(board.is_flagged(8, 8))
+        self.assertTrue(board.is_flagged(0, 8))
+        self.assertEqual(board.mines_remaining, 8)
+        self.assertEqual(len(board.mine_positions()), 10)
+
+    def test_neighbours_stay_on_board(self):
+        board = Board(3, 4, 0)
+        self.assertEqual(sorted(board.neighbours(0, 0)), [(0, 1), (1, 0), (1, 1)])
+        self.assertEqual(len(board.neighbours(1, 1)), 8)
+        self.assertEqual(sorted(board.neighbours(2, 3)), [(1, 2), (1, 3), (2, 2)])
+
+    def test_out_of_range_clicks_change_nothing(self):
+        board = Board(9, 9, 10, seed=1)
+        for row, col in ((-1, 0), (0, -1), (9, 0), (0, 9), (20, 20)):
+            self.assertFalse(board.toggle_flag(row, col))
+            self.assertEqual(board.click(row, col), [])
+        self.assertEqual(board.mines_remaining, 10)
+        self.assertTrue(board.first_click)
+        self.assertEqual(board.mine_positions(), [])
+
+    def test_invalid_board(self):
+        with self.assertRaises(ValueError):
+            Board(0, 5, 1)
+        with self.assertRaises(ValueError):
+            Board(3, 3, 9)
+        board = Board(3, 3, 1)
+        with self.assertRaises(ValueError):
+            board.place_mines(1, 1)  # безопасная зона занимает все поле
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import subprocess
+import sys
+import unittest
+from minesweeper_engine import Board, FLAGGED, MINE
+from minesweeper_solver import (LatencyHistogram, Solver, deduce, enumerate_probabilities,
+                                play_games, run_batch)
+
+
+class TestSolver(unittest.TestCase):
+    def test_import_does_not_load_pygame(self):
+        code = "import sys, minesweeper_solver; print('pygame' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(out.stdout.strip(), "False")
+
+    def test_single_cell_deductions(self):
+        safe, mines = deduce([(frozenset({1, 2}), 0), (frozenset({3, 4}), 2)])
+        self.assertEqual(safe, {1, 2})
+        self.assertEqual(mines, {3, 4})
+
+    def test_subset_deductions(self):
+        # {1, 2} содержит одну мину, {1, 2, 3} - одну: клетка 3 безопасна
+        safe, mines = deduce([(frozenset({1, 2}), 1), (frozenset({1, 2, 3}), 1)])
+        self.assertEqual((safe, mines), ({3}, set()))
+        # {1, 2} - одна мина, {1, 2, 3, 4} - три: 3 и 4 - мины
+        safe, mines = deduce([(frozenset({1, 2}), 1), (frozenset({1, 2, 3, 4}), 3)])
+        self.assertEqual((safe, mines), (set(), {3, 4}))
+
+    def test_enumerated_probabilities(self):
+        # Классическая 1-2-1 вдоль стены: мины по краям, середина безопасна
+        constraints = [(frozenset({1, 2}), 1), (frozenset({1, 2, 3}), 2), (frozenset({2, 3}), 1)]
+        self.assertEqual(enumerate_probabilities([1, 2, 3], constraints), {1: 1.0, 2: 0.0, 3: 1.0})
+        probabilities = enumerate_probabilities([1, 2], [(frozenset({1, 2}), 1)])
+        self.assertEqual(probabilities, {1: 0.5, 2: 0.5})
+
+    def test_deductions_are_never_wrong(self):
+        for seed in range(100):
+            board = Board.from_difficulty("medium", seed=seed)
+            solver = Solver(board, random.Random(seed))
+            while not board.game_over and not board.game_won:
+                guesses = solver.guesses
+                solver.step()
+                # Проигрыш возможен только на догадке, флажки стоят только на минах
+                self.assertFalse(board.game_over and solver.guesses == guesses)
+                self.assertFalse(any(cell & FLAGGED and not cell & MINE for cell in board.cells))
+
+    def test_solver_wins_most_easy_games(self):
+        result = play_games("easy", range(200))
+        self.assertEqual(result.games, 200)
+        self.assertGreater(result.wins, 160)
+        self.assertEqual(result.latency.total, result.moves)
+
+    def test_batch_is_deterministic_across_workers(self):
+        serial = run_batch("easy", 40, seed=7, workers=1, chunk_size=15)
+        pooled = run_batch("easy", 40, seed=7, workers=2, chunk_size=15)
+        self.assertEqual(serial.games, 40)
+        self.assertEqual((serial.wins, serial.moves, serial.guesses),
+                         (pooled.wins, pooled.moves, pooled.guesses))
+
+    def test_latency_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for microseconds in range(1, 101):
+            histogram.add(microseconds / 1e6)
+        other = LatencyHistogram()
+        other.add(1.0)
+        histogram.merge(other)
+        self.assertEqual(histogram.total, 101)
+        self.assertAlmostEqual(histogram.percentile(50), 50, delta=50 * 0.07)
+        self.assertAlmostEqual(histogram.percentile(99), 100, delta=100 * 0.07)
+        self.assertGreater(histogram.percentile(100), 1e6)
+        self.assertEqual(LatencyHistogram().percentile(50), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
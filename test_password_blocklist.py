@@ -0,0 +1,75 @@
+import os
+import random
+import tempfile
+import unittest
+from password_blocklist import Blocklist, build_blocklist, password_key
+from password_checker import is_strong_password, is_strong_password_batch, iter_strong_passwords
+
+
+class TestBlocklist(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def build(self, lines, name="breached"):
+        source = os.path.join(self.directory, name + ".txt")
+        index = os.path.join(self.directory, name + ".blk")
+        with open(source, "w", encoding="utf-8", newline="") as file:
+            file.write("".join(lines))
+        count = build_blocklist(source, index)
+        blocklist = Blocklist(index)
+        self.addCleanup(blocklist.close)
+        return count, blocklist
+
+    def test_contains_every_listed_password(self):
+        rng = random.Random(0)
+        passwords = [f"pass{rng.randrange(10 ** 9)}!" for _ in range(20000)]
+        count, blocklist = self.build(p + "\n" for p in passwords)
+        self.assertEqual(count, len(set(passwords)))
+        self.assertEqual(len(blocklist), count)
+        self.assertTrue(all(p in blocklist for p in passwords))
+        self.assertFalse(any(f"other{i}" in blocklist for i in range(20000)))
+
+    def test_bloom_filter_rejects_most_missing_keys(self):
+        _, blocklist = self.build(f"word{i}\n" for i in range(20000))
+        false_positives = sum(blocklist.might_contain_key(password_key(f"miss{i}")) for i in range(20000))
+        self.assertLess(false_positives / 20000, 0.04)
+
+    def test_lines_are_stripped_and_deduplicated(self):
+        count, blocklist = self.build(["Admin123@\r\n", "  qwerty \n", "\n", "qwerty\n", "Пароль1!"])
+        self.assertEqual(count, 3)
+        for password in ("Admin123@", "qwerty", "Пароль1!"):
+            self.assertIn(password, blocklist)
+        self.assertNotIn("", blocklist)
+        self.assertNotIn("Admin123@\r", blocklist)
+
+    def test_empty_list(self):
+        count, blocklist = self.build([])
+        self.assertEqual(count, 0)
+        self.assertNotIn("Admin123@", blocklist)
+
+    def test_rejects_foreign_file(self):
+        path = os.path.join(self.directory, "junk.blk")
+        with open(path, "wb") as file:
+            file.write(b"not a blocklist" * 10)
+        with self.assertRaises(ValueError):
+            Blocklist(path)
+
+    def test_checker_rejects_breached_passwords(self):
+        _, blocklist = self.build(["Admin123@\n", "weak\n"])
+        self.assertTrue(is_strong_password("Admin123@"))
+        self.assertFalse(is_strong_password("Admin123@", blocklist=blocklist))
+        self.assertTrue(is_strong_password("Secure123!", blocklist=blocklist))
+        self.assertEqual(is_strong_password_batch(iter(["Admin123@", "Secure123!", "weak"]), blocklist),
+                         [False, True, False])
+
+        passwords = os.path.join(self.directory, "passwords.txt")
+        with open(passwords, "w") as file:
+            file.write("Admin123@\nSecure123!\nweak\n")
+        index = os.path.join(self.directory, "breached.blk")
+        self.assertEqual(list(iter_strong_passwords(passwords, blocklist_path=index)), ["Secure123!"])
+
+
+if __name__ == '__main__':
+    unittest.main()
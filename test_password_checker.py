@@ -1,5 +1,19 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
 import unittest
-from password_checker import is_strong_password
+from password_checker import (
+    chunk_bounds, find_strong_passwords_in_file, is_strong_password, is_strong_password_batch,
+    is_strong_password_regex, iter_strong_passwords, save_strong_passwords
+)
+
+
+def legacy_strong_passwords(filename):
+    """Прежний разбор файла: readlines в текстовом режиме и strip"""
+    with open(filename, 'r', encoding='utf-8', errors='surrogateescape') as file:
+        return [p.strip() for p in file.readlines() if is_strong_password_regex(p.strip())]
 
 class TestPasswordChecker(unittest.TestCase):
     def test_strong_password(self):
@@ -21,6 +35,83 @@ class TestPasswordChecker(unittest.TestCase):
     def test_too_short(self):
         self.assertFalse(is_strong_password("Sec1!"))
 
+    def test_matches_regex_on_edge_cases(self):
+        cases = [
+            "", "Secure1!", "Secure1", "Secure123!\n", "Secure123!\n\n", "Secu\nre123!", "Secure1!\r",
+            "Secure١٢!x", "SECURE١!x", "Sécure12!", "Secure12!\x85", "Ab1!Ab1!", "\nSecure123!",
+            "Secure 1 !", "Ab1!\n", "Abcdefg1!\n",
+        ]
+        for password in cases:
+            self.assertEqual(is_strong_password(password), is_strong_password_regex(password), repr(password))
+
+    def test_matches_regex_on_random_passwords(self):
+        rng = random.Random(0)
+        alphabet = "aZ5!@(_-. \n\t1Bz" + "é٣Ж"
+        passwords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14))) for _ in range(20000)]
+        expected = [is_strong_password_regex(p) for p in passwords]
+        self.assertEqual([is_strong_password(p) for p in passwords], expected)
+        self.assertEqual(is_strong_password_batch(iter(passwords)), expected)
+        self.assertTrue(any(expected))
+
+    def test_batch(self):
+        self.assertEqual(is_strong_password_batch(["Secure123!", "weak", "Admin123@"]), [True, False, True])
+        self.assertEqual(is_strong_password_batch([]), [])
+
+class TestStreamingScan(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+        rng = random.Random(0)
+        words = ["Secure123!", "weak", "  Admin123@  ", "Пароль12!Ab", "qwerty", "Ab1!Ab1!"]
+        endings = ["\n", "\r\n", "\r", "\n\n"]
+        content = "".join(rng.choice(words) + rng.choice(endings) for _ in range(3000)) + "Tail123!x"
+        self.filename = self.path("passwords.txt")
+        with open(self.filename, 'wb') as file:
+            file.write(content.encode('utf-8') + b"\nBad\xff123!Ab\n")
+
+    def path(self, name):
+        return os.path.join(self.directory, name)
+
+    def test_chunks_end_on_line_boundaries(self):
+        with open(self.filename, 'rb') as file:
+            data = file.read()
+        bounds = chunk_bounds(self.filename, 1000)
+        self.assertEqual(bounds[0][0], 0)
+        self.assertEqual(bounds[-1][1], len(data))
+        for (_, end), (start, _) in zip(bounds, bounds[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[end - 1:end], b"\n")
+
+    def test_streaming_matches_readlines(self):
+        expected = legacy_strong_passwords(self.filename)
+        self.assertIn("Tail123!x", expected)
+        for workers in (1, 2):
+            found = list(iter_strong_passwords(self.filename, workers=workers, chunk_size=4096))
+            self.assertEqual(found, expected)
+
+    def test_save_writes_output_and_summary(self):
+        output = self.path("strong.txt")
+        summary = save_strong_passwords(self.filename, output, workers=2, chunk_size=4096)
+        expected = legacy_strong_passwords(self.filename)
+        self.assertEqual(legacy_strong_passwords(output), expected)
+        self.assertEqual(summary.strong, len(expected))
+        self.assertEqual(summary.bytes, os.path.getsize(self.filename))
+        with open(self.filename, 'r', encoding='utf-8', errors='surrogateescape') as file:
+            self.assertEqual(summary.lines, len(file.readlines()))
+        self.assertIn("надежных", str(summary))
+
+    def test_find_prints_results(self):
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            find_strong_passwords_in_file(self.filename)
+            find_strong_passwords_in_file(self.path("missing.txt"))
+        lines = out.getvalue().splitlines()
+        self.assertEqual(lines[0], "Надежные пароли в файле:")
+        self.assertEqual(lines[1:-1], legacy_strong_passwords(self.filename))
+        self.assertEqual(lines[-1], "Файл не найден.")
+
+
 if __name__ == '__main__':
     # Запускаем тесты
     unittest.main(exit=False)
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+from bench_password_service import generate_load
+from password_blocklist import build_blocklist
+from password_checker import is_strong_password
+from password_service import PasswordService, percentile
+
+
+class GatedExecutor(ThreadPoolExecutor):
+    """Пул, задачи которого ждут открытия gate"""
+
+    def __init__(self):
+        super().__init__(1)
+        self.gate = threading.Event()
+
+    def submit(self, fn, *args):
+        return super().submit(lambda: self.gate.wait() and fn(*args))
+
+    def shutdown(self, *args, **kwargs):
+        self.gate.set()
+        super().shutdown(*args, **kwargs)
+
+
+class TestPasswordService(unittest.IsolatedAsyncioTestCase):
+    async def start(self, **options):
+        options.setdefault("executor", ThreadPoolExecutor(1))
+        service = PasswordService(**options)
+        port = await service.start("127.0.0.1", 0)
+        self.addAsyncCleanup(service.close)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        self.addAsyncCleanup(writer.wait_closed)
+        self.addCleanup(writer.close)
+        return service, port, reader, writer
+
+    async def ask(self, reader, writer, *lines):
+        writer.write(b"".join(line + b"\n" for line in lines))
+        return [(await reader.readline()).rstrip(b"\n") for _ in lines]
+
+    async def test_pipelined_answers_keep_order(self):
+        service, _, reader, writer = await self.start(max_batch=64, max_delay=0.05)
+        passwords = ["Secure123!", "weak", "Пароль1!", "Secure 123!", "", "Admin123@"] * 50
+        answers = await self.ask(reader, writer, *(b"CHECK " + p.encode() for p in passwords))
+        self.assertEqual(answers, [b"1" if is_strong_password(p) else b"0" for p in passwords])
+        # Конвейерные запросы проверяются пакетами, а не по одному
+        self.assertEqual(service.stats.requests, len(passwords))
+        self.assertLess(service.stats.batches, len(passwords) // 10)
+        self.assertLessEqual(service.stats.max_batch, 64)
+
+    async def test_unread_responses_stop_reading(self):
+        executor = GatedExecutor()
+        with mock.patch("password_service.MAX_PENDING", 16):
+            service, _, reader, writer = await self.start(max_batch=1, executor=executor)
+            writer.write(b"CHECK Secure123!\n" * 200)
+            await writer.drain()
+            await asyncio.sleep(0.2)
+            # Очередь ответов полна: сервер не читает новые запросы, пока пул стоит
+            self.assertLessEqual(service.stats.batches, 16 + 2)
+            executor.gate.set()
+            answers = [await reader.readline() for _ in range(200)]
+        self.assertEqual(answers, [b"1\n"] * 200)
+        self.assertEqual(service.stats.batches, 200)
+
+    async def test_stats_and_errors(self):
+        _, _, reader, writer = await self.start()
+        answers = await self.ask(reader, writer, b"CHECK Secure123!", b"CHECK weak", b"HELLO")
+        self.assertEqual(answers, [b"1", b"0", b"ERR unknown command"])
+        stats = json.loads((await self.ask(reader, writer, b"STATS"))[0])
+        self.assertEqual((stats["requests"], stats["strong"], stats["connections"]), (2, 1, 1))
+        self.assertGreater(stats["p99_ms"], 0)
+
+        writer.write(b"CHECK " + b"x" * (1 << 17) + b"\n")
+        self.assertEqual(await reader.readline(), b"ERR line too long\n")
+        self.assertEqual(await reader.readline(), b"")
+
+    async def test_process_pool_with_blocklist(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "breached.txt")
+            index = os.path.join(directory, "breached.blk")
+            with open(source, "w") as file:
+                file.write("Admin123@\n")
+            build_blocklist(source, index)
+            _, _, reader, writer = await self.start(workers=1, blocklist_path=index, executor=None)
+            answers = await self.ask(reader, writer, b"CHECK Admin123@", b"CHECK Secure123!")
+            self.assertEqual(answers, [b"0", b"1"])
+
+    async def test_load_generator(self):
+        service, port, _, _ = await self.start()
+        passwords = ["Secure123!", "weak", "Admin123@"] * 200
+        result = await generate_load("127.0.0.1", port, passwords, connections=4, pipeline=8)
+        self.assertEqual((result.requests, result.strong), (600, 400))
+        self.assertEqual(len(result.latencies), 600)
+        self.assertLessEqual(percentile(result.latencies, 50), percentile(result.latencies, 99))
+        self.assertEqual(service.stats.requests, 600)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import math
+import random
+import string
+import time
+import unittest
+import password_strength
+from bench_password_checker import make_passwords
+from password_checker import is_strong_password, password_strength as checker_strength
+from password_strength import COMMON_WORDS, load_dictionary, password_strength as strength
+
+
+def kinds(password):
+    return [(pattern.kind, pattern.token) for pattern in strength(password).patterns]
+
+
+class TestPasswordStrength(unittest.TestCase):
+    def tearDown(self):
+        load_dictionary(COMMON_WORDS)
+
+    def test_reexported_next_to_checker(self):
+        self.assertIs(checker_strength, strength)
+
+    def test_patterns_are_detected(self):
+        self.assertEqual(kinds("password"), [("dictionary", "password")])
+        self.assertEqual(kinds("P@ssw0rd"), [("dictionary", "P@ssw0rd")])
+        self.assertEqual(kinds("qwertyuiop"), [("keyboard", "qwertyuiop")])
+        self.assertEqual(kinds("1qaz2wsx"), [("keyboard", "1qaz"), ("keyboard", "2wsx")])
+        self.assertEqual(kinds("!@#$%^"), [("keyboard", "!@#$%^")])
+        self.assertEqual(kinds("йцукен"), [("keyboard", "йцукен")])
+        self.assertEqual(kinds("abcdef"), [("sequence", "abcdef")])
+        self.assertEqual(kinds("9876543"), [("sequence", "9876543")])
+        self.assertEqual(kinds("aaaaaaa"), [("repeat", "aaaaaaa")])
+        self.assertEqual(kinds("abcabcabc"), [("repeat", "abcabcabc")])
+        self.assertEqual(kinds("Secure123!")[0], ("dictionary", "Secure"))
+        self.assertEqual(kinds("Пароль1!")[0], ("dictionary", "Пароль"))
+        # lower() удлиняет "İ": смещения шаблонов не должны съезжать
+        self.assertEqual(kinds("İpassword"), [("bruteforce", "İ"), ("dictionary", "password")])
+        self.assertEqual(kinds("İqwertyuiop"), [("bruteforce", "İ"), ("keyboard", "qwertyuiop")])
+
+    def test_patterns_cover_password(self):
+        rng = random.Random(0)
+        alphabet = string.ascii_letters + string.digits + "!@#$%^&*()" + "йцукен"
+        samples = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16))) for _ in range(2000)]
+        samples += ["xxSecure123!yy", "passwordpassword", "qwerty123", "aaabbbccc", "İİpassİword", "ßİqwerty"]
+        for password in samples:
+            result = strength(password)
+            self.assertEqual("".join(p.token for p in result.patterns), password)
+            self.assertAlmostEqual(sum(p.entropy for p in result.patterns), result.entropy, places=6)
+            # Шаблоны не дороже перебора тех же символов
+            if password:
+                cardinality = password_strength._cardinality(password)
+                self.assertLessEqual(result.entropy, len(password) * math.log2(cardinality) + 1e-9)
+
+    def test_scores_separate_patterns_from_random(self):
+        for password in ("password", "qwerty", "P@ssw0rd", "123456", "aaaaaaaa"):
+            self.assertEqual(strength(password).score, 0, password)
+        self.assertTrue(is_strong_password("Secure123!"))
+        self.assertLessEqual(strength("Secure123!").score, 1)
+        random_password = "x7#Kp9!mQ2$vL5&nR8@w"
+        self.assertEqual(strength(random_password).score, 4)
+        self.assertGreater(strength(random_password).entropy, 3 * strength("Secure123!").entropy)
+        self.assertEqual(strength(""), (0.0, 0, ()))
+
+    def test_dictionary_is_built_once_and_replaceable(self):
+        trie = password_strength.dictionary_trie()
+        strength("dragon1!")
+        self.assertIs(password_strength.dictionary_trie(), trie)
+        self.assertIs(password_strength.keyboard_graph(), password_strength.keyboard_graph())
+
+        load_dictionary(["correct", "horse", "battery", "staple"])
+        self.assertEqual([kind for kind, _ in kinds("correcthorsebatterystaple")], ["dictionary"] * 4)
+        self.assertEqual(kinds("dragon"), [("bruteforce", "dragon")])
+
+    def test_scoring_time_bound(self):
+        # Граница из документации модуля с большим запасом: на смеси паролей
+        # из bench - в среднем меньше 100 мкс, пароль из 256 символов - меньше 1 мс
+        strength("warm up")
+        score = strength.__wrapped__
+        passwords = make_passwords(2000)
+        start = time.perf_counter()
+        for password in passwords:
+            score(password)
+        self.assertLess((time.perf_counter() - start) / len(passwords), 100e-6)
+
+        rng = random.Random(1)
+        alphabet = string.ascii_letters + string.digits + "!@#$%^&*()"
+        long_passwords = ["".join(rng.choice(alphabet) for _ in range(256)) for _ in range(20)]
+        start = time.perf_counter()
+        for password in long_passwords:
+            score(password)
+        self.assertLess((time.perf_counter() - start) / len(long_passwords), 1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()